@@ -0,0 +1,523 @@
+import argparse
+import asyncio
+import cmath
+from fractions import Fraction
+import heapq
+import io
+import json
+import os
+import pickle
+import platform
+import random
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, Sequence, Type
+
+from lazy_polynomial import LazyPolynomial
+from mod_int import ModInt
+from polynomial import CompactPolynomial, Polynomial
+from polynomial_file import PolynomialFile
+from polynomial_server import PolynomialClient, PolynomialServer
+
+
+def measure_memory(cls: Type[Polynomial], number_of_polynomials: int, number_of_terms: int) -> int:
+    """Returns the bytes allocated while keeping number_of_polynomials polynomials of class cls alive."""
+
+    rng = random.Random(0)
+    arrays = [[(rng.uniform(-10, 10), i) for i in range(number_of_terms)] for _ in range(number_of_polynomials)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    polys = [cls(array) for array in arrays]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del polys
+    return after - before
+
+
+def memory_benchmark(number_of_polynomials: int = 1000, number_of_terms: int = 100) -> Dict[str, float]:
+    """Compares the bytes per term used by the list of tuples and the compact array term layouts."""
+
+    total_terms = number_of_polynomials * number_of_terms
+    return {
+        "tuple_list_bytes_per_term": measure_memory(Polynomial, number_of_polynomials, number_of_terms) / total_terms,
+        "compact_bytes_per_term":
+            measure_memory(CompactPolynomial, number_of_polynomials, number_of_terms) / total_terms,
+    }
+
+
+def time_per_call(function: Callable[[], Any], number: int) -> float:
+    """Returns the best per call time in microseconds over five runs of number calls."""
+
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def constructor_overhead_benchmark(number_of_terms: int = 5, number: int = 20000) -> Dict[str, float]:
+    """
+    Measures the per operation overhead of building results through the validating constructor instead of
+    Polynomial.from_sorted_terms, on small polynomials.
+    """
+
+    rng = random.Random(0)
+    poly_1 = Polynomial([(rng.randint(1, 10), i) for i in range(number_of_terms)])
+    poly_2 = Polynomial([(rng.randint(1, 10), i) for i in range(1, 2 * number_of_terms, 2)])
+    terms = poly_1.get_poly()
+    return {
+        "validating_constructor_us": time_per_call(lambda: Polynomial(terms), number),
+        "from_sorted_terms_us": time_per_call(lambda: Polynomial.from_sorted_terms(terms), number),
+        "add_us": time_per_call(lambda: poly_1 + poly_2, number),
+        "add_through_constructor_us":
+            time_per_call(lambda: Polynomial(poly_1._addition_helper(poly_2.get_poly())), number),
+        "mul_us": time_per_call(lambda: poly_1 * poly_2, number),
+        "mul_through_constructor_us":
+            time_per_call(lambda: Polynomial(poly_1._multiplication_helper(poly_2.get_poly())), number),
+    }
+
+
+def multipoint_benchmark(sizes: Sequence[int] = (128, 1024, 8192), max_direct_size: int = 8192) -> Dict[str, float]:
+    """
+    Times evaluating a polynomial with n terms at n points, and interpolating it back, with the subproduct
+    tree and with the direct O(n^2) methods, for each power of two n in sizes, the direct methods only up to
+    max_direct_size. The points are the complex n-th roots of unity in bit reversed order, for which the float
+    subproduct tree stays well conditioned. These are passed use_tree explicitly, as the default dispatch
+    evaluates built-in numbers directly. Larger sizes, such as 131072, are opt-in through sizes or
+    --multipoint-sizes, as their tree takes many minutes in pure Python.
+    """
+
+    rng = random.Random(0)
+    results = {}
+    for size in sizes:
+        bits = size.bit_length() - 1
+        poly = Polynomial([(rng.uniform(-1, 1), i) for i in range(size)])
+        points = [cmath.exp(2j * cmath.pi * int(format(k, "0{}b".format(bits))[::-1], 2) / size)
+                  for k in range(size)]
+        methods = (("tree", True), ("direct", False)) if size <= max_direct_size else (("tree", True),)
+        values = []
+        for name, use_tree in methods:
+            start = timeit.default_timer()
+            values = poly.evaluate_many(points, use_tree=use_tree)
+            results["evaluate_many_{}_{}_s".format(name, size)] = timeit.default_timer() - start
+        for name, use_tree in methods:
+            start = timeit.default_timer()
+            Polynomial.interpolate(points, values, use_tree=use_tree)
+            results["interpolate_{}_{}_s".format(name, size)] = timeit.default_timer() - start
+    return results
+
+
+def parse_benchmark(number_of_polynomials: int = 2000, number_of_terms: int = 50) -> Dict[str, float]:
+    """
+    Measures the throughput in MB/s of parsing str() output with Polynomial.parse, one polynomial at a time and
+    streamed line by line through Polynomial.parse_many.
+    """
+
+    rng = random.Random(0)
+    lines = [str(Polynomial([(rng.randint(-99, 99) or 1, rng.randint(-50, 50) / rng.choice((1, 2, 5)))
+                             for _ in range(number_of_terms)])) for _ in range(number_of_polynomials)]
+    text = "\n".join(lines)
+    megabytes = len(text.encode()) / 1e6
+    start = timeit.default_timer()
+    for line in lines:
+        Polynomial.parse(line)
+    parse_time = timeit.default_timer() - start
+    start = timeit.default_timer()
+    for _ in Polynomial.parse_many(io.StringIO(text)):
+        pass
+    parse_many_time = timeit.default_timer() - start
+    return {"parse_mb_per_s": megabytes / parse_time, "parse_many_mb_per_s": megabytes / parse_many_time}
+
+
+def serialization_benchmark(number_of_polynomials: int = 20000, number_of_terms: int = 50) -> Dict[str, float]:
+    """
+    Compares pickling lists of get_poly() tuples with the binary PolynomialFile format: bytes per term, and
+    seconds to write everything and to load every polynomial back.
+    """
+
+    rng = random.Random(0)
+    polys = [Polynomial([(rng.uniform(-10, 10), i) for i in range(number_of_terms)])
+             for _ in range(number_of_polynomials)]
+    total_terms = number_of_polynomials * number_of_terms
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "polys")
+        start = timeit.default_timer()
+        with open(path + ".pickle", "wb") as file:
+            pickle.dump([poly.get_poly() for poly in polys], file)
+        pickle_write = timeit.default_timer() - start
+        start = timeit.default_timer()
+        with open(path + ".pickle", "rb") as file:
+            [Polynomial.from_sorted_terms(terms) for terms in pickle.load(file)]
+        pickle_load = timeit.default_timer() - start
+        start = timeit.default_timer()
+        PolynomialFile.write(path + ".bin", polys)
+        binary_write = timeit.default_timer() - start
+        start = timeit.default_timer()
+        with PolynomialFile(path + ".bin") as loaded:
+            list(loaded)
+        binary_load = timeit.default_timer() - start
+        return {
+            "pickle_bytes_per_term": os.path.getsize(path + ".pickle") / total_terms,
+            "binary_bytes_per_term": os.path.getsize(path + ".bin") / total_terms,
+            "pickle_write_s": pickle_write,
+            "binary_write_s": binary_write,
+            "pickle_load_s": pickle_load,
+            "binary_load_s": binary_load,
+        }
+
+
+def domain_benchmark(number_of_terms: int = 500) -> Dict[str, float]:
+    """
+    Times squaring a dense polynomial with small rational coefficients and integrating then deriving the
+    square, in each coefficient domain, and reports whether the round trip gave back the square exactly (1) or
+    not (0). Also times an int square reconstructed from its images mod several primes.
+    """
+
+    rng = random.Random(0)
+    poly = Polynomial([(rng.randint(-1000, 1000) / 8, i) for i in range(number_of_terms)])
+    integral_poly = Polynomial([(rng.randint(-1000, 1000), i) for i in range(number_of_terms)])
+    results = {}
+    for name, domain, source in (("float", float, poly), ("fraction", Fraction, poly), ("int", int, integral_poly),
+                                 ("mod_p", (1 << 61) - 1, poly)):
+        poly_in_domain = source.to_domain(domain)
+        start = timeit.default_timer()
+        square = poly_in_domain * poly_in_domain
+        results["{}_mul_s".format(name)] = timeit.default_timer() - start
+        start = timeit.default_timer()
+        round_trip = Polynomial.get_derivative(Polynomial.get_integral(square, 0))
+        results["{}_integrate_derive_s".format(name)] = timeit.default_timer() - start
+        results["{}_exact".format(name)] = float(round_trip.get_poly() == square.get_poly())
+    bound = number_of_terms * 1000 ** 2
+    start = timeit.default_timer()
+    Polynomial.from_residues([integral_poly.to_domain(p) * integral_poly.to_domain(p)
+                              for p in ModInt.primes_for_bound(bound)])
+    results["int_multimodular_mul_s"] = timeit.default_timer() - start
+    return results
+
+
+def best_time(function: Callable[[], Any], repeat: int = 3) -> float:
+    """
+    Returns the best seconds per call over repeat runs, calling function often enough for each run to take at
+    least 0.2 seconds.
+    """
+
+    timer = timeit.Timer(function)
+    number, elapsed = timer.autorange()
+    return min([elapsed] + timer.repeat(repeat=repeat - 1, number=number)) / number
+
+
+def suite_benchmark(sizes: Sequence[int] = (10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6),
+                    densities: Sequence[float] = (1.0, .01), max_multiplication_terms: int = 10 ** 5,
+                    max_sparse_multiplication_work: int = 10 ** 7, repeat: int = 3) -> Dict[str, float]:
+    """
+    Times the core operations on random polynomials with each number of terms in sizes and each density in
+    densities (see Polynomial.create_large_random_polynomial), in seconds per call. Products are skipped beyond
+    max_multiplication_terms terms, and sparse ones once the number of term pairs exceeds
+    max_sparse_multiplication_work.
+    """
+
+    results = {}
+    for density in densities:
+        for size in sizes:
+            poly_1 = Polynomial.create_large_random_polynomial(size, density, seed=1)
+            poly_2 = Polynomial.create_large_random_polynomial(size, density, seed=2)
+            terms_1 = poly_1.get_poly()
+            terms_2 = poly_2.get_poly()
+            shuffled = list(terms_1)
+            random.Random(0).shuffle(shuffled)
+            middle = terms_1[size // 2][1]
+            operations = {
+                "construction": lambda: Polynomial(shuffled),
+                "merge": lambda: Polynomial.merge(terms_1, terms_2),
+                "add": lambda: poly_1 + poly_2,
+                "derive": lambda: Polynomial.get_derivative(poly_1),
+                "integrate": lambda: Polynomial.get_integral(poly_1, 1),
+                # str() caches its result, so time the rendering it performs on first use.
+                "str": lambda: "".join(poly_1.iter_str()),
+                "bin_search": lambda: Polynomial.next_highest_index_bin_search(terms_1, middle),
+            }
+            if size <= max_multiplication_terms and (Polynomial._use_dense_multiplication(terms_1, terms_2)
+                                                     or size * size <= max_sparse_multiplication_work):
+                operations["mul"] = lambda: poly_1 * poly_2
+            for name, function in operations.items():
+                results["{}_{}_terms_density_{}_s".format(name, size, density)] = best_time(function, repeat)
+    return results
+
+
+def run_suite(output_path: str = None, **kwargs) -> Dict[str, Any]:
+    """Runs suite_benchmark with kwargs and returns its report, also writing it to output_path as JSON if given."""
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": suite_benchmark(**kwargs),
+    }
+    if output_path:
+        with open(output_path, "w") as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+    return report
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = .25) \
+        -> Dict[str, float]:
+    """
+    Returns the slowdown ratio of every timing present in both reports that got more than tolerance slower.
+
+    >>> compare_reports({"results": {"add_s": 1.0, "mul_s": 2.0}}, {"results": {"add_s": 1.1, "mul_s": 3.0}})
+    {'mul_s': 1.5}
+    """
+
+    regressions = {}
+    for name, seconds in current["results"].items():
+        before = baseline["results"].get(name)
+        if before and seconds > before * (1 + tolerance):
+            regressions[name] = seconds / before
+    return regressions
+
+
+def sum_benchmark(number_of_polynomials: int = 1000, number_of_terms: int = 100) -> Dict[str, float]:
+    """
+    Times adding number_of_polynomials sparse polynomials with chained +, Polynomial.sum, Polynomial.sum_stream
+    over a generator, and a heapq.merge based k-way merge for reference.
+    """
+
+    polys = [Polynomial.create_large_random_polynomial(number_of_terms, .01, seed=seed)
+             for seed in range(number_of_polynomials)]
+
+    def chained():
+        total = polys[0]
+        for poly in polys[1:]:
+            total = total + poly
+        return total
+
+    def heap_merge():
+        return Polynomial.from_sorted_terms(Polynomial._collect_sorted_terms(
+            heapq.merge(*[poly.get_poly() for poly in polys], key=lambda term: term[1])))
+
+    return {
+        "chained_add_s": best_time(chained),
+        "sum_s": best_time(lambda: Polynomial.sum(polys)),
+        "sum_stream_s": best_time(lambda: Polynomial.sum_stream(poly for poly in polys)),
+        "heapq_merge_s": best_time(heap_merge),
+    }
+
+
+def horner_compose(poly: Polynomial, other: Polynomial) -> Polynomial:
+    """Naive composition by Horner's rule with repeated multiplication, the baseline for compose and shift."""
+
+    vector = Polynomial._to_dense_vector(poly.get_poly(), 0)
+    result = Polynomial.from_sorted_terms([(vector[-1], 0)])
+    for coeff in reversed(vector[:-1]):
+        result = result * other + Polynomial.from_sorted_terms([(coeff, 0)] if coeff else [])
+    return result
+
+
+def composition_benchmark(degree: int = 300, exponent: int = 64) -> Dict[str, float]:
+    """
+    Times p ** exponent, p(q(X)) and p(X + a) for int polynomials of the given degree against the naive
+    repeated multiplication baseline, plus the float Taylor shift.
+    """
+
+    poly = Polynomial.create_large_random_polynomial(degree + 1, seed=0)
+    small = Polynomial.create_large_random_polynomial(degree // 10, seed=1)
+    inner = Polynomial.create_large_random_polynomial(10, seed=2)
+
+    def repeated_power():
+        result = small
+        for _ in range(exponent - 1):
+            result = result * small
+        return result
+
+    floats = poly.to_domain(float)
+    return {
+        "pow_s": best_time(lambda: small ** exponent, 1),
+        "pow_repeated_mul_s": best_time(repeated_power, 1),
+        "compose_s": best_time(lambda: small.compose(inner), 1),
+        "compose_horner_s": best_time(lambda: horner_compose(small, inner), 1),
+        "shift_int_s": best_time(lambda: poly.shift(3), 1),
+        "shift_int_horner_s": best_time(lambda: horner_compose(poly, Polynomial([3, 1])), 1),
+        "shift_float_s": best_time(lambda: floats.shift(.5), 1),
+        "shift_float_horner_s": best_time(lambda: horner_compose(floats, Polynomial([.5, 1])), 1),
+    }
+
+
+def term_update_benchmark(number_of_terms: int = 10 ** 4, number_of_updates: int = 10 ** 5) -> Dict[str, float]:
+    """
+    Seconds per single term update of a long-lived polynomial through add_term, with one get_poly after the stream,
+    against adding one term Polynomials, plus the seconds per coeff lookup.
+    """
+
+    random.seed(0)
+    updates = [(random.randint(-2 * number_of_terms, 2 * number_of_terms), random.randint(1, 9))
+               for _ in range(number_of_updates)]
+    poly = Polynomial.create_large_random_polynomial(number_of_terms, seed=0)
+
+    def stream():
+        target = Polynomial.from_sorted_terms(list(poly.get_poly()))
+        for power, coeff in updates:
+            target.add_term(power, coeff)
+        return target.get_poly()
+
+    def add_polynomials():
+        target = Polynomial.from_sorted_terms(list(poly.get_poly()))
+        for power, coeff in updates[:number_of_updates // 100]:
+            target.add(Polynomial([(coeff, power)]))
+        return target.get_poly()
+
+    lookups = Polynomial.from_sorted_terms(list(poly.get_poly()))
+    return {
+        "add_term_us": best_time(stream, 1) / number_of_updates * 10 ** 6,
+        "add_polynomial_us": best_time(add_polynomials, 1) / (number_of_updates // 100) * 10 ** 6,
+        "coeff_us": best_time(lambda: [lookups.coeff(power) for power, _ in updates], 1) / number_of_updates * 10 ** 6,
+    }
+
+
+def compile_benchmark(number_of_terms: int = 200, number_of_points: int = 2000) -> Dict[str, float]:
+    """
+    Times compiled evaluation against the interpreted evaluate for dense and sparse float polynomials and a
+    three term one, with and without the derivative, as the ratio interpreted / compiled, plus the time to compile.
+    """
+
+    points = [random.uniform(.5, 1) for _ in range(number_of_points)]
+    sparse = Polynomial.create_large_random_polynomial(number_of_terms // 10, density=.01, seed=1)
+    polys = {
+        "dense": Polynomial.create_large_random_polynomial(number_of_terms, seed=0).to_domain(float),
+        "sparse": sparse.to_domain(float),
+        "small": Polynomial([(2.5, 3), (1.5, 2), (-1.0, 0)]),
+    }
+    results = {}
+    for name, poly in polys.items():
+        derivative = Polynomial.get_derivative(poly)
+        results[name + "_compile_s"] = best_time(lambda: Polynomial.from_sorted_terms(poly.get_poly()).compile(), 1)
+        function, with_derivative = poly.compile(), poly.compile(with_derivative=True)
+        results[name + "_speedup"] = best_time(lambda: [poly.evaluate(x) for x in points]) \
+            / best_time(lambda: [function(x) for x in points])
+        results[name + "_with_derivative_speedup"] = \
+            best_time(lambda: [(poly.evaluate(x), derivative.evaluate(x)) for x in points]) \
+            / best_time(lambda: [with_derivative(x) for x in points])
+    return results
+
+
+def lazy_benchmark(number_of_terms: int = 2000, number_of_polynomials: int = 50) -> Dict[str, float]:
+    """
+    Times eager Polynomial chains against the same LazyPolynomial expressions: a running sum of
+    number_of_polynomials polynomials, the derivative of p1 * p2 + p3 - p4, and evaluating the second derivative
+    of a product at 10 points.
+    """
+
+    polys = [Polynomial.create_large_random_polynomial(number_of_terms, .5, float_coefficients=True, seed=seed)
+             for seed in range(number_of_polynomials)]
+    p1, p2, p3, p4 = polys[:4]
+    points = [i / 10 for i in range(10)]
+
+    def eager_sum():
+        total = polys[0]
+        for poly in polys[1:]:
+            total = total + poly
+        return total
+
+    def lazy_sum():
+        total = LazyPolynomial(polys[0])
+        for poly in polys[1:]:
+            total = total + poly
+        return total.force()
+
+    return {
+        "eager_sum_s": best_time(eager_sum),
+        "lazy_sum_s": best_time(lazy_sum),
+        "eager_derivative_s": best_time(lambda: Polynomial.get_derivative(p1 * p2 + p3 - p4)),
+        "lazy_derivative_s": best_time(lambda: (LazyPolynomial(p1) * p2 + p3 - p4).get_derivative().force()),
+        "eager_evaluate_s": best_time(
+            lambda: Polynomial.get_derivative(Polynomial.get_derivative(p1 * p2)).evaluate(points)),
+        "lazy_evaluate_s": best_time(
+            lambda: (LazyPolynomial(p1) * p2).get_derivative().get_derivative().evaluate(points)),
+    }
+
+
+def server_benchmark(number_of_clients: int = 8, requests_per_client: int = 500,
+                     batch_windows: Sequence[float] = (0, .002)) -> Dict[str, float]:
+    """
+    Throughput in requests per second and p99 latency in milliseconds of a loopback PolynomialServer under a mix
+    of small mul, derive, integrate and evaluate requests, for each batch window.
+    """
+
+    polys = [str(Polynomial.create_large_random_polynomial(10, seed=seed)) for seed in range(20)]
+    requests = [random.choice([("mul", poly, polys[0]), ("derive", poly), ("integrate", poly, 1),
+                               ("evaluate", poly, random.random())]) for poly in polys for _ in range(10)]
+
+    async def client_loop(address):
+        async with PolynomialClient(*address) as client:
+            for start in range(0, requests_per_client, 50):
+                await asyncio.gather(*[client.request(*requests[i % len(requests)])
+                                       for i in range(start, min(start + 50, requests_per_client))])
+
+    async def run(batch_window):
+        async with PolynomialServer(batch_window=batch_window) as server:
+            await asyncio.gather(*[client_loop(server.address) for _ in range(number_of_clients)])
+            return server.metrics()
+
+    results = {}
+    for batch_window in batch_windows:
+        metrics = asyncio.run(run(batch_window))
+        results["window_{}ms_throughput".format(batch_window * 1000)] = metrics["throughput"]
+        results["window_{}ms_p99_ms".format(batch_window * 1000)] = metrics["p99_latency"] * 1000
+        results["window_{}ms_mean_batch_size".format(batch_window * 1000)] = metrics["mean_batch_size"]
+    return results
+
+
+def parallel_benchmark(worker_counts: Sequence[int] = (1, 2, 4), number_of_terms: int = 1500,
+                       number_of_polynomials: int = 20000) -> Dict[str, float]:
+    """
+    Times a sparse product of two number_of_terms term polynomials, and mapping get_derivative over
+    number_of_polynomials polynomials, with each number of worker processes in worker_counts.
+    """
+
+    rng = random.Random(0)
+    poly_1 = Polynomial([(rng.uniform(-1, 1), i / 2) for i in range(number_of_terms)])
+    poly_2 = Polynomial([(rng.uniform(-1, 1), i / 3) for i in range(number_of_terms)])
+    polys = [Polynomial([(rng.randint(1, 10), i) for i in range(10)]) for _ in range(number_of_polynomials)]
+    results = {}
+    for workers in worker_counts:
+        Polynomial.configure_parallelism(workers=workers, min_work=1)
+        try:
+            # Start the pool outside of the timings.
+            Polynomial.parallel_map(Polynomial.get_derivative, polys[:workers])
+            start = timeit.default_timer()
+            poly_1 * poly_2
+            results["mul_{}_workers_s".format(workers)] = timeit.default_timer() - start
+            start = timeit.default_timer()
+            Polynomial.parallel_map(Polynomial.get_derivative, polys)
+            results["derivative_map_{}_workers_s".format(workers)] = timeit.default_timer() - start
+        finally:
+            Polynomial.configure_parallelism()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Polynomial benchmarks.")
+    parser.add_argument("--suite", action="store_true", help="run the core operation suite instead")
+    parser.add_argument("--sizes", type=int, nargs="+", help="suite polynomial sizes in terms")
+    parser.add_argument("--json", help="write the suite report to this path")
+    parser.add_argument("--compare", help="flag regressions against this earlier suite report")
+    parser.add_argument("--tolerance", type=float, default=.25, help="allowed slowdown before flagging")
+    parser.add_argument("--multipoint-sizes", type=int, nargs="+",
+                        help="multipoint benchmark sizes in points, for example 131072 for a 10^5 scale run")
+    arguments = parser.parse_args()
+    if not arguments.suite:
+        for benchmark in (memory_benchmark, constructor_overhead_benchmark, multipoint_benchmark, parse_benchmark,
+                          serialization_benchmark, domain_benchmark, sum_benchmark, composition_benchmark,
+                          term_update_benchmark, compile_benchmark, lazy_benchmark, server_benchmark,
+                          parallel_benchmark):
+            print(benchmark.__name__)
+            options = {"sizes": arguments.multipoint_sizes} \
+                if benchmark is multipoint_benchmark and arguments.multipoint_sizes else {}
+            for name, value in benchmark(**options).items():
+                print("    {}: {:.2f}".format(name, value))
+        sys.exit()
+    report = run_suite(arguments.json, **({"sizes": arguments.sizes} if arguments.sizes else {}))
+    for name, value in report["results"].items():
+        print("    {}: {:.3g}".format(name, value))
+    if arguments.compare:
+        with open(arguments.compare) as file:
+            regressions = compare_reports(json.load(file), report, arguments.tolerance)
+        for name, ratio in sorted(regressions.items()):
+            print("REGRESSION {}: {:.2f}x slower".format(name, ratio))
+        sys.exit(1 if regressions else 0)
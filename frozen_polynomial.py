@@ -0,0 +1,155 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Tuple, Union
+import weakref
+
+from polynomial import Polynomial
+
+
+class OperationCache:
+    """Bounded least recently used cache of operation results that counts its hits and misses."""
+
+    def __init__(self, maxsize: int = 1024):
+        self._entries = OrderedDict()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Returns the cached result for key, else computes, stores and returns it, evicting the oldest entries."""
+
+        try:
+            result = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            result = compute()
+            if self._maxsize > 0:
+                self._entries[key] = result
+                if len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+            return result
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return result
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative")
+        self._maxsize = maxsize
+        while len(self._entries) > maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self._maxsize}
+
+
+class FrozenPolynomial(Polynomial):
+    """
+    Immutable, hashable polynomial. Identical term lists are interned into one shared instance, and the
+    results of +, -, *, get_derivative and get_integral on frozen operands are kept in a bounded LRU cache.
+
+    >>> poly = FrozenPolynomial([(2, 3), (5, -2), (.5, 1), (6, 3)])
+    >>> poly is FrozenPolynomial([(8, 3), (5, -2), (.5, 1)])
+    True
+    >>> str(poly * poly)
+    '64X^6 + 8X^4 + 25X^-4 + 1/4X^2 + 80X + 5X^-1'
+    """
+
+    __slots__ = ("_hash", "__weakref__")
+
+    _interned = weakref.WeakValueDictionary()
+    _cache = OperationCache()
+
+    def __new__(cls, array: List[Union[int, float, Tuple[Union[int, float], Union[int, float]]]]):
+        return cls.from_sorted_terms(Polynomial(array).get_poly())
+
+    def __init__(self, array: List[Union[int, float, Tuple[Union[int, float], Union[int, float]]]]):
+        pass
+
+    @classmethod
+    def from_sorted_terms(cls, terms: List[Tuple[Union[int, float], Union[int, float]]]) -> "FrozenPolynomial":
+        """Returns the interned polynomial for canonical terms, creating it on first use."""
+
+        terms = tuple(terms) if terms else ((0, 0),)
+        # Coefficient types are part of the key so that, for example, 5 and 5.0 keep their own string forms.
+        key = (terms, tuple(type(i) for i, _ in terms))
+        poly = cls._interned.get(key)
+        if poly is None:
+            poly = object.__new__(cls)
+            poly._poly = terms
+            poly._reset_caches()
+            poly._hash = hash(terms)
+            cls._interned[key] = poly
+        return poly
+
+    def set_poly(self, poly):
+        raise TypeError("FrozenPolynomial is immutable")
+
+    def _immutable(self, *args) -> None:
+        raise TypeError("FrozenPolynomial is immutable")
+
+    add = subtract = mul = constant_mul = derive = integrate = set_term = add_term = _immutable
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other: Polynomial):
+        if self is other:
+            return True
+        if isinstance(other, FrozenPolynomial) and self._hash != other._hash:
+            return False
+        return self._poly == tuple(other.get_poly())
+
+    def __reduce__(self):
+        return type(self).from_sorted_terms, (self._poly,)
+
+    def _cached(self, operation: str, other: Polynomial, compute: Callable[[], Polynomial]) -> Polynomial:
+        if not isinstance(other, FrozenPolynomial):
+            return compute()
+        # Interned operands are keyed by identity, so equal polynomials with int and float coefficients do not
+        # share results. Entries keep their operands alive so that their ids cannot be reused.
+        return self._cache.get_or_compute((operation, id(self), id(other)), lambda: (self, other, compute()))[-1]
+
+    def __add__(self, other: Polynomial) -> "FrozenPolynomial":
+        return self._cached("add", other, lambda: Polynomial.__add__(self, other))
+
+    def __sub__(self, other: Polynomial) -> "FrozenPolynomial":
+        return self._cached("sub", other, lambda: Polynomial.__sub__(self, other))
+
+    def __mul__(self, other: Polynomial) -> "FrozenPolynomial":
+        return self._cached("mul", other, lambda: Polynomial.__mul__(self, other))
+
+    @classmethod
+    def get_derivative(cls, poly: Polynomial) -> "FrozenPolynomial":
+        compute = super().get_derivative.__func__
+        if not isinstance(poly, FrozenPolynomial):
+            return compute(cls, poly)
+        return cls._cache.get_or_compute(("derivative", id(poly)), lambda: (poly, compute(cls, poly)))[-1]
+
+    @classmethod
+    def get_integral(cls, poly: Polynomial, constant: Union[int, float]) -> "FrozenPolynomial":
+        compute = super().get_integral.__func__
+        if not isinstance(poly, FrozenPolynomial):
+            return compute(cls, poly, constant)
+        return cls._cache.get_or_compute(("integral", id(poly), constant, type(constant)),
+                                         lambda: (poly, compute(cls, poly, constant)))[-1]
+
+    @classmethod
+    def cache_info(cls) -> Dict[str, int]:
+        """Returns the operation cache's hits, misses, current size and maximum size."""
+
+        return cls._cache.info()
+
+    @classmethod
+    def set_cache_size(cls, maxsize: int) -> None:
+        """Sets how many operation results are kept, evicting the least recently used ones first."""
+
+        cls._cache.resize(maxsize)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._cache.clear()
@@ -0,0 +1,128 @@
+from functools import wraps
+import time
+from typing import Any, Callable, Dict, Type, Union
+
+from polynomial import Polynomial
+
+
+class Instrumentation:
+    """
+    Opt-in per operation counters for a Polynomial class: call counts, cumulative seconds and operand term
+    counts of the constructor, add, __add__, mul, __mul__, derive, integrate and __str__.
+
+    The operations are wrapped only while enabled and the original methods are put back on disable, so there is
+    no overhead at all when switched off. Subclasses overriding an operation are not instrumented through their
+    parent class. With sample_every=k only every k-th call of an operation is timed and measured, while every
+    call is still counted.
+
+    >>> with Instrumentation() as instrumentation:
+    ...     poly = Polynomial([(2, 3), (5, -2)]) * Polynomial([1, 1])
+    >>> stats = instrumentation.stats()
+    >>> stats["__mul__"]["calls"], stats["__mul__"]["terms"], stats["__init__"]["calls"]
+    (1, 4, 2)
+    """
+
+    operations = ("__init__", "add", "__add__", "mul", "__mul__", "derive", "integrate", "__str__")
+    _binary_operations = {"add", "__add__", "mul", "__mul__"}
+    # Classes currently instrumented, so that two instrumentations never wrap each other.
+    _active = {}
+
+    def __init__(self, cls: Type[Polynomial] = Polynomial, sample_every: int = 1):
+        if sample_every < 1:
+            raise ValueError("sample_every must be >= 1")
+        self._cls = cls
+        self._sample_every = sample_every
+        self._originals = {}
+        # Per operation [calls, sampled calls, seconds, operand terms], updated in place by the wrappers.
+        self._counters = {name: [0, 0, 0.0, 0] for name in self.operations}
+
+    @staticmethod
+    def _term_count(value: Any) -> int:
+        try:
+            return len(value)
+        except TypeError:
+            return 0
+
+    def _wrap(self, name: str, function: Callable) -> Callable:
+        counters = self._counters[name]
+        sample_every = self._sample_every
+        binary = name in self._binary_operations
+        constructor = name == "__init__"
+        term_count = self._term_count
+        perf_counter = time.perf_counter
+
+        @wraps(function)
+        def wrapper(poly, *args, **kwargs):
+            counters[0] += 1
+            if counters[0] % sample_every:
+                return function(poly, *args, **kwargs)
+            if constructor:
+                terms = term_count(args[0]) if args else 0
+            else:
+                terms = len(poly) + (term_count(args[0]) if binary and args else 0)
+            start = perf_counter()
+            try:
+                return function(poly, *args, **kwargs)
+            finally:
+                counters[2] += perf_counter() - start
+                counters[1] += 1
+                counters[3] += terms
+
+        return wrapper
+
+    @property
+    def enabled(self) -> bool:
+        return self._active.get(self._cls) is self
+
+    def enable(self) -> None:
+        """Wraps the class's operations. Raises RuntimeError if the class is already instrumented."""
+
+        if self.enabled:
+            return
+        if self._cls in self._active:
+            raise RuntimeError("{} is already instrumented".format(self._cls.__name__))
+        self._active[self._cls] = self
+        for name in self.operations:
+            self._originals[name] = self._cls.__dict__.get(name)
+            setattr(self._cls, name, self._wrap(name, getattr(self._cls, name)))
+
+    def disable(self) -> None:
+        """Puts the original operations back. Collected stats are kept."""
+
+        if not self.enabled:
+            return
+        for name, original in self._originals.items():
+            if original is None:
+                delattr(self._cls, name)
+            else:
+                setattr(self._cls, name, original)
+        self._originals = {}
+        del self._active[self._cls]
+
+    def reset(self) -> None:
+        for counters in self._counters.values():
+            counters[:] = [0, 0, 0.0, 0]
+
+    def stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """
+        Returns, per operation, the number of calls, the number of sampled calls, and the cumulative seconds,
+        mean seconds and operand terms over the sampled calls.
+        """
+
+        return {
+            name: {
+                "calls": calls,
+                "sampled": sampled,
+                "seconds": seconds,
+                "mean_seconds": seconds / sampled if sampled else 0.0,
+                "terms": terms,
+            }
+            for name, (calls, sampled, seconds, terms) in self._counters.items()
+        }
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
@@ -0,0 +1,256 @@
+from typing import Dict, List, Tuple, Union
+
+from polynomial import Polynomial
+
+
+class LazyPolynomial:
+    """
+    Deferred polynomial expression. The operators +, -, * and get_derivative build an expression DAG instead of
+    computing intermediate polynomials, and the DAG is optimized and computed on first use of get_poly, str,
+    evaluate or force:
+
+    - chains of additions and subtractions are fused into one k-way merge of their operands,
+    - derivatives are pushed inside sums, down to the operand polynomials,
+    - identical subexpressions are computed once,
+    - evaluate never expands products, applying the product rule to derivatives of products instead.
+
+    Nodes are immutable, so there is no in place derive(); use get_derivative.
+
+    >>> p1, p2 = Polynomial([1, 2]), Polynomial([(3, 2)])
+    >>> expression = (LazyPolynomial(p1) * p2 + p2 - p1).get_derivative()
+    >>> str(expression)
+    '18X^2 + 12X - 2'
+    >>> expression.evaluate(2)
+    94
+    """
+
+    __slots__ = ("_operation", "_operands", "_value")
+
+    def __init__(self, poly: Polynomial):
+        if not isinstance(poly, Polynomial):
+            raise TypeError("Must use a Polynomial object")
+        self._operation = "leaf"
+        self._operands = (poly,)
+        self._value = None
+
+    @classmethod
+    def _node(cls, operation: str, operands: tuple) -> "LazyPolynomial":
+        node = cls.__new__(cls)
+        node._operation = operation
+        node._operands = operands
+        node._value = None
+        return node
+
+    @classmethod
+    def _wrap(cls, value: Union["LazyPolynomial", Polynomial, int, float]) -> "LazyPolynomial":
+        if isinstance(value, LazyPolynomial):
+            return value
+        if isinstance(value, Polynomial):
+            return cls(value)
+        if type(value) in {int, float}:
+            return cls(Polynomial.from_sorted_terms([(value, 0)]))
+        raise TypeError("Cannot combine a LazyPolynomial with {}".format(type(value).__name__))
+
+    def __add__(self, other):
+        return self._node("sum", ((1, self), (1, self._wrap(other))))
+
+    def __radd__(self, other):
+        return self._node("sum", ((1, self._wrap(other)), (1, self)))
+
+    def __sub__(self, other):
+        return self._node("sum", ((1, self), (-1, self._wrap(other))))
+
+    def __rsub__(self, other):
+        return self._node("sum", ((1, self._wrap(other)), (-1, self)))
+
+    def __neg__(self):
+        return self._node("sum", ((-1, self),))
+
+    def __mul__(self, other):
+        return self._node("mul", (self, self._wrap(other)))
+
+    def __rmul__(self, other):
+        return self._node("mul", (self._wrap(other), self))
+
+    def get_derivative(self) -> "LazyPolynomial":
+        return self._node("derivative", (self,))
+
+    @classmethod
+    def _optimize(cls, node: "LazyPolynomial", memo: Dict[tuple, "LazyPolynomial"],
+                  done: Dict[int, "LazyPolynomial"]) -> "LazyPolynomial":
+        """
+        Returns the canonical equivalent of node: sums flattened with like operands combined, derivatives pushed
+        inside sums and onto operand polynomials, and structurally identical subexpressions shared through memo.
+        """
+
+        if id(node) in done:
+            return done[id(node)]
+        operation = node._operation
+        if operation == "leaf":
+            key = ("leaf", id(node._operands[0]))
+            result = memo.setdefault(key, node)
+        elif operation == "mul":
+            factors = [cls._optimize(factor, memo, done) for factor in node._operands]
+            constant = cls._constant(factors[0])
+            if constant is not None:
+                result = cls._canonical_sum([(constant, factors[1])], memo)
+            elif cls._constant(factors[1]) is not None:
+                result = cls._canonical_sum([(cls._constant(factors[1]), factors[0])], memo)
+            else:
+                factors.sort(key=id)
+                key = ("mul", id(factors[0]), id(factors[1]))
+                result = memo.setdefault(key, cls._node("mul", tuple(factors)))
+        elif operation == "sum":
+            result = cls._canonical_sum(cls._flatten(node, 1, memo, done), memo)
+        else:
+            result = cls._differentiate(cls._optimize(node._operands[0], memo, done), memo)
+        done[id(node)] = result
+        return result
+
+    @staticmethod
+    def _constant(node: "LazyPolynomial") -> Union[int, float, None]:
+        """Returns the value of a constant leaf, which is folded into sum multipliers instead of multiplied."""
+
+        if node._operation == "leaf":
+            terms = node._operands[0].get_poly()
+            if len(terms) == 1 and terms[0][1] == 0:
+                return terms[0][0]
+        return None
+
+    @classmethod
+    def _flatten(cls, node: "LazyPolynomial", multiplier: int, memo: Dict[tuple, "LazyPolynomial"],
+                 done: Dict[int, "LazyPolynomial"]) -> List[Tuple[int, "LazyPolynomial"]]:
+        terms = []
+        for sign, operand in node._operands:
+            operand = cls._optimize(operand, memo, done)
+            if operand._operation == "sum":
+                terms.extend((multiplier * sign * inner_sign, inner) for inner_sign, inner in operand._operands)
+            else:
+                terms.append((multiplier * sign, operand))
+        return terms
+
+    @classmethod
+    def _canonical_sum(cls, terms: List[Tuple[int, "LazyPolynomial"]], memo: Dict[tuple, "LazyPolynomial"]) \
+            -> "LazyPolynomial":
+        multipliers = {}
+        for multiplier, operand in terms:
+            total, _ = multipliers.get(id(operand), (0, operand))
+            multipliers[id(operand)] = (total + multiplier, operand)
+        operands = tuple(sorted(((multiplier, operand) for multiplier, operand in multipliers.values()
+                                 if multiplier != 0), key=lambda term: id(term[1])))
+        if not operands:
+            return cls._optimize(cls(Polynomial.from_sorted_terms([])), memo, {})
+        if len(operands) == 1 and operands[0][0] == 1:
+            return operands[0][1]
+        key = ("sum",) + tuple((multiplier, id(operand)) for multiplier, operand in operands)
+        return memo.setdefault(key, cls._node("sum", operands))
+
+    @classmethod
+    def _differentiate(cls, node: "LazyPolynomial", memo: Dict[tuple, "LazyPolynomial"]) -> "LazyPolynomial":
+        """Returns the canonical derivative of a canonical node, keeping derivatives of products unexpanded."""
+
+        key = ("derivative", id(node))
+        if key in memo:
+            return memo[key]
+        if node._operation == "leaf":
+            result = cls._optimize(cls(Polynomial.get_derivative(node._operands[0])), memo, {})
+        elif node._operation == "sum":
+            result = cls._canonical_sum([(multiplier, cls._differentiate(operand, memo))
+                                         for multiplier, operand in node._operands], memo)
+        else:
+            result = cls._node("derivative", (node,))
+        return memo.setdefault(key, result)
+
+    def _optimized(self) -> "LazyPolynomial":
+        return self._optimize(self, {}, {})
+
+    @staticmethod
+    def _merge_sum(operands: List[Tuple[int, Polynomial]]) -> Polynomial:
+        """Adds multiplier times polynomial for every operand with one k-way merge through Polynomial.sum."""
+
+        return Polynomial.sum(poly if multiplier == 1
+                              else Polynomial.from_sorted_terms([(multiplier * i, j) for i, j in poly.get_poly()])
+                              for multiplier, poly in operands)
+
+    @classmethod
+    def _compute(cls, node: "LazyPolynomial") -> Polynomial:
+        if node._value is None:
+            operation = node._operation
+            if operation == "leaf":
+                node._value = node._operands[0]
+            elif operation == "mul":
+                node._value = cls._compute(node._operands[0]) * cls._compute(node._operands[1])
+            elif operation == "sum":
+                node._value = cls._merge_sum([(multiplier, cls._compute(operand))
+                                              for multiplier, operand in node._operands])
+            else:
+                node._value = Polynomial.get_derivative(cls._compute(node._operands[0]))
+        return node._value
+
+    def force(self) -> Polynomial:
+        """Optimizes and computes the expression, caching the resulting Polynomial."""
+
+        if self._value is None:
+            self._value = self._compute(self._optimized())
+        return self._value
+
+    def get_poly(self):
+        return self.force().get_poly()
+
+    def __str__(self):
+        return str(self.force())
+
+    @classmethod
+    def _product_rule(cls, node: "LazyPolynomial", memo: Dict[tuple, "LazyPolynomial"]) -> "LazyPolynomial":
+        """Rewrites the derivative of a product (a * b)' into a' * b + a * b', recursively for nested derivatives."""
+
+        key = ("product rule", id(node))
+        if key in memo:
+            return memo[key]
+        operand = node._operands[0]
+        if operand._operation == "derivative":
+            operand = cls._product_rule(operand, memo)
+        if operand._operation != "mul":
+            result = cls._differentiate(operand, memo)
+        else:
+            factor_1, factor_2 = operand._operands
+            result = cls._optimize(cls._differentiate(factor_1, memo) * factor_2
+                                   + factor_1 * cls._differentiate(factor_2, memo), memo, {})
+        return memo.setdefault(key, result)
+
+    @classmethod
+    def _evaluate_node(cls, node: "LazyPolynomial", x, memo: Dict[tuple, "LazyPolynomial"], values: Dict[int, object]):
+        if id(node) not in values:
+            operation = node._operation
+            if node._value is not None:
+                value = node._value.evaluate(x)
+            elif operation == "leaf":
+                value = node._operands[0].evaluate(x)
+            elif operation == "mul":
+                value = cls._evaluate_node(node._operands[0], x, memo, values) \
+                    * cls._evaluate_node(node._operands[1], x, memo, values)
+            elif operation == "sum":
+                value = 0
+                for multiplier, operand in node._operands:
+                    value = value + multiplier * cls._evaluate_node(operand, x, memo, values)
+            else:
+                value = cls._evaluate_node(cls._product_rule(node, memo), x, memo, values)
+            values[id(node)] = value
+        return values[id(node)]
+
+    def evaluate(self, x):
+        """
+        Evaluates the expression at a scalar, a list or tuple of points, or a NumPy array of points without
+        expanding any product.
+        """
+
+        if self._value is not None:
+            return self._value.evaluate(x)
+        memo = {}
+        root = self._optimize(self, memo, {})
+        if isinstance(x, (list, tuple)):
+            return [self._evaluate_node(root, point, memo, {}) for point in x]
+        return self._evaluate_node(root, x, memo, {})
+
+    def __call__(self, x):
+        return self.evaluate(x)
@@ -0,0 +1,198 @@
+from fractions import Fraction
+from typing import List, Sequence, Union
+
+
+class ModInt:
+    """
+    Integer modulo a prime, usable as a Polynomial coefficient for exact arithmetic without coefficient growth.
+
+    Values are kept as their least non-negative residue, which is also what comparisons with ints and floats,
+    int() and str() use: ModInt(2, 5) equals 2 but not 7. Ints and Fractions with denominators coprime to the
+    modulus mix in freely.
+
+    >>> a = ModInt(3, 7)
+    >>> a * 5, a / 2, -a, a ** -1
+    (ModInt(1, 7), ModInt(5, 7), ModInt(4, 7), ModInt(5, 7))
+    >>> ModInt(Fraction(1, 2), 7) == 4
+    True
+    """
+
+    __slots__ = ("value", "modulus")
+
+    def __init__(self, value: Union[int, Fraction, "ModInt"], modulus: int):
+        if isinstance(value, ModInt):
+            value = value.value
+        if type(value) is Fraction:
+            value = value.numerator * pow(value.denominator, -1, modulus)
+        self.value = value % modulus
+        self.modulus = modulus
+
+    @classmethod
+    def _make(cls, value: int, modulus: int) -> "ModInt":
+        """Wraps an already reduced residue without normalizing it."""
+
+        number = cls.__new__(cls)
+        number.value = value
+        number.modulus = modulus
+        return number
+
+    def _residue(self, other) -> int:
+        if type(other) is ModInt:
+            if other.modulus != self.modulus:
+                raise ValueError("ModInts must share a modulus.")
+            return other.value
+        if type(other) is int:
+            return other
+        if type(other) is Fraction:
+            return other.numerator * pow(other.denominator, -1, self.modulus)
+        return NotImplemented
+
+    def __add__(self, other):
+        other = self._residue(other)
+        if other is NotImplemented:
+            return other
+        return self._make((self.value + other) % self.modulus, self.modulus)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = self._residue(other)
+        if other is NotImplemented:
+            return other
+        return self._make((self.value - other) % self.modulus, self.modulus)
+
+    def __rsub__(self, other):
+        other = self._residue(other)
+        if other is NotImplemented:
+            return other
+        return self._make((other - self.value) % self.modulus, self.modulus)
+
+    def __mul__(self, other):
+        other = self._residue(other)
+        if other is NotImplemented:
+            return other
+        return self._make(self.value * other % self.modulus, self.modulus)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        other = self._residue(other)
+        if other is NotImplemented:
+            return other
+        if other % self.modulus == 0:
+            raise ZeroDivisionError("ModInt division by zero")
+        return self._make(self.value * pow(other, -1, self.modulus) % self.modulus, self.modulus)
+
+    def __rtruediv__(self, other):
+        other = self._residue(other)
+        if other is NotImplemented:
+            return other
+        if self.value == 0:
+            raise ZeroDivisionError("ModInt division by zero")
+        return self._make(other * pow(self.value, -1, self.modulus) % self.modulus, self.modulus)
+
+    def __pow__(self, exponent: int):
+        return self._make(pow(self.value, exponent, self.modulus), self.modulus)
+
+    def __neg__(self):
+        return self._make(-self.value % self.modulus, self.modulus)
+
+    def __abs__(self):
+        return self
+
+    def __bool__(self):
+        return self.value != 0
+
+    def __int__(self):
+        return self.value
+
+    def __eq__(self, other):
+        if type(other) is ModInt:
+            return self.value == other.value and self.modulus == other.modulus
+        if type(other) in {int, float}:
+            # Only the residue itself is equal, not every number congruent to it, so that hashes agree.
+            return other == self.value
+        return NotImplemented
+
+    def __hash__(self):
+        # Equal ints and floats are exactly the residue, which hashes the same.
+        return hash(self.value)
+
+    def __lt__(self, other):
+        return self.value < other
+
+    def __gt__(self, other):
+        return self.value > other
+
+    def __str__(self):
+        return str(self.value)
+
+    def __repr__(self):
+        return "ModInt({}, {})".format(self.value, self.modulus)
+
+    @staticmethod
+    def crt(residues: Sequence[int], moduli: Sequence[int]) -> int:
+        """
+        Reconstructs the int in the symmetric range around zero that has the given residues modulo pairwise
+        coprime moduli, by the Chinese remainder theorem.
+
+        >>> ModInt.crt([2, 3], [5, 7])
+        17
+        >>> ModInt.crt([3, 4], [5, 7])
+        -17
+        """
+
+        value = 0
+        product = 1
+        for residue, modulus in zip(residues, moduli):
+            # Garner's step: lift value to be correct modulo product * modulus as well.
+            value += product * ((residue - value) * pow(product, -1, modulus) % modulus)
+            product *= modulus
+        return value - product if 2 * value > product else value
+
+    @staticmethod
+    def primes_for_bound(bound: int, start: int = (1 << 61) - 1) -> List[int]:
+        """
+        Returns primes counting down from start whose product exceeds twice bound, enough to reconstruct any int
+        of absolute value at most bound with crt.
+
+        >>> ModInt.primes_for_bound(10 ** 20)
+        [2305843009213693951, 2305843009213693921]
+        """
+
+        primes = []
+        product = 1
+        candidate = start
+        while product <= 2 * bound:
+            if ModInt._is_prime(candidate):
+                primes.append(candidate)
+                product *= candidate
+            candidate -= 1
+        return primes
+
+    @staticmethod
+    def _is_prime(number: int) -> bool:
+        """Deterministic Miller-Rabin for numbers below 3.3 * 10^24."""
+
+        if number < 2:
+            return False
+        small_primes = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+        for prime in small_primes:
+            if number % prime == 0:
+                return number == prime
+        d = number - 1
+        shift = 0
+        while d % 2 == 0:
+            d //= 2
+            shift += 1
+        for base in small_primes:
+            x = pow(base, d, number)
+            if x in (1, number - 1):
+                continue
+            for _ in range(shift - 1):
+                x = x * x % number
+                if x == number - 1:
+                    break
+            else:
+                return False
+        return True
@@ -0,0 +1,241 @@
+from fractions import Fraction
+from typing import Dict, List, Sequence, Tuple, Union
+
+from polynomial import Polynomial
+
+
+class MultiPolynomial:
+    """
+    Creates a multi-variable polynomial (ex 3X^2YZ^3) from a list of tuples.
+
+    Every monomial's exponent vector is packed into one integer key, exponent_bits bits per variable, so that
+    collecting like terms is a single dict lookup and multiplying two monomials is a single integer addition.
+    The top bit of every field is kept free as a guard bit that detects exponent overflow in products.
+    """
+
+    __slots__ = ("_terms", "_variables", "_bits")
+
+    def __init__(self, array: List[Tuple[Union[int, float], Sequence[int]]],
+                 variables: Sequence[str] = ("X", "Y", "Z"), exponent_bits: int = 16):
+        """
+        Args:
+            array: a list of tuples of length two, each representing an algebraic polynomial term. The first tuple
+                element is the term's coefficient, an int or float. The second is a sequence of non-negative int
+                powers, one per variable.
+            variables: the names of the variables, in the order of the powers.
+            exponent_bits: bits reserved per variable in a packed monomial key. Powers must be below
+                2 ** (exponent_bits - 1).
+        Examples:
+            >>> poly = MultiPolynomial([(3, (2, 1, 3)), (-7, (1, 1, 0)), (1, (0, 0, 3)), (2, (1, 1, 0))])
+            >>> str(poly)
+            '3X^2YZ^3 + Z^3 - 5XY'
+        """
+
+        self._variables = tuple(variables)
+        self._bits = exponent_bits
+        self._terms = {}
+        limit = 1 << (exponent_bits - 1)
+        for element in array:
+            if not (type(element) is tuple
+                    and len(element) == 2
+                    and type(element[0]) in {int, float}
+                    and len(element[1]) == len(self._variables)
+                    and all(type(j) is int and 0 <= j < limit for j in element[1])):
+                raise ValueError("Incorrect tuple formatting.")
+            coeff, powers = element
+            if coeff != 0:
+                key = self._pack(powers)
+                self._terms[key] = self._terms.get(key, 0) + coeff
+        self._terms = {key: coeff for key, coeff in self._terms.items() if coeff != 0}
+
+    @classmethod
+    def _from_terms(cls, terms: Dict[int, Union[int, float]], variables: Tuple[str, ...], bits: int) \
+            -> "MultiPolynomial":
+        poly = cls.__new__(cls)
+        poly._terms = terms
+        poly._variables = variables
+        poly._bits = bits
+        return poly
+
+    @classmethod
+    def from_polynomial(cls, poly: Polynomial, variable: str = "X", exponent_bits: int = 16) -> "MultiPolynomial":
+        """
+        Converts a single variable Polynomial with non-negative int powers.
+
+        >>> str(MultiPolynomial.from_polynomial(Polynomial([4, 2, 0, 5])))
+        '5X^3 + 2X + 4'
+        """
+
+        return cls([(i, (j,)) for i, j in poly.get_poly()], (variable,), exponent_bits)
+
+    def to_polynomial(self) -> Polynomial:
+        """
+        Converts a polynomial depending on at most one variable into a Polynomial.
+
+        >>> MultiPolynomial([(2, (0, 3)), (1, (0, 0))], ("X", "Y")).to_polynomial().get_poly()
+        [(1, 0), (2, 3)]
+        """
+
+        used = [index for index in range(len(self._variables))
+                if any(powers[index] for powers in self._unpacked_powers())]
+        if len(used) > 1:
+            raise ValueError("Only polynomials in at most one variable convert to Polynomial.")
+        shift = self._bits * used[0] if used else 0
+        mask = (1 << self._bits) - 1
+        return Polynomial.from_sorted_terms(
+            sorted(((coeff, (key >> shift) & mask) for key, coeff in self._terms.items()), key=lambda x: x[1]))
+
+    def _pack(self, powers: Sequence[int]) -> int:
+        key = 0
+        for index, power in enumerate(powers):
+            key |= power << (self._bits * index)
+        return key
+
+    def _unpack(self, key: int) -> Tuple[int, ...]:
+        mask = (1 << self._bits) - 1
+        return tuple((key >> (self._bits * index)) & mask for index in range(len(self._variables)))
+
+    def _unpacked_powers(self):
+        return (self._unpack(key) for key in self._terms)
+
+    def _guard_mask(self) -> int:
+        return self._pack([1 << (self._bits - 1)] * len(self._variables))
+
+    def get_poly(self) -> List[Tuple[Union[int, float], Tuple[int, ...]]]:
+        """Returns the terms as (coefficient, powers) tuples, sorted by packed monomial key."""
+
+        return [(self._terms[key], self._unpack(key)) for key in sorted(self._terms)]
+
+    def get_variables(self) -> Tuple[str, ...]:
+        return self._variables
+
+    def _check_compatible(self, other: "MultiPolynomial") -> None:
+        if self._variables != other._variables or self._bits != other._bits:
+            raise ValueError("MultiPolynomials must share variables and exponent_bits.")
+
+    def __add__(self, other: "MultiPolynomial") -> "MultiPolynomial":
+        self._check_compatible(other)
+        terms = dict(self._terms)
+        for key, coeff in other._terms.items():
+            total = terms.get(key, 0) + coeff
+            if total != 0:
+                terms[key] = total
+            else:
+                del terms[key]
+        return self._from_terms(terms, self._variables, self._bits)
+
+    def __neg__(self) -> "MultiPolynomial":
+        return self._from_terms({key: -coeff for key, coeff in self._terms.items()}, self._variables, self._bits)
+
+    def __sub__(self, other: "MultiPolynomial") -> "MultiPolynomial":
+        return self + -other
+
+    def __mul__(self, other: "MultiPolynomial") -> "MultiPolynomial":
+        """
+        >>> x_plus_y = MultiPolynomial([(1, (1, 0)), (1, (0, 1))], ("X", "Y"))
+        >>> str(x_plus_y * x_plus_y)
+        'X^2 + 2XY + Y^2'
+        """
+
+        self._check_compatible(other)
+        terms = {}
+        get = terms.get
+        for key_1, coeff_1 in self._terms.items():
+            for key_2, coeff_2 in other._terms.items():
+                key = key_1 + key_2
+                terms[key] = get(key, 0) + coeff_1 * coeff_2
+        guard = self._guard_mask()
+        if any(key & guard for key in terms):
+            raise OverflowError("Product powers exceed exponent_bits.")
+        return self._from_terms({key: coeff for key, coeff in terms.items() if coeff != 0},
+                                self._variables, self._bits)
+
+    def get_partial_derivative(self, variable: str) -> "MultiPolynomial":
+        """
+        Returns the partial derivative with respect to variable.
+
+        >>> poly = MultiPolynomial([(3, (2, 1, 3)), (-7, (1, 1, 0)), (1, (0, 0, 3))])
+        >>> str(poly.get_partial_derivative("Z"))
+        '9X^2YZ^2 + 3Z^2'
+        """
+
+        shift = self._bits * self._variables.index(variable)
+        mask = (1 << self._bits) - 1
+        step = 1 << shift
+        terms = {}
+        for key, coeff in self._terms.items():
+            power = (key >> shift) & mask
+            if power:
+                terms[key - step] = coeff * power
+        return self._from_terms(terms, self._variables, self._bits)
+
+    def derive(self, variable: str) -> None:
+        """Converts the polynomial into its partial derivative with respect to variable."""
+
+        self._terms = self.get_partial_derivative(variable)._terms
+
+    def evaluate(self, point: Union[Dict[str, Union[int, float]], Sequence[Union[int, float]]]):
+        """
+        Evaluates the polynomial at a point given as a dict of variable values or a sequence in variable order.
+
+        >>> MultiPolynomial([(3, (2, 1)), (1, (0, 1))], ("X", "Y")).evaluate({"X": 2, "Y": 5})
+        65
+        """
+
+        if isinstance(point, dict):
+            point = [point[variable] for variable in self._variables]
+        # Powers of each variable are shared between terms, so compute each one once.
+        power_tables = [{} for _ in self._variables]
+        result = 0
+        for key, coeff in self._terms.items():
+            value = coeff
+            for index, power in enumerate(self._unpack(key)):
+                if power:
+                    table = power_tables[index]
+                    if power not in table:
+                        table[power] = point[index] ** power
+                    value *= table[power]
+            result += value
+        return result
+
+    def __call__(self, *point):
+        return self.evaluate(point)
+
+    def __len__(self):
+        return len(self._terms)
+
+    def __eq__(self, other: "MultiPolynomial"):
+        return self._variables == other._variables and self._terms == other._terms
+
+    def __str__(self):
+
+        def to_frac(val):
+            return str(Fraction(val).limit_denominator(100))
+
+        def monomial(powers):
+            output = []
+            for variable, power in zip(self._variables, powers):
+                if power == 1:
+                    output.append(variable)
+                elif power:
+                    output.append(variable + "^" + str(power))
+            return "".join(output)
+
+        if not self._terms:
+            return "0"
+        terms = sorted(((coeff, self._unpack(key)) for key, coeff in self._terms.items()),
+                       key=lambda term: (-sum(term[1]), [-j for j in term[1]]))
+        output = []
+        for coeff, powers in terms:
+            name = monomial(powers)
+            if output:
+                output.append(" - " if coeff < 0 else " + ")
+            elif coeff < 0:
+                output.append("-")
+            if not name:
+                output.append(to_frac(abs(coeff)))
+            elif abs(coeff) != 1:
+                output.append(to_frac(abs(coeff)) + name)
+            else:
+                output.append(name)
+        return "".join(output)
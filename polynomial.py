@@ -1,20 +1,76 @@
+from array import array as Array
+import bisect
+import cmath
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from fractions import Fraction
+from functools import lru_cache
+from itertools import chain, zip_longest
+import math
+from operator import itemgetter
 import random
-from typing import Any, List, Tuple, Union
+import re
+import struct
+import sys
+from typing import Any, Callable, IO, Iterable, Iterator, List, Tuple, Union
 
+from mod_int import ModInt
 
-# TODO allow for multi-variable polynomials (ex 3X^2YZ^3)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Multi-variable polynomials (ex 3X^2YZ^3) live in multi_polynomial.MultiPolynomial.
+
+
+# Binary record of one polynomial: magic, coefficient and power typecodes ("q" or "d"), padding and term count,
+# followed by the little endian coefficient array and then the power array. Records are 8 byte aligned.
+_RECORD_HEADER = struct.Struct("<4scc2xQ")
+_RECORD_MAGIC = b"POLY"
+
+
+# One term of str(Polynomial): sign, then either a coefficient, X and an optional power, or a constant.
+_TERM_PATTERN = re.compile(
+    r"\s*([+-]?)\s*(?:(\d+(?:/\d+)?)?(X)(?:\^(-?\d+(?:/\d+)?))?"
+    r"|(\d+/\d+|\d+(?:\.\d*)?(?:e[+-]?\d+)?|inf|nan))\s*")
 
 
 class Polynomial:
     """Creates a polynomial object from a list of tuples, or from a list."""
 
+    __slots__ = ("_poly", "_str", "_compiled", "_index", "_dirty", "_degree")
+
+    # Minimum number of terms in both factors before multiplication switches to the dense engine.
+    dense_multiplication_threshold = 64
+    # Minimum fraction of powers between a factor's lowest and highest power that must hold a term.
+    dense_multiplication_density = 0.25
+    # Vector length below which Karatsuba multiplication falls back to schoolbook multiplication.
+    karatsuba_cutoff = 32
+    # Minimum divisor and quotient length before division switches from long division to Newton iteration.
+    newton_division_threshold = 64
+    # Minimum number of points and terms before multipoint evaluation uses a subproduct tree.
+    subproduct_tree_threshold = 64
+    # Number of Newton steps polishing the roots found by roots() and roots_many().
+    root_refinement_steps = 3
+    # Minimum fraction of powers between the lowest and highest integer power that must hold a term before
+    # compile() evaluates the integer power terms with one Horner chain instead of a shared power chain.
+    compile_horner_density = 0.5
+    # Maximum number of terms summed per generated line of a compiled evaluator.
+    compile_terms_per_line = 16
+    # Parallel execution settings, changed through configure_parallelism. One worker disables parallelism.
+    parallel_workers = 1
+    parallel_min_work = 1000000
+    parallel_use_processes = True
+    _executor = None
+
     def __init__(self, array: List[Union[int, float, Tuple[Union[int, float], Union[int, float]]]]):
         """
         Args:
             Two different types: First, a list of either type int or float. Second, a list of tuples
                 of length two, each representing an algebraic polynomial term. The first tuple element corresponds
-                to the term's coefficient and is either an int or float. The second tuple element
+                to the term's coefficient and is an int, float or Fraction. The second tuple element
                 corresponds to the term's power and is must also be either an int or float.
         Examples:
             >>> poly = Polynomial([(2, 3), (5, -2), (.5, 1), (6, 3)])
@@ -30,26 +86,61 @@ class Polynomial:
         """
 
         if not array or array == [(0, 0)]:
-            self._poly = [(0, 0)]
+            self.set_poly([(0, 0)])
         elif self._check_if_correctly_formatted_tuple(array):
             if not self._check_if_tuple_contains_coefficients(array):
                 raise ValueError("Incorrect tuple formatting: *******at least one non-zero coefficient needed.")
             processed_array = self._collect_terms(array)
-            self._poly = self.sort_tuple_list(processed_array)
+            self.set_poly(self.sort_tuple_list(processed_array) or [(0, 0)])
         else:
             result = self.array_contains_only_int_float(array)
             if result == -1:
                 raise ValueError("Incorrect list formatting.")
             elif result == 0:
-                self._poly = [(0, 0)]
+                self.set_poly([(0, 0)])
             else:
-                self._poly = self.vector_to_poly(array)
+                self.set_poly(self.vector_to_poly(array))
+
+    @classmethod
+    def from_sorted_terms(cls, terms: List[Tuple[Union[int, float], Union[int, float]]]) -> "Polynomial":
+        """
+        Creates a polynomial from terms that are already sorted by power, with like terms collected, without
+        validating, collecting or sorting them again. An empty list creates the zero polynomial.
+
+        >>> Polynomial.from_sorted_terms([(5, -2), (.5, 1), (8, 3)]).get_poly()
+        [(5, -2), (0.5, 1), (8, 3)]
+        """
+
+        poly = cls.__new__(cls)
+        poly.set_poly(terms if terms else [(0, 0)])
+        return poly
 
     def get_poly(self):
+        if self._dirty:
+            self._flush_terms()
         return self._poly
 
     def set_poly(self, poly):
         self._poly = poly
+        self._reset_caches()
+
+    def _reset_caches(self) -> None:
+        """Drops everything derived from the terms: the string, compiled evaluators, term index and degree."""
+
+        self._str = None
+        self._compiled = None
+        self._index = None
+        self._dirty = False
+        self._degree = None
+
+    def __getstate__(self):
+        # Compiled evaluators are generated functions, which do not pickle, and set_term updates the term index in
+        # place, so copies must not share it. Both are rebuilt on demand, after flushing pending term updates.
+        self.get_poly()
+        slots = {name: getattr(self, name) for cls in type(self).__mro__ for name in getattr(cls, "__slots__", ())
+                 if name != "__weakref__" and hasattr(self, name)}
+        slots.update(_compiled=None, _index=None, _dirty=False)
+        return None, slots
 
     @staticmethod
     def _check_if_correctly_formatted_tuple(array: List[Tuple[Union[int, float], Union[int, float]]]) -> bool:
@@ -63,7 +154,7 @@ class Polynomial:
         for element in array:
             if not (type(element) is tuple
                     and len(element) == 2
-                    and type(element[0]) in {int, float}
+                    and type(element[0]) in {int, float, Fraction, ModInt}
                     and type(element[1]) in {int, float}):
                 return False
         return True
@@ -82,7 +173,7 @@ class Polynomial:
     def _collect_terms(input_array: List[Tuple[Union[int, float], Union[int, float]]]) \
             -> List[Tuple[Union[int, float], Union[int, float]]]:
         """
-        Collects and combines same powered terms of a list of tuples.
+        Collects and combines same powered terms of a list of tuples, dropping terms that cancel out.
 
         Example:
         >>> array = [(1, 1), (2, 1), (3, 2), (8, 2)]
@@ -94,7 +185,7 @@ class Polynomial:
             if i != 0:
                 term_dict[j] = term_dict.get(j, 0) + i
         items = term_dict.items()
-        return [(j, i) for i, j in items]
+        return [(j, i) for i, j in items if j != 0]
 
     @staticmethod
     def sort_tuple_list(array: List[Tuple[Union[int, float], Union[int, float]]]) \
@@ -107,7 +198,7 @@ class Polynomial:
     @staticmethod
     def array_contains_only_int_float(array: List[Any]) -> int:
         """
-        Determines if array only contains integers or floats.
+        Determines if array only contains integers, floats, Fractions or ModInts.
 
         >>> Polynomial.array_contains_only_int_float([2, 3.5, 8, -34.2])
         1
@@ -117,7 +208,7 @@ class Polynomial:
 
         zeroes = 0
         for i in array:
-            if type(i) not in {int, float}:
+            if type(i) not in {int, float, Fraction, ModInt}:
                 return -1
             if i == 0:
                 zeroes += 1
@@ -152,6 +243,28 @@ class Polynomial:
             array.append((random.randint(1, 10), i))
         return cls(array)
 
+    @classmethod
+    def create_large_random_polynomial(cls, number_of_terms: int, density: float = 1.0,
+                                       float_coefficients: bool = False, seed: int = None) -> "Polynomial":
+        """
+        Creates a random polynomial with exactly number_of_terms non-zero terms, whose non-negative int powers
+        are spread over range(round(number_of_terms / density)). A density of 1 gives a dense polynomial, small
+        densities sparse ones. Coefficients are non-zero ints in [-1000, 1000], or floats in [-1, 1).
+
+        >>> poly = Polynomial.create_large_random_polynomial(1000, density=.01, seed=0)
+        >>> len(poly), poly.get_degree() < 100000
+        (1000, True)
+        """
+
+        if number_of_terms < 1 or not 0 < density <= 1:
+            raise ValueError("number_of_terms must be >= 1 and density in (0, 1]")
+        rng = random.Random(seed)
+        width = max(number_of_terms, round(number_of_terms / density))
+        powers = range(width) if width == number_of_terms else sorted(rng.sample(range(width), number_of_terms))
+        if float_coefficients:
+            return cls.from_sorted_terms([(rng.uniform(-1, 1) or .5, j) for j in powers])
+        return cls.from_sorted_terms([(rng.randint(1, 1000) * rng.choice((-1, 1)), j) for j in powers])
+
     @staticmethod
     def merge(array_1: List[Tuple[Union[int, float], Union[int, float]]],
               array_2: List[Tuple[Union[int, float], Union[int, float]]]) \
@@ -188,8 +301,78 @@ class Polynomial:
             index_1 += 1
         return output
 
+    @staticmethod
+    def _collect_sorted_terms(terms: Iterable[Tuple[Union[int, float], Union[int, float]]]) \
+            -> List[Tuple[Union[int, float], Union[int, float]]]:
+        """
+        Combines adjacent same powered terms of a sorted by power term sequence in one pass, dropping zero terms.
+
+        >>> Polynomial._collect_sorted_terms([(1, 0), (2, 1), (-2, 1), (3, 2), (4, 2)])
+        [(1, 0), (7, 2)]
+        """
+
+        output = []
+        last_power = None
+        for coeff, power in terms:
+            if power == last_power:
+                output[-1] = (output[-1][0] + coeff, power)
+            else:
+                if output and output[-1][0] == 0:
+                    output.pop()
+                output.append((coeff, power))
+                last_power = power
+        if output and output[-1][0] == 0:
+            output.pop()
+        return output
+
+    @classmethod
+    def sum(cls, polys: Iterable["Polynomial"]) -> "Polynomial":
+        """
+        Adds any number of polynomials with one k-way merge of their sorted term lists, in O(T log(N)) time for N
+        polynomials with T terms in total, instead of the N - 1 merges and intermediate polynomials of chained +.
+
+        >>> Polynomial.sum([Polynomial([1, 2]), Polynomial([(3, 2)]), Polynomial([(-2, 1)])]).get_poly()
+        [(1, 0), (3, 2)]
+        """
+
+        arrays = []
+        for poly in polys:
+            if not isinstance(poly, Polynomial):
+                raise TypeError("Must use a Polynomial object")
+            arrays.append(poly.get_poly())
+        # Sorting the concatenation merges the already sorted term lists as runs, which in CPython is several
+        # times faster than heapq.merge.
+        return cls.from_sorted_terms(cls._collect_sorted_terms(sorted(chain.from_iterable(arrays), key=itemgetter(1))))
+
+    @classmethod
+    def sum_stream(cls, polys: Iterable["Polynomial"]) -> "Polynomial":
+        """
+        Adds the polynomials of any iterable, such as a generator, one at a time, keeping only one running
+        coefficient per distinct power in memory.
+
+        >>> Polynomial.sum_stream(Polynomial([(1, i)]) for i in range(3) for _ in range(2)).get_poly()
+        [(2, 0), (2, 1), (2, 2)]
+        """
+
+        totals = {}
+        get = totals.get
+        for poly in polys:
+            if not isinstance(poly, Polynomial):
+                raise TypeError("Must use a Polynomial object")
+            for i, j in poly.get_poly():
+                totals[j] = get(j, 0) + i
+        return cls.from_sorted_terms([(i, j) for j, i in sorted(totals.items()) if i != 0])
+
+    @staticmethod
+    def _is_zero_poly(array: List[Tuple[Union[int, float], Union[int, float]]]) -> bool:
+        return len(array) == 1 and array[0][0] == 0
+
     def _addition_helper(self, poly_vector: List[Tuple[Union[int, float], Union[int, float]]]) \
             -> List[Tuple[Union[int, float], Union[int, float]]]:
+        if self._is_zero_poly(poly_vector):
+            return list(self.get_poly())
+        if self._is_zero_poly(self.get_poly()):
+            return list(poly_vector)
         return self.merge(self.get_poly(), poly_vector)
 
     def add(self, other_poly: "Polynomial") -> None:
@@ -207,12 +390,12 @@ class Polynomial:
 
     def __add__(self, other: "Polynomial") -> "Polynomial":
         terms = self._addition_helper(other.get_poly())
-        return Polynomial(terms)
+        return self.from_sorted_terms(terms)
 
     def _subtraction_helper(self, poly_vector: List[Tuple[Union[int, float], Union[int, float]]]) \
             -> List[Tuple[Union[int, float], Union[int, float]]]:
         neg_poly = [(-i, j) for i, j in poly_vector]
-        return self.merge(self.get_poly(), neg_poly)
+        return self._addition_helper(neg_poly)
 
     def subtract(self, other: "Polynomial") -> None:
         """
@@ -229,18 +412,314 @@ class Polynomial:
 
     def __sub__(self, other: "Polynomial") -> "Polynomial":
         terms = self._subtraction_helper(other.get_poly())
-        return Polynomial(terms)
+        return self.from_sorted_terms(terms)
 
     def _multiplication_helper(self, poly_vector: List[Tuple[Union[int, float], Union[int, float]]]) \
             -> List[Tuple[Union[int, float], Union[int, float]]]:
+        terms = self.get_poly()
+        if self.parallel_workers > 1 and len(terms) * len(poly_vector) >= self.parallel_min_work:
+            return self._parallel_multiplication(terms, poly_vector)
+        return self._multiply_terms(terms, poly_vector)
+
+    @staticmethod
+    def _multiply_terms(array_1: List[Tuple[Union[int, float], Union[int, float]]],
+                        array_2: List[Tuple[Union[int, float], Union[int, float]]]) \
+            -> List[Tuple[Union[int, float], Union[int, float]]]:
+        if Polynomial._use_dense_multiplication(array_1, array_2):
+            return Polynomial._dense_multiplication(array_1, array_2)
+        return Polynomial._sparse_multiplication(array_1, array_2)
+
+    @classmethod
+    def configure_parallelism(cls, workers: int = 1, min_work: int = 1000000, use_processes: bool = True) -> None:
+        """
+        Opts into spreading large products and batch operations across a pool of workers.
+
+        Args:
+            workers: number of worker processes or threads, 1 disables parallelism.
+            min_work: minimum number of term products in a multiplication, or of terms in a parallel_map batch,
+                before the work is split between workers.
+            use_processes: use a process pool, which runs pure Python work on several cores, instead of a
+                thread pool, which starts faster but shares one core between its threads.
+        """
+
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if cls._executor is not None:
+            cls._executor.shutdown()
+        Polynomial._executor = None
+        Polynomial.parallel_workers = workers
+        Polynomial.parallel_min_work = min_work
+        Polynomial.parallel_use_processes = use_processes
+
+    @classmethod
+    def _get_executor(cls) -> Executor:
+        if Polynomial._executor is None:
+            pool = ProcessPoolExecutor if cls.parallel_use_processes else ThreadPoolExecutor
+            Polynomial._executor = pool(max_workers=cls.parallel_workers)
+        return Polynomial._executor
+
+    @staticmethod
+    def _split(array: List[Any], parts: int) -> List[List[Any]]:
+        """
+        Splits array into at most parts contiguous slices of nearly equal length.
+
+        >>> Polynomial._split([1, 2, 3, 4, 5], 2)
+        [[1, 2, 3], [4, 5]]
+        """
+
+        size = -(-len(array) // parts)
+        return [array[i:i + size] for i in range(0, len(array), size)]
+
+    @classmethod
+    def _parallel_multiplication(cls, array_1: List[Tuple[Union[int, float], Union[int, float]]],
+                                 array_2: List[Tuple[Union[int, float], Union[int, float]]]) \
+            -> List[Tuple[Union[int, float], Union[int, float]]]:
+        """
+        Multiplies slices of the longer term array by the shorter one on separate workers, then merges the
+        sorted partial products pairwise.
+        """
+
+        if len(array_1) < len(array_2):
+            array_1, array_2 = array_2, array_1
+        array_2 = list(array_2)
+        executor = cls._get_executor()
+        futures = [executor.submit(Polynomial._multiply_terms, chunk, array_2)
+                   for chunk in cls._split(list(array_1), cls.parallel_workers)]
+        partials = [future.result() for future in futures]
+        while len(partials) > 1:
+            partials = [cls.merge(partials[i], partials[i + 1]) if i + 1 < len(partials) else partials[i]
+                        for i in range(0, len(partials), 2)]
+        return partials[0]
+
+    @staticmethod
+    def _apply_to_chunk(function: Callable, polys: List["Polynomial"], args: Tuple) -> List[Any]:
+        return [function(poly, *args) for poly in polys]
+
+    @classmethod
+    def parallel_map(cls, function: Callable, polys: List["Polynomial"], *args) -> List[Any]:
+        """
+        Returns [function(poly, *args) for poly in polys], spreading slices of polys across the configured workers
+        once the batch holds at least parallel_min_work terms. With processes, function must be picklable, such as
+        Polynomial.get_derivative, Polynomial.get_integral or Polynomial.evaluate.
+
+        >>> [str(poly) for poly in Polynomial.parallel_map(Polynomial.get_derivative, [Polynomial([1, 2, 3, 4])])]
+        ['12X^2 + 6X + 2']
+        """
+
+        polys = list(polys)
+        if cls.parallel_workers <= 1 or sum(len(poly) for poly in polys) < cls.parallel_min_work:
+            return cls._apply_to_chunk(function, polys, args)
+        executor = cls._get_executor()
+        futures = [executor.submit(Polynomial._apply_to_chunk, function, chunk, args)
+                   for chunk in cls._split(polys, cls.parallel_workers)]
+        return [result for future in futures for result in future.result()]
+
+    @classmethod
+    def _use_dense_multiplication(cls, array_1: List[Tuple[Union[int, float], Union[int, float]]],
+                                  array_2: List[Tuple[Union[int, float], Union[int, float]]]) -> bool:
+        """
+        Determines if both term arrays are large and dense enough, and have only integer powers, for the dense
+        multiplication engine to outperform the sparse one.
+
+        >>> Polynomial._use_dense_multiplication([(1, i) for i in range(100)], [(2, i) for i in range(100)])
+        True
+        >>> Polynomial._use_dense_multiplication([(1, i) for i in range(100)], [(2, .5), (1, 3)])
+        False
+        """
+
+        if min(len(array_1), len(array_2)) < cls.dense_multiplication_threshold:
+            return False
+        for array in (array_1, array_2):
+            for _, power in array:
+                if type(power) is not int:
+                    return False
+            span = array[-1][1] - array[0][1] + 1
+            if len(array) < span * cls.dense_multiplication_density:
+                return False
+        return True
+
+    @staticmethod
+    def _sparse_multiplication(array_1: List[Tuple[Union[int, float], Union[int, float]]],
+                               array_2: List[Tuple[Union[int, float], Union[int, float]]]) \
+            -> List[Tuple[Union[int, float], Union[int, float]]]:
+        """Multiplies every pair of terms, then collects and sorts the products in O(nm + nmlog(nm)) time."""
+
         output = []
-        for i in range(len(self.get_poly())):
-            for j in range(len(poly_vector)):
-                output.append(
-                    (self.get_poly()[i][0] * poly_vector[j][0],
-                     self.get_poly()[i][1] + poly_vector[j][1])
-                )
-        return self.sort_tuple_list(self._collect_terms(output))
+        for i, j in array_1:
+            for m, n in array_2:
+                output.append((i * m, j + n))
+        return Polynomial.sort_tuple_list(Polynomial._collect_terms(output))
+
+    @classmethod
+    def _dense_multiplication(cls, array_1: List[Tuple[Union[int, float], Union[int, float]]],
+                              array_2: List[Tuple[Union[int, float], Union[int, float]]]) \
+            -> List[Tuple[Union[int, float], Union[int, float]]]:
+        """
+        Multiplies two sorted integer powered term arrays by convolving their dense coefficient vectors.
+        Integer coefficients use Kronecker substitution, all others use Karatsuba multiplication.
+
+        >>> Polynomial._dense_multiplication([(1, -1), (1, 0)], [(-1, 0), (1, 1)])
+        [(-1, -1), (1, 1)]
+        """
+
+        offset_1 = array_1[0][1]
+        offset_2 = array_2[0][1]
+        vector_1 = cls._to_dense_vector(array_1, offset_1)
+        vector_2 = cls._to_dense_vector(array_2, offset_2)
+        product = cls._multiply_vectors(vector_1, vector_2)
+        return cls._from_dense_vector(product, offset_1 + offset_2)
+
+    @classmethod
+    def _multiply_vectors(cls, vector_1: List[Union[int, float]], vector_2: List[Union[int, float]]) \
+            -> List[Union[int, float]]:
+        if all(type(i) is int for i in vector_1) and all(type(i) is int for i in vector_2):
+            return cls._kronecker_multiplication(vector_1, vector_2)
+        modulus = cls._common_modulus(vector_1 + vector_2)
+        if modulus:
+            product = cls._kronecker_multiplication([int(i) for i in vector_1], [int(i) for i in vector_2])
+            return [ModInt._make(i % modulus, modulus) for i in product]
+        if all(type(i) in {int, Fraction} for i in vector_1) and all(type(i) in {int, Fraction} for i in vector_2):
+            # Clear denominators so that exact rational products also go through integer multiplication.
+            scale_1 = cls._common_denominator(vector_1)
+            scale_2 = cls._common_denominator(vector_2)
+            product = cls._kronecker_multiplication([int(i * scale_1) for i in vector_1],
+                                                    [int(i * scale_2) for i in vector_2])
+            return [Fraction(i, scale_1 * scale_2) for i in product]
+        return cls._karatsuba_multiplication(vector_1, vector_2)
+
+    @staticmethod
+    def _common_denominator(values: List[Union[int, Fraction]]) -> int:
+        denominator = 1
+        for i in values:
+            if type(i) is Fraction:
+                denominator = denominator * i.denominator // math.gcd(denominator, i.denominator)
+        return denominator
+
+    @staticmethod
+    def _common_modulus(values: List[Any]) -> int:
+        """Returns the modulus if values are ModInts or ints and at least one ModInt fixes the modulus, else 0."""
+
+        modulus = 0
+        for i in values:
+            if type(i) is ModInt:
+                if modulus and i.modulus != modulus:
+                    return 0
+                modulus = i.modulus
+            elif type(i) is not int:
+                return 0
+        return modulus
+
+    @staticmethod
+    def _to_dense_vector(array: List[Tuple[Union[int, float], int]], offset: int) -> List[Union[int, float]]:
+        """
+        Converts a sorted integer powered term array into a coefficient vector starting at power offset.
+
+        >>> Polynomial._to_dense_vector([(3, -1), (4, 2)], -1)
+        [3, 0, 0, 4]
+        """
+
+        vector = [0] * (array[-1][1] - offset + 1)
+        for i, j in array:
+            vector[j - offset] += i
+        return vector
+
+    @staticmethod
+    def _from_dense_vector(vector: List[Union[int, float]], offset: int) \
+            -> List[Tuple[Union[int, float], int]]:
+        """
+        Converts a coefficient vector starting at power offset into a sorted term array, dropping zero terms.
+
+        >>> Polynomial._from_dense_vector([3, 0, 0, 4], -1)
+        [(3, -1), (4, 2)]
+        """
+
+        return [(vector[i], i + offset) for i in range(len(vector)) if vector[i] != 0]
+
+    @staticmethod
+    def _kronecker_multiplication(vector_1: List[int], vector_2: List[int]) -> List[int]:
+        """
+        Convolves two integer coefficient vectors by packing each into one large integer, multiplying those,
+        and unpacking the product's fixed width slots.
+
+        >>> Polynomial._kronecker_multiplication([1, -2, 3], [-4, 0, 5])
+        [-4, 8, -7, -10, 15]
+        """
+
+        bound = min(len(vector_1), len(vector_2)) \
+            * max(abs(i) for i in vector_1) * max(abs(i) for i in vector_2)
+        width = (bound.bit_length() + 8) // 8
+        if width == 0 or bound == 0:
+            return [0] * (len(vector_1) + len(vector_2) - 1)
+
+        def pack(vector):
+            positive = b"".join((i if i > 0 else 0).to_bytes(width, "little") for i in vector)
+            negative = b"".join((-i if i < 0 else 0).to_bytes(width, "little") for i in vector)
+            return int.from_bytes(positive, "little") - int.from_bytes(negative, "little")
+
+        length = len(vector_1) + len(vector_2) - 1
+        packed = (pack(vector_1) * pack(vector_2)) % (1 << (8 * width * length))
+        data = packed.to_bytes(width * length, "little")
+        base = 1 << (8 * width)
+        half = base >> 1
+        output = []
+        carry = 0
+        for start in range(0, width * length, width):
+            value = int.from_bytes(data[start:start + width], "little") + carry
+            if value >= half:
+                output.append(value - base)
+                carry = 1
+            else:
+                output.append(value)
+                carry = 0
+        return output
+
+    @classmethod
+    def _karatsuba_multiplication(cls, vector_1: List[Union[int, float]], vector_2: List[Union[int, float]]) \
+            -> List[Union[int, float]]:
+        """
+        Convolves two coefficient vectors in O(n^1.58) time.
+
+        >>> Polynomial._karatsuba_multiplication([1, 2], [3, .5, 1])
+        [3, 6.5, 2.0, 2]
+        """
+
+        if len(vector_1) < len(vector_2):
+            vector_1, vector_2 = vector_2, vector_1
+        length_1 = len(vector_1)
+        length_2 = len(vector_2)
+        output = [0] * (length_1 + length_2 - 1)
+        if length_2 <= cls.karatsuba_cutoff:
+            for i in range(length_1):
+                coeff = vector_1[i]
+                if coeff != 0:
+                    for j in range(length_2):
+                        output[i + j] += coeff * vector_2[j]
+            return output
+        if 2 * length_2 <= length_1:
+            # Unbalanced operands: multiply vector_2 by equally sized slices of vector_1.
+            for start in range(0, length_1, length_2):
+                partial = cls._karatsuba_multiplication(vector_1[start:start + length_2], vector_2)
+                for i in range(len(partial)):
+                    output[start + i] += partial[i]
+            return output
+
+        half = length_1 // 2
+        low_1, high_1 = vector_1[:half], vector_1[half:]
+        low_2, high_2 = vector_2[:half], vector_2[half:]
+        low = cls._karatsuba_multiplication(low_1, low_2)
+        high = cls._karatsuba_multiplication(high_1, high_2)
+        sum_1 = [i + j for i, j in zip_longest(low_1, high_1, fillvalue=0)]
+        sum_2 = [i + j for i, j in zip_longest(low_2, high_2, fillvalue=0)]
+        middle = cls._karatsuba_multiplication(sum_1, sum_2)
+        for i in range(len(low)):
+            output[i] += low[i]
+            middle[i] -= low[i]
+        for i in range(len(high)):
+            output[i + 2 * half] += high[i]
+            middle[i] -= high[i]
+        for i in range(len(middle)):
+            output[i + half] += middle[i]
+        return output
 
     def mul(self, other: "Polynomial") -> None:
         """
@@ -259,7 +738,97 @@ class Polynomial:
 
     def __mul__(self, other: "Polynomial") -> "Polynomial":
         terms = self._multiplication_helper(other.get_poly())
-        return Polynomial(terms)
+        return self.from_sorted_terms(terms)
+
+    def __pow__(self, exponent: int) -> "Polynomial":
+        """
+        Raises the polynomial to a non-negative int power by binary exponentiation, using O(log(exponent))
+        multiplications.
+
+        >>> (Polynomial([1, 1]) ** 3).get_poly()
+        [(1, 0), (3, 1), (3, 2), (1, 3)]
+        """
+
+        if type(exponent) is not int or exponent < 0:
+            raise ValueError("Exponent must be a non-negative int")
+        terms = self.get_poly()
+        if len(terms) == 1:
+            return self.from_sorted_terms([(terms[0][0] ** exponent, terms[0][1] * exponent)])
+        result = None
+        square = self
+        while exponent:
+            if exponent & 1:
+                result = square if result is None else result * square
+            exponent >>= 1
+            if exponent:
+                square = square * square
+        return result if result is not None else self.from_sorted_terms([(1, 0)])
+
+    def _non_negative_vector(self, operation: str) -> List[Union[int, float]]:
+        """Returns the coefficient vector starting at power 0, checking all powers are non-negative ints."""
+
+        if any(type(j) is not int or j < 0 for _, j in self.get_poly()):
+            raise ValueError("{} requires non-negative integer powers".format(operation))
+        return self._to_dense_vector(self.get_poly(), 0)
+
+    def compose(self, other: "Polynomial") -> "Polynomial":
+        """
+        Returns self(other(X)) by divide and conquer: splitting self into a low and a high half,
+        p(q) = p_low(q) + q^m * p_high(q), with the powers q^m shared by every split of the same size. Every
+        product is balanced, so the dense multiplication pays off, where Horner's rule multiplies an ever growing
+        polynomial by q. self must have non-negative int powers.
+
+        >>> str(Polynomial([1, 0, 1]).compose(Polynomial([(2, 1), (1, -1)])))
+        '4X^2 + X^-2 + 5'
+        """
+
+        if not isinstance(other, Polynomial):
+            raise TypeError("Must use a Polynomial object")
+        vector = self._non_negative_vector("Polynomial composition")
+        size = 1
+        while size < len(vector):
+            size *= 2
+        # powers[i] = q^(2^i) up to q^(size / 2), the largest one the top split uses.
+        powers = [other]
+        for _ in range(size.bit_length() - 2):
+            powers.append(powers[-1] * powers[-1])
+        zero = self.from_sorted_terms([])
+
+        def compose_range(start, length, level):
+            # Returns the composition of the length coefficients from start, where length = 2 ** level.
+            if length == 1:
+                coeff = vector[start] if start < len(vector) else 0
+                return self.from_sorted_terms([(coeff, 0)] if coeff != 0 else [])
+            half = length // 2
+            low = compose_range(start, half, level - 1)
+            if start + half >= len(vector) or not any(vector[start + half:start + length]):
+                return low
+            high = compose_range(start + half, half, level - 1)
+            return low + high * powers[level - 1]
+
+        if len(vector) == 1:
+            return self.from_sorted_terms([(vector[0], 0)]) if vector[0] != 0 else zero
+        return compose_range(0, size, size.bit_length() - 1)
+
+    def shift(self, a: Union[int, float]) -> "Polynomial":
+        """
+        Returns self(X + a), a Taylor shift, by repeated synthetic division in O(n^2) coefficient operations
+        without any intermediate polynomials. Exact for int, Fraction and ModInt coefficients and numerically
+        stable for floats. self must have non-negative int powers.
+
+        >>> Polynomial([0, 0, 1]).shift(3).get_poly()
+        [(9, 0), (6, 1), (1, 2)]
+        """
+
+        vector = self._non_negative_vector("Taylor shift")
+        size = len(vector)
+        if a != 0:
+            # Pass i divides by (X - a) once more, leaving the next Taylor coefficient at index i.
+            for i in range(size - 1):
+                carry = vector[size - 1]
+                for j in range(size - 2, i - 1, -1):
+                    carry = vector[j] = vector[j] + a * carry
+        return self.from_sorted_terms(self._from_dense_vector(vector, 0))
 
     def constant_mul(self, constant: Union[int, float]) -> None:
         """
@@ -276,10 +845,10 @@ class Polynomial:
 
     @classmethod
     def get_derivative(cls, poly: "Polynomial") -> "Polynomial":
-        if type(poly) is not Polynomial:
+        if not isinstance(poly, Polynomial):
             raise TypeError("Must use a Polynomial object")
         derivative = [(i * j, j - 1) for i, j in poly.get_poly() if j != 0]
-        return cls(derivative)
+        return cls.from_sorted_terms(derivative)
 
     def derive(self) -> None:
         """
@@ -297,20 +866,21 @@ class Polynomial:
             List[Tuple[Union[int, float], Union[int, float]]]:
         integral = []
         for i, j in poly.get_poly():
-            if j != -1:
-                integral.append((i / (j + 1), j + 1))
-            else:
+            if j == -1:
                 raise ValueError("Polynomial class does not support integration of forms a*X^-1")
-        index = poly.next_highest_index_bin_search(integral, 0)
-        integral.insert(index, (constant, 0))
+            if i != 0:
+                integral.append((i / (j + 1), j + 1))
+        if constant != 0 or not integral:
+            index = poly.next_highest_index_bin_search(integral, 0)
+            integral.insert(index, (constant, 0))
         return integral
 
     @classmethod
     def get_integral(cls, poly: "Polynomial", constant: Union[int, float]) -> "Polynomial":
-        if type(poly) is not Polynomial:
+        if not isinstance(poly, Polynomial):
             raise TypeError("Must use a Polynomial object")
         integral = Polynomial._integration_helper(poly, constant)
-        return cls(integral)
+        return cls.from_sorted_terms(integral)
 
     def integrate(self, constant: Union[int, float]):
         """
@@ -325,14 +895,669 @@ class Polynomial:
         integral = self._integration_helper(self, constant)
         self.set_poly(integral)
 
+    def _division_vectors(self, other: "Polynomial") -> Tuple[List[Union[int, float]], List[Union[int, float]]]:
+        """Returns both polynomials' coefficient vectors starting at power 0, checking they can be divided."""
+
+        if self._is_zero_poly(other.get_poly()):
+            raise ZeroDivisionError("Polynomial division by zero")
+        for poly in (self, other):
+            if any(type(j) is not int or j < 0 for _, j in poly.get_poly()):
+                raise ValueError("Polynomial division requires non-negative integer powers")
+        return self._to_dense_vector(self.get_poly(), 0), self._to_dense_vector(other.get_poly(), 0)
+
+    @staticmethod
+    def _divide_coefficient(numerator: Union[int, float], denominator: Union[int, float]) -> Union[int, float]:
+        """Divides two coefficients, keeping the result an int when both are ints that divide exactly."""
+
+        if type(numerator) is int and type(denominator) is int and numerator % denominator == 0:
+            return numerator // denominator
+        return numerator / denominator
+
+    @classmethod
+    def _long_division(cls, dividend: List[Union[int, float]], divisor: List[Union[int, float]]) \
+            -> Tuple[List[Union[int, float]], List[Union[int, float]]]:
+        """
+        Divides coefficient vectors in O(nm) time, returning the quotient and remainder vectors.
+
+        >>> Polynomial._long_division([-1, 0, 1], [1, 1])
+        ([-1, 1], [0])
+        """
+
+        remainder = list(dividend)
+        length = len(divisor)
+        quotient = [0] * (len(dividend) - length + 1)
+        for i in range(len(quotient) - 1, -1, -1):
+            coeff = cls._divide_coefficient(remainder[i + length - 1], divisor[-1])
+            quotient[i] = coeff
+            if coeff != 0:
+                for j in range(length):
+                    remainder[i + j] -= coeff * divisor[j]
+        return quotient, remainder[:length - 1]
+
+    @classmethod
+    def _power_series_inverse(cls, vector: List[Union[int, float]], length: int) -> List[Union[int, float]]:
+        """
+        Returns the first length coefficients of the power series 1 / vector using Newton iteration, doubling
+        the number of correct coefficients with two multiplications per step.
+
+        >>> Polynomial._power_series_inverse([1, -1], 5)
+        [1, 1, 1, 1, 1]
+        """
+
+        inverse = [cls._divide_coefficient(1, vector[0])]
+        size = 1
+        while size < length:
+            size = min(2 * size, length)
+            error = cls._multiply_vectors(vector[:size], inverse)[:size]
+            correction = [-i for i in error]
+            correction[0] += 2
+            inverse = cls._multiply_vectors(inverse, correction)[:size]
+        return inverse
+
+    @classmethod
+    def _newton_division(cls, dividend: List[Union[int, float]], divisor: List[Union[int, float]]) \
+            -> Tuple[List[Union[int, float]], List[Union[int, float]]]:
+        """
+        Divides coefficient vectors in the time of a constant number of multiplications by multiplying the
+        reversed dividend with the power series inverse of the reversed divisor.
+
+        >>> Polynomial._newton_division([-1, 0, 1], [1, 1])
+        ([-1, 1], [0])
+        """
+
+        length = len(dividend) - len(divisor) + 1
+        reversed_quotient = cls._multiply_vectors(
+            dividend[::-1][:length], cls._power_series_inverse(divisor[::-1][:length], length))[:length]
+        quotient = reversed_quotient[::-1]
+        product = cls._multiply_vectors(divisor, quotient)
+        remainder = [dividend[i] - product[i] for i in range(len(divisor) - 1)]
+        return quotient, remainder
+
+    @classmethod
+    def _divide_vectors(cls, dividend: List[Union[int, float]], divisor: List[Union[int, float]]) \
+            -> Tuple[List[Union[int, float]], List[Union[int, float]]]:
+        """Divides coefficient vectors with the faster of long division and Newton division for their sizes."""
+
+        if len(dividend) < len(divisor):
+            return [0], list(dividend)
+        if min(len(divisor), len(dividend) - len(divisor) + 1) >= cls.newton_division_threshold:
+            return cls._newton_division(dividend, divisor)
+        return cls._long_division(dividend, divisor)
+
+    def __divmod__(self, other: "Polynomial") -> Tuple["Polynomial", "Polynomial"]:
+        """
+        Divides two polynomials with non-negative integer powers, returning the quotient and remainder.
+
+        >>> quotient, remainder = divmod(Polynomial([(1, 3), (-2, 1), (5, 0)]), Polynomial([(1, 1), (-1, 0)]))
+        >>> quotient.get_poly(), remainder.get_poly()
+        ([(-1, 0), (1, 1), (1, 2)], [(4, 0)])
+        """
+
+        dividend, divisor = self._division_vectors(other)
+        if len(dividend) < len(divisor):
+            return self.from_sorted_terms([]), self.from_sorted_terms(list(self.get_poly()))
+        quotient, remainder = self._divide_vectors(dividend, divisor)
+        return (self.from_sorted_terms(self._from_dense_vector(quotient, 0)),
+                self.from_sorted_terms(self._from_dense_vector(remainder, 0)))
+
+    def __floordiv__(self, other: "Polynomial") -> "Polynomial":
+        return divmod(self, other)[0]
+
+    def __mod__(self, other: "Polynomial") -> "Polynomial":
+        return divmod(self, other)[1]
+
+    @classmethod
+    def gcd(cls, poly_1: "Polynomial", poly_2: "Polynomial", tolerance: float = 1e-9) -> "Polynomial":
+        """
+        Returns the greatest common divisor of two polynomials with non-negative integer powers using the
+        Euclidean remainder sequence. Int, Fraction and ModInt coefficients are handled exactly, int inputs
+        returning a primitive int polynomial with a positive leading coefficient and the others a monic polynomial.
+        Float remainders are monic and their coefficients at most tolerance times the largest one are dropped.
+
+        >>> Polynomial.gcd(Polynomial([-1, 0, 1]), Polynomial([1, 2, 1])).get_poly()
+        [(1, 0), (1, 1)]
+        >>> Polynomial.gcd(Polynomial([(Fraction(1, 2), 2), (Fraction(-1, 2), 0)]), Polynomial([-2, 2])).get_poly()
+        [(Fraction(-1, 1), 0), (Fraction(1, 1), 1)]
+        """
+
+        for poly in (poly_1, poly_2):
+            if not isinstance(poly, Polynomial):
+                raise TypeError("Must use a Polynomial object")
+        coeffs = [i for poly in (poly_1, poly_2) for i, _ in poly.get_poly()]
+        exact = all(type(i) in {int, Fraction, ModInt} for i in coeffs)
+        all_int = all(type(i) is int for i in coeffs)
+        modular = cls._common_modulus(coeffs)
+
+        def normalize(poly):
+            terms = poly.get_poly()
+            if exact:
+                if not modular:
+                    terms = [(Fraction(i), j) for i, j in terms]
+            else:
+                largest = max(abs(i) for i, _ in terms)
+                terms = [(i, j) for i, j in terms if abs(i) > tolerance * largest]
+            lead = terms[-1][0]
+            return cls.from_sorted_terms([(i / lead, j) for i, j in terms])
+
+        if cls._is_zero_poly(poly_1.get_poly()):
+            poly_1, poly_2 = poly_2, poly_1
+        if cls._is_zero_poly(poly_1.get_poly()):
+            return cls.from_sorted_terms([])
+        poly_1 = normalize(poly_1)
+        while not cls._is_zero_poly(poly_2.get_poly()):
+            divisor = normalize(poly_2)
+            poly_1, poly_2 = divisor, poly_1 % divisor
+            if not exact and not cls._is_zero_poly(poly_2.get_poly()) \
+                    and max(abs(i) for i, _ in poly_2.get_poly()) <= tolerance:
+                break
+        if not all_int:
+            return poly_1
+        denominators = cls._common_denominator([i for i, _ in poly_1.get_poly()])
+        return cls.from_sorted_terms([(int(i * denominators), j) for i, j in poly_1.get_poly()])
+
+    def to_domain(self, domain: Union[type, int]) -> "Polynomial":
+        """
+        Returns the polynomial with its coefficients converted into a coefficient domain: float, Fraction for exact
+        rationals, int for exact integers, or a prime p for integers mod p as ModInts. Arithmetic, calculus and
+        division then stay within the domain, except that integrating int coefficients gives floats.
+
+        >>> poly = Polynomial([(.5, 2), (3, 0)])
+        >>> str(poly.to_domain(Fraction) * poly.to_domain(Fraction))
+        '1/4X^4 + 3X^2 + 9'
+        >>> poly.to_domain(7).get_poly()
+        [(ModInt(3, 7), 0), (ModInt(4, 7), 2)]
+        """
+
+        if domain is int:
+            def convert(value):
+                value = int(value) if type(value) is ModInt else value
+                if value != int(value):
+                    raise ValueError("Coefficient {} is not an integer.".format(value))
+                return int(value)
+        elif domain in {float, Fraction}:
+            def convert(value):
+                return domain(int(value) if type(value) is ModInt else value)
+        elif type(domain) is int and ModInt._is_prime(domain):
+            def convert(value):
+                return ModInt(Fraction(value) if type(value) is float else value, domain)
+        else:
+            raise ValueError("Domain must be float, Fraction, int or a prime.")
+        terms = [(convert(i), j) for i, j in self.get_poly()]
+        return self.from_sorted_terms([(i, j) for i, j in terms if i != 0])
+
+    @classmethod
+    def from_residues(cls, polys: List["Polynomial"]) -> "Polynomial":
+        """
+        Reconstructs an int polynomial from its images mod distinct primes, given as ModInt polynomials, by the
+        Chinese remainder theorem. Coefficients come back in the symmetric range around zero, so they are exact
+        when twice their absolute values stay below the product of the primes (see ModInt.primes_for_bound).
+
+        >>> poly = Polynomial([-1000, 0, 999])
+        >>> Polynomial.from_residues([poly.to_domain(p) * poly.to_domain(p) for p in (10007, 10009)]).get_poly()
+        [(1000000, 0), (-1998000, 2), (998001, 4)]
+        """
+
+        moduli = []
+        residues = {}
+        for poly in polys:
+            modulus = cls._common_modulus([i for i, _ in poly.get_poly()])
+            if not modulus:
+                raise ValueError("Residue polynomials must have ModInt coefficients.")
+            moduli.append(modulus)
+            for i, j in poly.get_poly():
+                residues.setdefault(j, {})[modulus] = int(i)
+        terms = []
+        for power in sorted(residues):
+            coeff = ModInt.crt([residues[power].get(modulus, 0) for modulus in moduli], moduli)
+            if coeff != 0:
+                terms.append((coeff, power))
+        return cls.from_sorted_terms(terms)
+
+    def evaluate(self, x):
+        """
+        Evaluates the polynomial at a scalar, a list or tuple of points, or a NumPy array of points.
+        Lists and tuples return lists and NumPy arrays return NumPy arrays.
+
+        >>> poly = Polynomial([(2, 3), (5, -2), (.5, 1)])
+        >>> poly.evaluate(2)
+        18.25
+        >>> poly.evaluate([1, -1])
+        [7.5, 2.5]
+        >>> Polynomial([(4, .5)])(9)
+        12.0
+        """
+
+        if np is not None and isinstance(x, np.ndarray):
+            return self._evaluate_array(x)
+        if isinstance(x, (list, tuple)):
+            if np is not None:
+                return self._evaluate_array(np.asarray(x)).tolist()
+            return [self._evaluate_scalar(i) for i in x]
+        return self._evaluate_scalar(x)
+
+    def __call__(self, x):
+        return self.evaluate(x)
+
+    def _has_integer_powers(self) -> bool:
+        return all(type(j) is int for _, j in self.get_poly())
+
+    def _evaluate_scalar(self, x):
+        terms = self.get_poly()
+        if self._has_integer_powers():
+            # Horner's scheme from the highest power down, skipping missing powers with one exponentiation.
+            result = terms[-1][0]
+            for index in range(len(terms) - 2, -1, -1):
+                coeff, power = terms[index]
+                result = result * x ** (terms[index + 1][1] - power) + coeff
+            return result * x ** terms[0][1] if terms[0][1] else result
+        if not isinstance(x, complex) and x < 0 and any(j % 1 for _, j in terms):
+            # Real points below zero have no real fractional powers: nan, as NumPy gives for arrays, rather than
+            # Python's complex principal value.
+            return math.nan
+        return sum(i * x ** j for i, j in terms)
+
+    def _evaluate_array(self, x: "np.ndarray") -> "np.ndarray":
+        terms = self.get_poly()
+        x = x.astype(np.result_type(x, float), copy=False)
+        if self._has_integer_powers():
+            result = np.full(x.shape, terms[-1][0], dtype=x.dtype)
+            for index in range(len(terms) - 2, -1, -1):
+                coeff, power = terms[index]
+                result = result * x ** (terms[index + 1][1] - power) + coeff
+            return result * x ** terms[0][1] if terms[0][1] else result
+        # Vectorized power table: accumulate one term over all points at a time.
+        result = np.zeros(x.shape, dtype=x.dtype)
+        for coeff, power in terms:
+            result += coeff * x ** power
+        return result
+
+    def compile(self, with_derivative: bool = False) -> Callable:
+        """
+        Returns a function of a scalar x evaluating the polynomial, generated as straight line code specialized
+        to its terms and cached until they change. With with_derivative=True the function returns the value and
+        the value of get_derivative together, computed in one pass.
+
+        Integer powers are evaluated with one Horner chain when they are dense (see compile_horner_density), else
+        every power is computed once from smaller ones, by multiplying the previous power by the gap or by
+        squaring, and shared between the value and the derivative.
+
+        >>> poly = Polynomial([(2, 3), (5, -2), (.5, 1)])
+        >>> poly.compile()(2)
+        18.25
+        >>> Polynomial([(1, 100), (3, 1)]).compile(with_derivative=True)(2) == (2 ** 100 + 6, 100 * 2 ** 99 + 3)
+        True
+        """
+
+        if self._compiled is None:
+            self._compiled = {}
+        if with_derivative not in self._compiled:
+            self._compiled[with_derivative] = self._generate_evaluator(bool(with_derivative))
+        return self._compiled[with_derivative]
+
+    def _generate_evaluator(self, with_derivative: bool) -> Callable:
+        """Generates, compiles and returns the evaluator of compile()."""
+
+        constants = {}
+
+        def constant(value) -> str:
+            # Finite ints and floats are inlined as literals, other coefficients are bound as closure variables.
+            if type(value) is int or type(value) is float and math.isfinite(value):
+                return repr(value)
+            constants["c{}".format(len(constants))] = value
+            return "c{}".format(len(constants) - 1)
+
+        lines = []
+        # Computed powers of x and of 1 / x by exponent, with their exponents sorted to find the closest below.
+        names = {1: {1: "x"}, -1: {}}
+        exponents = {1: [1], -1: []}
+
+        def power(n: int) -> Union[str, None]:
+            """Emits the lines computing x ** n, if not computed yet, and returns its name; None for n = 0."""
+
+            if n == 0:
+                return None
+            sign = 1 if n > 0 else -1
+            n = abs(n)
+            known = names[sign]
+            if sign < 0 and not known:
+                lines.append("xi = 1 / x")
+                known[1] = "xi"
+                exponents[-1].append(1)
+            if n not in known:
+                below = exponents[sign][bisect.bisect_left(exponents[sign], n) - 1]
+                if n - below <= below:
+                    product = "{} * {}".format(power(sign * below), power(sign * (n - below)))
+                else:
+                    half = power(sign * (n // 2))
+                    product = "{0} * {0}".format(half) + (" * {}".format(known[1]) if n % 2 else "")
+                known[n] = "{}{}".format(known[1], n)
+                bisect.insort(exponents[sign], n)
+                lines.append("{} = {}".format(known[n], product))
+            return known[n]
+
+        def accumulate(target: str, products: List[str]) -> None:
+            step = self.compile_terms_per_line
+            for start in range(0, len(products), step):
+                lines.append("{} += {}".format(target, " + ".join(products[start:start + step])))
+
+        terms = list(self.get_poly())
+        integer_terms = [(i, j) for i, j in terms if type(j) is int]
+        other_terms = [(i, j) for i, j in terms if type(j) is not int]
+        if any(j % 1 for _, j in other_terms):
+            # nan below zero, as evaluate gives.
+            nan = constant(math.nan)
+            lines.append("if type(x) is not complex and x < 0:")
+            lines.append("    return {}".format("{0}, {0}".format(nan) if with_derivative else nan))
+        if integer_terms:
+            low, high = integer_terms[0][1], integer_terms[-1][1]
+            if len(integer_terms) >= self.compile_horner_density * (high - low + 1):
+                coeffs = {j: i for i, j in integer_terms}
+                lines.append("v = {}".format(constant(coeffs[high])))
+                if with_derivative:
+                    lines.append("d = 0")
+                for j in range(high - 1, low - 1, -1):
+                    if with_derivative:
+                        lines.append("d = d * x + v")
+                    lines.append("v = v * x + {}".format(constant(coeffs[j])) if j in coeffs else "v = v * x")
+                if low:
+                    # v * x ** low and its derivative (d * x + low * v) * x ** (low - 1).
+                    if with_derivative:
+                        lines.append("d = d * x + {} * v".format(low))
+                    lines.append("v = v * x")
+                    scale = power(low - 1)
+                    if scale is not None:
+                        lines.append("v = v * {}".format(scale))
+                        if with_derivative:
+                            lines.append("d = d * {}".format(scale))
+            else:
+                lines.extend(["v = 0", "d = 0"] if with_derivative else ["v = 0"])
+                accumulate("v", ["{} * {}".format(constant(i), power(j)) if j else constant(i)
+                                 for i, j in integer_terms])
+                if with_derivative:
+                    accumulate("d", ["{} * {}".format(constant(i * j), power(j - 1)) if j != 1 else constant(i)
+                                     for i, j in integer_terms if j])
+        else:
+            lines.extend(["v = 0", "d = 0"] if with_derivative else ["v = 0"])
+        accumulate("v", ["{} * x ** {!r}".format(constant(i), j) for i, j in other_terms])
+        if with_derivative:
+            accumulate("d", ["{} * x ** {!r}".format(constant(i * j), j - 1) for i, j in other_terms])
+        lines.append("return v, d" if with_derivative else "return v")
+        source = "def _factory({}):\n    def evaluate(x):\n{}\n    return evaluate\n".format(
+            ", ".join(constants), "\n".join("        " + line for line in lines))
+        namespace = {}
+        exec(compile(source, "<Polynomial.compile>", "exec"), namespace)
+        return namespace["_factory"](**constants)
+
+    @classmethod
+    def _subproduct_tree(cls, points: List[Union[int, float]]) -> List[List[List[Union[int, float]]]]:
+        """
+        Returns the levels of the subproduct tree of points, from the leaves (X - point) up to the product of all
+        of them. Every node is the product of the two nodes below it, an odd node out is carried up unchanged.
+
+        >>> Polynomial._subproduct_tree([1, 2, 3])
+        [[[-1, 1], [-2, 1], [-3, 1]], [[2, -3, 1], [-3, 1]], [[-6, 11, -6, 1]]]
+        """
+
+        level = [[-x, 1] for x in points]
+        tree = [level]
+        while len(level) > 1:
+            level = [cls._multiply_vectors(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+                     for i in range(0, len(level), 2)]
+            tree.append(level)
+        return tree
+
+    @classmethod
+    def _remainder_tree(cls, vector: List[Union[int, float]], tree: List[List[List[Union[int, float]]]]) \
+            -> List[Union[int, float]]:
+        """Reduces vector modulo every node of a subproduct tree from the root down, returning its leaf values."""
+
+        remainders = [cls._divide_vectors(vector, tree[-1][0])[1]]
+        for level in reversed(tree[:-1]):
+            remainders = [cls._divide_vectors(remainders[i // 2], level[i])[1] for i in range(len(level))]
+        return [remainder[0] if remainder else 0 for remainder in remainders]
+
+    @staticmethod
+    def _has_builtin_coefficients(values: List[Any]) -> bool:
+        return all(type(i) in {int, float, complex, Fraction} for i in values)
+
+    def evaluate_many(self, points: List[Union[int, float]], use_tree: bool = None) -> List[Union[int, float]]:
+        """
+        Evaluates the polynomial at many points. With use_tree, the polynomial is reduced modulo the subproduct
+        tree of the points in O(nlog^2(n)) coefficient operations, which requires non-negative integer powers.
+
+        By default, inputs made only of built-in numbers (int, float, complex and Fraction) are always evaluated
+        directly, float points with NumPy when available: float remainders lose all accuracy within a few hundred
+        points unless the points are well conditioned, like roots of unity in bit reversed order, and int and
+        Fraction coefficients grow so large that direct evaluation is faster. Only large inputs with other,
+        bounded size coefficient types, such as ModInt, take the tree by default. Built-in number inputs therefore
+        cost O(n^2) operations for n points and terms however large n grows; pass use_tree=True to force the tree.
+
+        >>> Polynomial([(1, 2), (-1, 0)]).evaluate_many([0, 1, 2, 3], use_tree=True)
+        [-1, 0, 3, 8]
+        """
+
+        points = list(points)
+        terms = self.get_poly()
+        if use_tree is None:
+            use_tree = len(points) >= self.subproduct_tree_threshold \
+                and len(terms) >= self.subproduct_tree_threshold \
+                and not self._has_builtin_coefficients([i for i, _ in terms] + points)
+        if not use_tree:
+            if np is not None and all(type(x) is float for x in points):
+                return self.evaluate(points)
+            return [self._evaluate_scalar(x) for x in points]
+        if any(type(j) is not int or j < 0 for _, j in terms):
+            raise ValueError("Subproduct tree evaluation requires non-negative integer powers")
+        return self._remainder_tree(self._to_dense_vector(terms, 0), self._subproduct_tree(points))
+
+    @classmethod
+    def interpolate(cls, xs: List[Union[int, float]], ys: List[Union[int, float]], use_tree: bool = None) \
+            -> "Polynomial":
+        """
+        Returns the polynomial of lowest degree passing through the points (xs[i], ys[i]). With use_tree, it is
+        built by Lagrange interpolation over the subproduct tree of xs in O(nlog^2(n)) coefficient operations,
+        otherwise from Newton's divided differences in O(n^2) operations. The default follows evaluate_many, so
+        built-in number inputs always use Newton's divided differences, staying O(n^2) at any size, unless
+        use_tree=True.
+        Int and Fraction inputs are interpolated exactly, returning integral coefficients as ints.
+
+        >>> Polynomial.interpolate([0, 1, 2, 3], [-1, 0, 3, 8]).get_poly()
+        [(-1, 0), (1, 2)]
+        >>> Polynomial.interpolate([0, 1, 2, 3], [-1, 0, 3, 8], use_tree=True).get_poly()
+        [(-1, 0), (1, 2)]
+        """
+
+        xs = list(xs)
+        ys = list(ys)
+        if len(xs) != len(ys) or not xs:
+            raise ValueError("xs and ys must be non-empty and of equal length.")
+        if len(set(xs)) != len(xs):
+            raise ValueError("xs must be distinct.")
+        exact = all(type(i) in {int, Fraction} for i in xs + ys)
+        if use_tree is None:
+            use_tree = len(xs) >= cls.subproduct_tree_threshold and not cls._has_builtin_coefficients(xs + ys)
+        if use_tree:
+            coeffs = cls._tree_interpolation(xs, ys, exact)
+        else:
+            coeffs = cls._newton_interpolation(xs, ys, exact)
+        if exact:
+            coeffs = [i.numerator if type(i) is Fraction and i.denominator == 1 else i for i in coeffs]
+        return cls.from_sorted_terms(cls._from_dense_vector(coeffs, 0))
+
+    @classmethod
+    def _tree_interpolation(cls, xs: List[Union[int, float]], ys: List[Union[int, float]], exact: bool) \
+            -> List[Union[int, float]]:
+        tree = cls._subproduct_tree(xs)
+        root = tree[-1][0]
+        derivative = [i * root[i] for i in range(1, len(root))]
+        weights = cls._remainder_tree(derivative, tree)
+        values = [[Fraction(y) / weight if exact else y / weight] for y, weight in zip(ys, weights)]
+        for level in tree[:-1]:
+            combined = []
+            for i in range(0, len(level), 2):
+                if i + 1 < len(level):
+                    left = cls._multiply_vectors(values[i], level[i + 1])
+                    right = cls._multiply_vectors(values[i + 1], level[i])
+                    combined.append([a + b for a, b in zip_longest(left, right, fillvalue=0)])
+                else:
+                    combined.append(values[i])
+            values = combined
+        return values[0]
+
+    @staticmethod
+    def _newton_interpolation(xs: List[Union[int, float]], ys: List[Union[int, float]], exact: bool) \
+            -> List[Union[int, float]]:
+        """
+        Computes Newton's divided differences in place, then expands the Newton form into a coefficient vector
+        with Horner's scheme.
+
+        >>> Polynomial._newton_interpolation([0, 1, 2], [1, 2, 5], True)
+        [Fraction(1, 1), Fraction(0, 1), Fraction(1, 1)]
+        """
+
+        differences = [Fraction(y) for y in ys] if exact else list(ys)
+        for j in range(1, len(xs)):
+            for i in range(len(xs) - 1, j - 1, -1):
+                differences[i] = (differences[i] - differences[i - 1]) / (xs[i] - xs[i - j])
+        coeffs = [differences[-1]]
+        for k in range(len(xs) - 2, -1, -1):
+            shifted = [0] + coeffs
+            for i in range(len(coeffs)):
+                shifted[i] -= coeffs[i] * xs[k]
+            shifted[0] += differences[k]
+            coeffs = shifted
+        return coeffs
+
+    def _root_polynomial(self) -> Tuple["Polynomial", int]:
+        """
+        Returns the polynomial multiplied by X^-k, k being its lowest power, so that it has a non-zero constant
+        term, together with the number of roots at zero that were removed.
+        """
+
+        terms = self.get_poly()
+        if self._is_zero_poly(terms):
+            raise ValueError("The zero polynomial has infinitely many roots")
+        if not self._has_integer_powers():
+            raise ValueError("roots() requires integer powers")
+        lowest = terms[0][1]
+        return self.from_sorted_terms([(i, j - lowest) for i, j in terms]), max(lowest, 0)
+
+    def roots(self) -> List[complex]:
+        """
+        Returns all roots of the polynomial as complex numbers, repeated by multiplicity and sorted by real then
+        imaginary part. Negative powers are cleared by multiplying through by X^k. The roots are the eigenvalues of
+        the companion matrix when NumPy is available, else found by Aberth iteration, then polished with Newton
+        steps on the polynomial and its derivative.
+
+        >>> [round(root.real, 6) for root in Polynomial([(1, 2), (-3, 1), (2, 0)]).roots()]
+        [1.0, 2.0]
+        >>> [round(root.imag, 6) for root in Polynomial([(1, 1), (1, -1)]).roots()]
+        [-1.0, 1.0]
+        """
+
+        poly, zeros = self._root_polynomial()
+        vector = self._to_dense_vector(poly.get_poly(), 0)
+        if len(vector) == 1:
+            return [0j] * zeros
+        if np is not None:
+            roots = np.linalg.eigvals(self._companion_matrices(np.array([vector], dtype=complex))[0]).tolist()
+        else:
+            roots = self._aberth(vector)
+        derivative = self.get_derivative(poly)
+        for _ in range(self.root_refinement_steps):
+            refined = []
+            for root in roots:
+                slope = derivative._evaluate_scalar(root)
+                refined.append(root - poly._evaluate_scalar(root) / slope if slope != 0 else root)
+            roots = refined
+        return sorted([0j] * zeros + [complex(root) for root in roots], key=lambda z: (round(z.real, 10), z.imag))
+
+    @staticmethod
+    def _companion_matrices(coeffs: "np.ndarray") -> "np.ndarray":
+        """Stacks the companion matrices of the rows of a coefficient matrix ordered from lowest to highest power."""
+
+        count, length = coeffs.shape
+        matrices = np.zeros((count, length - 1, length - 1), dtype=complex)
+        matrices[:, np.arange(1, length - 1), np.arange(length - 2)] = 1
+        matrices[:, :, -1] = -coeffs[:, :-1] / coeffs[:, -1:]
+        return matrices
+
+    @staticmethod
+    def _aberth(vector: List[Union[int, float]], tolerance: float = 1e-14, max_iterations: int = 500) \
+            -> List[complex]:
+        """Finds all roots of a coefficient vector with a non-zero constant term by Aberth-Ehrlich iteration."""
+
+        degree = len(vector) - 1
+        monic = [complex(i) / vector[-1] for i in vector]
+        radius = 2 * max(abs(monic[degree - k]) ** (1 / k) for k in range(1, degree + 1))
+        roots = [radius * cmath.exp(1j * (2 * cmath.pi * k / degree + .4)) for k in range(degree)]
+        for _ in range(max_iterations):
+            largest_step = 0
+            for k in range(degree):
+                z = roots[k]
+                value = monic[degree]
+                slope = 0
+                for coeff in monic[degree - 1::-1]:
+                    slope = slope * z + value
+                    value = value * z + coeff
+                if value == 0:
+                    continue
+                ratio = value / slope if slope != 0 else value
+                repulsion = sum(1 / (z - roots[j]) for j in range(degree) if j != k and z != roots[j])
+                step = ratio / (1 - ratio * repulsion)
+                roots[k] = z - step
+                largest_step = max(largest_step, abs(step) / max(abs(z), 1))
+            if largest_step < tolerance:
+                break
+        return roots
+
+    @classmethod
+    def roots_many(cls, polys: List["Polynomial"]) -> List[List[complex]]:
+        """
+        Returns the roots of many polynomials, as roots() would. With NumPy, polynomials of the same degree are
+        solved together: one batched eigenvalue call on their stacked companion matrices, followed by Newton steps
+        vectorized over every root of the batch.
+
+        >>> [[round(root.real, 6) for root in roots] for roots in
+        ...     Polynomial.roots_many([Polynomial([2, -3, 1]), Polynomial([-12, 1, 1])])]
+        [[1.0, 2.0], [-4.0, 3.0]]
+        """
+
+        if np is None:
+            return [poly.roots() for poly in polys]
+        shifted = [poly._root_polynomial() for poly in polys]
+        groups = {}
+        for index, (poly, _) in enumerate(shifted):
+            groups.setdefault(poly.get_poly()[-1][1], []).append(index)
+        results = [None] * len(polys)
+        for degree, indices in groups.items():
+            coeffs = np.zeros((len(indices), degree + 1), dtype=complex)
+            for row, index in enumerate(indices):
+                for i, j in shifted[index][0].get_poly():
+                    coeffs[row, j] = i
+            roots = np.linalg.eigvals(cls._companion_matrices(coeffs)) if degree else np.zeros((len(indices), 0))
+            for _ in range(cls.root_refinement_steps if degree else 0):
+                value = np.repeat(coeffs[:, -1:], degree, axis=1)
+                slope = np.zeros_like(roots)
+                for k in range(degree - 1, -1, -1):
+                    slope = slope * roots + value
+                    value = value * roots + coeffs[:, k:k + 1]
+                nonzero = slope != 0
+                roots[nonzero] -= value[nonzero] / slope[nonzero]
+            for row, index in enumerate(indices):
+                zeros = [0j] * shifted[index][1]
+                results[index] = sorted(zeros + [complex(root) for root in roots[row].tolist()],
+                                        key=lambda z: (round(z.real, 10), z.imag))
+        return results
+
     def get_degree(self) -> int:
-        """Return power of the term with the highest degree absolute value power."""
+        """Return power of the term with the highest degree absolute value power. The result is cached."""
 
-        first = self.get_poly()[-1][1]
-        last = self.get_poly()[0][1]
-        if abs(first) >= abs(last):
-            return first
-        return last
+        if self._degree is None:
+            first = self.get_poly()[-1][1]
+            last = self.get_poly()[0][1]
+            self._degree = first if abs(first) >= abs(last) else last
+        return self._degree
 
     @staticmethod
     def next_highest_index_bin_search(array: List[Tuple[Union[int, float], Union[int, float]]],
@@ -345,24 +1570,100 @@ class Polynomial:
         """
 
         low = 0
-        high = len(array) - 1
+        high = len(array)
         while low < high:
             mid = (high + low) // 2
-            if high - low == 1:
-                if array[low][1] == target:
-                    return low
-                elif array[high][1] == target:
-                    return high
-                elif array[low][1] > target:
-                    return low
-                elif array[low][1] < target < array[high][1]:
-                    return high
-                else:
-                    return high + 1
-            elif array[mid][1] < target:
-                low = mid
+            if array[mid][1] < target:
+                low = mid + 1
             else:
                 high = mid
+        return low
+
+    def coeff(self, power: Union[int, float]) -> Union[int, float]:
+        """
+        Returns the coefficient of the term with the given power, 0 if there is none. Looks the power up in the
+        term index once set_term or add_term built it, else binary searches the sorted terms.
+
+        >>> Polynomial([(2, 3), (5, -2)]).coeff(3), Polynomial([(2, 3), (5, -2)]).coeff(1)
+        (2, 0)
+        """
+
+        if self._index is not None:
+            return self._index.get(power, 0)
+        terms = self.get_poly()
+        index = self.next_highest_index_bin_search(terms, power)
+        if index < len(terms) and terms[index][1] == power:
+            return terms[index][0]
+        return 0
+
+    def set_term(self, power: Union[int, float], coeff: Union[int, float]) -> None:
+        """
+        Sets the coefficient of the term with the given power, removing the term if coeff is 0.
+
+        Updates go to an index of the terms by power and the sorted terms are rebuilt from it only on the next
+        get_poly, so a stream of k updates to an n term polynomial costs O(k) plus one O(n + k log k) rebuild.
+
+        >>> poly = Polynomial([(2, 3), (5, -2)])
+        >>> poly.set_term(1, 4)
+        >>> poly.set_term(-2, 0)
+        >>> str(poly), poly.get_degree()
+        ('2X^3 + 4X', 3)
+        """
+
+        if type(power) not in {int, float} or type(coeff) not in {int, float, Fraction, ModInt}:
+            raise TypeError("Powers must be int or float and coefficients int, float, Fraction or ModInt.")
+        index = self._term_index()
+        if coeff == 0:
+            if index.pop(power, None) is None:
+                return
+            if power == self._degree:
+                self._degree = None
+        else:
+            if power not in index and self._degree is not None \
+                    and (abs(power), power) > (abs(self._degree), self._degree):
+                self._degree = power
+            index[power] = coeff
+        self._terms_changed()
+
+    def add_term(self, power: Union[int, float], coeff: Union[int, float]) -> None:
+        """
+        Adds coeff to the coefficient of the term with the given power, in the same way as set_term.
+
+        >>> poly = Polynomial([1, 2])
+        >>> poly.add_term(1, -2)
+        >>> poly.add_term(4, .5)
+        >>> poly.get_poly()
+        [(1, 0), (0.5, 4)]
+        """
+
+        if type(coeff) not in {int, float, Fraction, ModInt}:
+            raise TypeError("Powers must be int or float and coefficients int, float, Fraction or ModInt.")
+        self.set_term(power, self._term_index().get(power, 0) + coeff)
+
+    def _term_index(self) -> dict:
+        """Returns the terms as a dict from power to coefficient, building it on first use."""
+
+        if self._index is None:
+            self._index = {j: i for i, j in self.get_poly() if i != 0}
+        return self._index
+
+    def _terms_changed(self) -> None:
+        """Marks the sorted terms stale after an update of the term index, and drops what was derived from them."""
+
+        if not self._dirty:
+            self._dirty = True
+            self._str = None
+            self._compiled = None
+
+    def _flush_terms(self) -> None:
+        """Rebuilds the sorted terms from the term index, keeping the index and the degree."""
+
+        # Powers inserted since the last rebuild trail the dict's sorted powers, so the sort only merges them in.
+        index = {j: self._index[j] for j in sorted(self._index)}
+        degree = self._degree
+        self.set_poly([(i, j) for j, i in index.items()] or [(0, 0)])
+        self._index = index
+        self._degree = degree
 
     def __len__(self):
         return len(self.get_poly())
@@ -376,66 +1677,309 @@ class Polynomial:
     def __getitem__(self, item):
         return self.get_poly()[item]
 
-    def __str__(self):
-
-        def to_frac(val):
-            return str(Fraction(val).limit_denominator(100))
-
-        def add_term(coeff, power):
-            end_term = False
-            if coeff >= 0:
-                sign = " + "
-            else:
-                sign = " - "
-            if power == 0:
-                # Constant term
-                end_term = sign + str(abs(coeff))
-            elif power == 1:
-                if coeff == 1:
-                    output.append(sign + "X")
-                else:
-                    output.append(sign + str(to_frac(abs(coeff))) + "X")
-            else:
-                if len(output) == 0:
-                    if abs(coeff) == 1:
-                        if sign == " - ":
-                            output.append("-")
-                        output.append("X^" + to_frac(power))
-                    else:
-                        if sign == " + ":
-                            output.append(to_frac(abs(coeff)) + "X^" + to_frac(power))
-                        else:
-                            output.append(to_frac(coeff) + "X^" + to_frac(power))
-                else:
-                    if abs(coeff) == 1:
-                        output.append(sign + "X^" + to_frac(power))
-                    else:
-                        output.append(sign + to_frac(abs(coeff)) + "X^" + to_frac(power))
-            if end_term:
-                output.append(end_term)
+    def _terms_in_str_order(self) -> Iterator[Tuple[Union[int, float], Union[int, float]]]:
+        """Yields the terms from the highest to the lowest absolute power, positive powers first on ties."""
 
-        output = []
-        low = 0
-        high = len(self.get_poly()) - 1
         terms = self.get_poly()
+        low = 0
+        high = len(terms) - 1
         while low <= high:
             if low == high:
-                term = terms[low]
-                add_term(term[0], term[1])
+                yield terms[low]
                 break
             elif abs(terms[low][1]) > abs(terms[high][1]):
-                term = terms[low]
-                add_term(term[0], term[1])
+                yield terms[low]
                 low += 1
             elif abs(terms[low][1]) < abs(terms[high][1]):
-                term = terms[high]
-                add_term(term[0], term[1])
+                yield terms[high]
                 high -= 1
             else:
-                first = terms[high]
-                second = terms[low]
-                add_term(first[0], first[1])
-                add_term(second[0], second[1])
+                yield terms[high]
+                yield terms[low]
                 low += 1
                 high -= 1
-        return "".join(output)
+
+    @staticmethod
+    def _to_frac(val: Union[int, float]) -> str:
+        """
+        Formats a value as a fraction: floats with a denominator of at most 100, skipping the Fraction conversion
+        for integral values, and Fractions exactly.
+
+        >>> Polynomial._to_frac(6.0), Polynomial._to_frac(.3), Polynomial._to_frac(-28)
+        ('6', '3/10', '-28')
+        >>> Polynomial._to_frac(Fraction(1, 101))
+        '1/101'
+        """
+
+        if type(val) is float:
+            if val.is_integer():
+                return str(int(val))
+            return str(Fraction(val).limit_denominator(100))
+        return str(val)
+
+    @classmethod
+    def _format_term(cls, coeff: Union[int, float], power: Union[int, float], first: bool) -> str:
+        if first:
+            sign = "-" if coeff < 0 else ""
+        else:
+            sign = " - " if coeff < 0 else " + "
+        if power == 0:
+            return sign + str(abs(coeff))
+        coeff = "" if abs(coeff) == 1 else cls._to_frac(abs(coeff))
+        if power == 1:
+            return sign + coeff + "X"
+        return sign + coeff + "X^" + cls._to_frac(power)
+
+    def iter_str(self) -> Iterator[str]:
+        """
+        Yields str(self) one term at a time, so that huge polynomials can be streamed without building the whole
+        string.
+
+        >>> list(Polynomial([(2, 3), (5, -2), (.5, 1)]).iter_str())
+        ['2X^3', ' + 5X^-2', ' + 1/2X']
+        """
+
+        first = True
+        for coeff, power in self._terms_in_str_order():
+            yield self._format_term(coeff, power, first)
+            first = False
+
+    def write_to(self, file: IO[str], terms_per_write: int = 4096) -> None:
+        """Streams str(self) into a text file object, writing terms_per_write terms at a time."""
+
+        pieces = []
+        for piece in self.iter_str():
+            pieces.append(piece)
+            if len(pieces) >= terms_per_write:
+                file.write("".join(pieces))
+                pieces = []
+        file.write("".join(pieces))
+
+    def __str__(self):
+        if self._str is None:
+            self._str = "".join(self.iter_str())
+        return self._str
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_ratio(text: str) -> Union[int, float, Fraction]:
+        # Memoized since the same powers and coefficients recur across terms and lines.
+        numerator, slash, denominator = text.partition("/")
+        if slash:
+            # str() writes floats with denominators of at most 100, so larger ones come from exact Fractions.
+            if int(denominator) > 100:
+                return Fraction(int(numerator), int(denominator))
+            return int(numerator) / int(denominator)
+        return int(numerator)
+
+    @staticmethod
+    def _parse_constant(text: str) -> Union[int, float, Fraction]:
+        # Constants are written with str(), so only Fraction constants contain a slash.
+        if "/" in text:
+            return Fraction(text)
+        if text.isdigit():
+            return int(text)
+        return float(text)
+
+    @classmethod
+    def parse(cls, text: str) -> "Polynomial":
+        """
+        Builds a polynomial from the text str() produces, in a single pass over the text.
+
+        Coefficients and powers written as fractions become floats, or Fractions for denominators above 100, which
+        only exact Fractions produce, and integral ones ints.
+
+        >>> Polynomial.parse("8X^3 + 5X^-2 + 1/2X").get_poly()
+        [(5, -2), (0.5, 1), (8, 3)]
+        >>> str(Polynomial.parse("-X^28/5 + 3X^2 - 0.5"))
+        '-X^28/5 + 3X^2 - 0.5'
+        """
+
+        match = _TERM_PATTERN.match
+        parse_ratio = cls._parse_ratio
+        parse_constant = cls._parse_constant
+        position = 0
+        end = len(text)
+        # str() emits terms from the highest to the lowest absolute power, so negative powers arrive ascending
+        # and the others descending. Terms in any other order are sorted and collected afterwards.
+        negative = []
+        positive = []
+        ordered = True
+        while True:
+            term = match(text, position)
+            if term is None or (position and not term.group(1)):
+                raise ValueError("Cannot parse polynomial at position {}: {!r}".format(position, text[position:]))
+            sign, coeff, x, power, constant = term.groups()
+            if x is None:
+                coeff = parse_constant(constant)
+                power = 0
+            else:
+                coeff = parse_ratio(coeff) if coeff else 1
+                power = parse_ratio(power) if power else 1
+            if sign == "-":
+                coeff = -coeff
+            if power < 0:
+                if negative and negative[-1][1] >= power:
+                    ordered = False
+                negative.append((coeff, power))
+            else:
+                if positive and positive[-1][1] <= power:
+                    ordered = False
+                positive.append((coeff, power))
+            position = term.end()
+            if position == end:
+                break
+        positive.reverse()
+        terms = negative + positive
+        if not ordered:
+            terms = cls.sort_tuple_list(cls._collect_terms(terms))
+        return cls.from_sorted_terms([(i, j) for i, j in terms if i != 0])
+
+    @classmethod
+    def parse_many(cls, lines: Iterable[str]) -> Iterator["Polynomial"]:
+        """
+        Lazily parses one polynomial per line, for example from an open text file, skipping blank lines.
+
+        >>> [poly.get_poly() for poly in Polynomial.parse_many(["2X + 1\\n", "\\n", "X^-1\\n"])]
+        [[(1, 0), (2, 1)], [(1, -1)]]
+        """
+
+        parse = cls.parse
+        for line in lines:
+            line = line.strip()
+            if line:
+                yield parse(line)
+
+    def _term_buffers(self) -> Tuple[Sequence, Sequence]:
+        terms = self.get_poly()
+        to_buffer = CompactPolynomial._to_buffer
+        return to_buffer([i for i, _ in terms]), to_buffer([j for _, j in terms])
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the polynomial into a binary record: a 16 byte header, then the coefficients and the powers as
+        contiguous 64 bit int or double arrays, in the canonical sorted by power order. Fraction coefficients are
+        stored as doubles.
+
+        >>> data = Polynomial([(2, 3), (5, -2), (.5, 1)]).to_bytes()
+        >>> len(data)
+        64
+        >>> CompactPolynomial.from_bytes(data).get_poly()
+        [(5.0, -2), (0.5, 1), (2.0, 3)]
+        """
+
+        coeffs, powers = (memoryview(buffer) for buffer in self._term_buffers())
+        output = [_RECORD_HEADER.pack(_RECORD_MAGIC, coeffs.format.encode(), powers.format.encode(), len(coeffs))]
+        for buffer in (coeffs, powers):
+            if sys.byteorder == "big":
+                buffer = Array(buffer.format, buffer)
+                buffer.byteswap()
+            output.append(buffer.tobytes())
+        return b"".join(output)
+
+
+class TermView(Sequence):
+    """Read only view yielding (coefficient, power) tuples from parallel coefficient and power buffers."""
+
+    __slots__ = ("_coeffs", "_powers")
+
+    def __init__(self, coeffs: Sequence, powers: Sequence):
+        self._coeffs = coeffs
+        self._powers = powers
+
+    def __len__(self):
+        return len(self._powers)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return list(zip(self._coeffs[item], self._powers[item]))
+        return self._coeffs[item], self._powers[item]
+
+    def __iter__(self):
+        return zip(self._coeffs, self._powers)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(i == j for i, j in zip(self, other))
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class CompactPolynomial(Polynomial):
+    """
+    Polynomial storing its terms in two parallel typed arrays instead of a list of tuples,
+    using 16 bytes per term instead of roughly 90. Coefficients and powers must be ints that fit
+    into 64 bits or floats.
+
+    >>> poly = CompactPolynomial([(2, 3), (5, -2), (.5, 1), (6, 3)])
+    >>> str(poly)
+    '8X^3 + 5X^-2 + 1/2X'
+    >>> poly.get_poly()
+    [(5.0, -2), (0.5, 1), (8.0, 3)]
+    """
+
+    __slots__ = ("_coeffs", "_powers")
+
+    @staticmethod
+    def _to_buffer(values: List[Union[int, float]]) -> Array:
+        """Packs values into a signed 64 bit integer array if they are all ints, else a double array."""
+
+        if all(type(i) is int for i in values):
+            return Array("q", values)
+        return Array("d", values)
+
+    @classmethod
+    def from_buffers(cls, coeffs: Sequence, powers: Sequence) -> "CompactPolynomial":
+        """Wraps canonical, sorted by power, coefficient and power buffers without copying or validating them."""
+
+        poly = cls.__new__(cls)
+        poly._coeffs = coeffs
+        poly._powers = powers
+        poly._reset_caches()
+        return poly
+
+    @classmethod
+    def from_bytes(cls, buffer: Union[bytes, bytearray, memoryview], offset: int = 0) -> "CompactPolynomial":
+        """
+        Loads a record written by Polynomial.to_bytes starting at offset. On little endian machines the
+        polynomial views the buffer's memory directly, so loading from a memory map copies nothing.
+        """
+
+        magic, coeff_code, power_code, length = _RECORD_HEADER.unpack_from(buffer, offset)
+        if magic != _RECORD_MAGIC or coeff_code not in {b"q", b"d"} or power_code not in {b"q", b"d"}:
+            raise ValueError("Not a polynomial record.")
+        view = memoryview(buffer)
+        start = offset + _RECORD_HEADER.size
+        arrays = []
+        for code in (coeff_code.decode(), power_code.decode()):
+            array = view[start:start + 8 * length].cast("B").cast(code)
+            if sys.byteorder == "big":
+                array = Array(code, array)
+                array.byteswap()
+            arrays.append(array)
+            start += 8 * length
+        return cls.from_buffers(*arrays)
+
+    def get_poly(self):
+        return TermView(self._coeffs, self._powers)
+
+    def set_poly(self, poly):
+        self._coeffs = self._to_buffer([i for i, _ in poly])
+        self._powers = self._to_buffer([j for _, j in poly])
+        self._reset_caches()
+
+    def _terms_changed(self) -> None:
+        # Typed arrays cannot take insertions in place, so every update rebuilds them at once; stream updates into
+        # a Polynomial instead.
+        self._flush_terms()
+
+    def _term_buffers(self) -> Tuple[Sequence, Sequence]:
+        return self._coeffs, self._powers
+
+    def __len__(self):
+        return len(self._powers)
+
+    def __iter__(self):
+        return zip(self._coeffs, self._powers)
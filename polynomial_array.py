@@ -0,0 +1,213 @@
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+
+from polynomial import Polynomial
+
+
+class PolynomialArray:
+    """
+    Stores a batch of polynomials as a 2-D coefficient matrix with one row per polynomial and one column per power
+    of a shared, sorted power grid, so that arithmetic runs as vectorized NumPy operations over the whole batch.
+    Requires NumPy.
+    """
+
+    __slots__ = ("_coeffs", "_powers")
+
+    # Minimum fraction of powers between a factor's lowest and highest power that must hold a column before
+    # multiplication of integer power grids convolves dense rows instead of scattering every pairwise product.
+    convolution_density = 0.25
+
+    def __init__(self, coeffs: Sequence[Sequence[Union[int, float]]], powers: Sequence[Union[int, float]]):
+        """
+        Args:
+            coeffs: matrix of shape (number of polynomials, number of powers) holding each polynomial's coefficients.
+            powers: strictly increasing powers of the matrix columns.
+        Examples:
+            >>> batch = PolynomialArray([[1, 2, 0], [0, 1, 3]], [0, 1, 2])
+            >>> [poly.get_poly() for poly in batch.to_polynomials()]
+            [[(1.0, 0), (2.0, 1)], [(1.0, 1), (3.0, 2)]]
+        """
+
+        self._coeffs = np.array(coeffs, dtype=float, ndmin=2)
+        self._powers = np.array(powers, dtype=float, ndmin=1)
+        if self._coeffs.ndim != 2 or self._coeffs.shape[1] != self._powers.shape[0]:
+            raise ValueError("coeffs must be a matrix with one column per power.")
+        if np.any(np.diff(self._powers) <= 0):
+            raise ValueError("powers must be strictly increasing.")
+
+    @classmethod
+    def _from_arrays(cls, coeffs: np.ndarray, powers: np.ndarray) -> "PolynomialArray":
+        batch = cls.__new__(cls)
+        batch._coeffs = coeffs
+        batch._powers = powers
+        return batch
+
+    @classmethod
+    def from_polynomials(cls, polys: Sequence[Polynomial]) -> "PolynomialArray":
+        """
+        Creates a batch from polynomials, placing them on the union of their powers.
+
+        >>> batch = PolynomialArray.from_polynomials([Polynomial([(1, 2)]), Polynomial([(4, -1), (2, 2)])])
+        >>> batch.get_powers().tolist()
+        [-1.0, 2.0]
+        """
+
+        powers = np.unique([j for poly in polys for _, j in poly]).astype(float)
+        coeffs = np.zeros((len(polys), len(powers)))
+        for row, poly in enumerate(polys):
+            terms = poly.get_poly()
+            columns = np.searchsorted(powers, [j for _, j in terms])
+            coeffs[row, columns] = [i for i, _ in terms]
+        return cls._from_arrays(coeffs, powers)
+
+    def to_polynomials(self) -> List[Polynomial]:
+        """Converts every row of the batch back into a Polynomial."""
+
+        powers = [int(j) if j.is_integer() else j for j in self._powers.tolist()]
+        polys = []
+        for row in self._coeffs.tolist():
+            polys.append(Polynomial([(i, j) for i, j in zip(row, powers) if i != 0]))
+        return polys
+
+    def get_coeffs(self) -> np.ndarray:
+        return self._coeffs
+
+    def get_powers(self) -> np.ndarray:
+        return self._powers
+
+    def __len__(self):
+        return self._coeffs.shape[0]
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self._from_arrays(self._coeffs[item], self._powers)
+        return self._from_arrays(self._coeffs[[item]], self._powers).to_polynomials()[0]
+
+    def _align(self, other: "PolynomialArray") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Places both batches' coefficients on the union of their power grids."""
+
+        if len(self) != len(other):
+            raise ValueError("PolynomialArrays must contain the same number of polynomials.")
+        if np.array_equal(self._powers, other._powers):
+            return self._coeffs, other._coeffs, self._powers
+        powers = np.union1d(self._powers, other._powers)
+        coeffs_1 = np.zeros((len(self), len(powers)))
+        coeffs_2 = np.zeros((len(other), len(powers)))
+        coeffs_1[:, np.searchsorted(powers, self._powers)] = self._coeffs
+        coeffs_2[:, np.searchsorted(powers, other._powers)] = other._coeffs
+        return coeffs_1, coeffs_2, powers
+
+    def __add__(self, other: "PolynomialArray") -> "PolynomialArray":
+        """
+        >>> batch = PolynomialArray([[1, 2], [3, 4]], [0, 1]) + PolynomialArray([[1], [1]], [2])
+        >>> batch.get_coeffs().tolist()
+        [[1.0, 2.0, 1.0], [3.0, 4.0, 1.0]]
+        """
+
+        coeffs_1, coeffs_2, powers = self._align(other)
+        return self._from_arrays(coeffs_1 + coeffs_2, powers)
+
+    def __sub__(self, other: "PolynomialArray") -> "PolynomialArray":
+        coeffs_1, coeffs_2, powers = self._align(other)
+        return self._from_arrays(coeffs_1 - coeffs_2, powers)
+
+    def __mul__(self, other: "PolynomialArray") -> "PolynomialArray":
+        """
+        Multiplies the batches row by row. Dense integer power grids are convolved column by column of the narrower
+        factor; other grids form all pairwise column products at once and sum them onto the product's power grid
+        with one weighted bincount.
+
+        >>> batch = PolynomialArray([[1, 1], [2, 0]], [0, 1]) * PolynomialArray([[-1, 1], [1, 1]], [0, 1])
+        >>> [poly.get_poly() for poly in batch.to_polynomials()]
+        [[(-1.0, 0), (1.0, 2)], [(2.0, 0), (2.0, 1)]]
+        """
+
+        if len(self) != len(other):
+            raise ValueError("PolynomialArrays must contain the same number of polynomials.")
+        if self._is_dense_integer_grid() and other._is_dense_integer_grid():
+            return self._convolve(other)
+        pair_powers = np.add.outer(self._powers, other._powers).ravel()
+        powers, columns = np.unique(pair_powers, return_inverse=True)
+        products = (self._coeffs[:, :, None] * other._coeffs[:, None, :]).reshape(len(self), -1)
+        bins = (np.arange(len(self))[:, None] * len(powers) + columns.ravel()).ravel()
+        coeffs = np.bincount(bins, weights=products.ravel(), minlength=len(self) * len(powers))
+        return self._from_arrays(coeffs.reshape(len(self), len(powers)), powers)
+
+    def _is_dense_integer_grid(self) -> bool:
+        powers = self._powers
+        if not len(powers) or not np.all(powers == np.round(powers)):
+            return False
+        return len(powers) >= self.convolution_density * (powers[-1] - powers[0] + 1)
+
+    def _to_dense(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Spreads the coefficients of an integer power grid over every power from the lowest to the highest."""
+
+        offsets = (self._powers - self._powers[0]).astype(int)
+        dense = np.zeros((len(self), offsets[-1] + 1))
+        dense[:, offsets] = self._coeffs
+        present = np.zeros(offsets[-1] + 1)
+        present[offsets] = 1
+        return dense, present
+
+    def _convolve(self, other: "PolynomialArray") -> "PolynomialArray":
+        """Multiplies two integer power grids as row-wise convolutions, keeping only the reachable powers."""
+
+        dense_1, present_1 = self._to_dense()
+        dense_2, present_2 = other._to_dense()
+        if dense_1.shape[1] > dense_2.shape[1]:
+            dense_1, dense_2 = dense_2, dense_1
+        width = dense_2.shape[1]
+        coeffs = np.zeros((len(self), dense_1.shape[1] + width - 1))
+        for column in range(dense_1.shape[1]):
+            coeffs[:, column:column + width] += dense_1[:, column, None] * dense_2
+        keep = np.convolve(present_1, present_2) > 0
+        powers = np.arange(len(keep), dtype=float) + (self._powers[0] + other._powers[0])
+        return self._from_arrays(coeffs[:, keep], powers[keep])
+
+    def derive(self) -> None:
+        """
+        Converts every polynomial of the batch into its derivative.
+
+        >>> batch = PolynomialArray([[5, 1, 2], [1, 0, 3]], [0, 1, 3])
+        >>> batch.derive()
+        >>> [poly.get_poly() for poly in batch.to_polynomials()]
+        [[(1.0, 0), (6.0, 2)], [(9.0, 2)]]
+        """
+
+        keep = self._powers != 0
+        self._coeffs = self._coeffs[:, keep] * self._powers[keep]
+        self._powers = self._powers[keep] - 1
+
+    def integrate(self, constant: Union[int, float, Sequence[Union[int, float]]]) -> None:
+        """
+        Converts every polynomial of the batch into its integral with a constant, or one constant per polynomial.
+
+        >>> batch = PolynomialArray([[2, 3], [4, 0]], [0, 2])
+        >>> batch.integrate([1, 2])
+        >>> [poly.get_poly() for poly in batch.to_polynomials()]
+        [[(1.0, 0), (2.0, 1), (1.0, 3)], [(2.0, 0), (4.0, 1)]]
+        """
+
+        if np.any(self._powers == -1):
+            raise ValueError("PolynomialArray class does not support integration of forms a*X^-1")
+        powers = self._powers + 1
+        index = np.searchsorted(powers, 0)
+        self._coeffs = np.insert(self._coeffs / powers, index, constant, axis=1)
+        self._powers = np.insert(powers, index, 0)
+
+    def evaluate(self, x: Union[int, float, Sequence[Union[int, float]], np.ndarray]) -> np.ndarray:
+        """
+        Evaluates every polynomial of the batch at x. Returns a vector with one value per polynomial for a scalar x,
+        else a matrix with one row per polynomial and one column per point.
+
+        >>> PolynomialArray([[1, 2], [0, 3]], [0, 2]).evaluate([1, 2]).tolist()
+        [[3.0, 9.0], [3.0, 12.0]]
+        """
+
+        points = np.asarray(x, dtype=float)
+        table = np.power.outer(points, self._powers)
+        return self._coeffs @ table.T if points.ndim else self._coeffs @ table
+
+    def __call__(self, x):
+        return self.evaluate(x)
@@ -0,0 +1,99 @@
+from collections.abc import Sequence
+import mmap
+import struct
+import sys
+from typing import Iterable, List, Union
+
+from polynomial import CompactPolynomial, Polynomial
+
+# File layout: magic, the records written by Polynomial.to_bytes back to back, an index of every record's
+# offset as little endian unsigned 64 bit ints, and a footer holding the index offset, the record count and
+# the magic again.
+_FILE_MAGIC = b"POLYFILE"
+_FOOTER = struct.Struct("<QQ8s")
+
+
+class PolynomialFile(Sequence):
+    """
+    Read only sequence of the polynomials stored in a file written by PolynomialFile.write.
+
+    The file is memory mapped and polynomials are loaded lazily on indexing as CompactPolynomials viewing the
+    mapping, so opening a file reads only its index and loading a polynomial copies none of its terms.
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "polys.bin")
+    >>> PolynomialFile.write(path, [Polynomial([(2, 3), (5, -2)]), Polynomial([1, 2])])
+    2
+    >>> with PolynomialFile(path) as polys:
+    ...     [poly.get_poly() for poly in polys]
+    [[(5, -2), (2, 3)], [(1, 0), (2, 1)]]
+    """
+
+    __slots__ = ("_file", "_map", "_view", "_offsets")
+
+    def __init__(self, path: str):
+        self._offsets = []
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("Not a polynomial file.")
+        self._view = memoryview(self._map)
+        if len(self._view) < len(_FILE_MAGIC) + _FOOTER.size or self._view[:len(_FILE_MAGIC)] != _FILE_MAGIC:
+            self.close()
+            raise ValueError("Not a polynomial file.")
+        index_offset, count, magic = _FOOTER.unpack_from(self._view, len(self._view) - _FOOTER.size)
+        if magic != _FILE_MAGIC:
+            self.close()
+            raise ValueError("Not a polynomial file.")
+        self._offsets = self._view[index_offset:index_offset + 8 * count].cast("Q")
+        if sys.byteorder == "big":
+            self._offsets = [int.from_bytes(self._view[i:i + 8], "little")
+                             for i in range(index_offset, index_offset + 8 * count, 8)]
+
+    @staticmethod
+    def write(path: str, polys: Iterable[Polynomial]) -> int:
+        """Streams polynomials into a new file at path and returns how many were written."""
+
+        offsets = []
+        with open(path, "wb") as file:
+            file.write(_FILE_MAGIC)
+            position = len(_FILE_MAGIC)
+            for poly in polys:
+                record = poly.to_bytes()
+                offsets.append(position)
+                file.write(record)
+                position += len(record)
+            file.write(b"".join(offset.to_bytes(8, "little") for offset in offsets))
+            file.write(_FOOTER.pack(position, len(offsets), _FILE_MAGIC))
+        return len(offsets)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[CompactPolynomial, List[CompactPolynomial]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return CompactPolynomial.from_bytes(self._view, self._offsets[index])
+
+    def close(self) -> None:
+        """
+        Closes the file. Loaded polynomials view the memory map, so the map itself stays open until they are
+        all released.
+        """
+
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._view.release()
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
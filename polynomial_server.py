@@ -0,0 +1,387 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from fractions import Fraction
+import itertools
+import json
+import math
+import time
+from typing import Any, Dict, List, Tuple, Union
+
+from polynomial import Polynomial
+
+
+def _encode(value: Any) -> Any:
+    """JSON fallback for Fraction coefficients and complex values, sent as floats and [real, imag] pairs."""
+
+    if isinstance(value, Fraction):
+        return float(value)
+    if isinstance(value, complex):
+        return [value.real, value.imag]
+    raise TypeError("Cannot encode {}".format(type(value).__name__))
+
+
+class PolynomialServer:
+    """
+    Asyncio TCP server exposing Polynomial operations to other services.
+
+    The protocol is one JSON object per line each way. Requests look like
+    {"id": 1, "op": "mul", "args": ["2X + 1", "X^2 - 3"]} and are answered with {"id": 1, "result": ...} or
+    {"id": 1, "error": "..."}, not necessarily in request order. The operations are
+
+    - "mul" and "add" of two polynomials,
+    - "derive" of a polynomial,
+    - "integrate" of a polynomial, with an optional integration constant (default 0),
+    - "evaluate" of a polynomial at a number,
+    - "metrics", answered immediately with metrics().
+
+    Polynomials are either strings in the format str() emits or lists of [coefficient, power] pairs as get_poly()
+    returns them, and polynomial results come back in the format of the first operand.
+
+    Requests arriving within batch_window seconds of each other are coalesced into one batch of at most
+    max_batch_size requests. A batch parses every distinct operand once and evaluates every polynomial at all its
+    requested points together, through its compiled evaluator once it has compile_min_points of them. With more
+    than one worker, batches holding at least offload_min_terms operand terms are split across a process pool so
+    that they do not stall the event loop.
+
+    >>> async def main():
+    ...     async with PolynomialServer() as server:
+    ...         async with PolynomialClient(*server.address) as client:
+    ...             return await asyncio.gather(client.request("mul", "X + 1", "X - 1"),
+    ...                                         client.request("evaluate", [[1, 0], [2, 1]], 3))
+    >>> asyncio.run(main())
+    ['X^2 - 1', 7]
+    """
+
+    operations = {"mul", "add", "derive", "integrate", "evaluate"}
+    # Longest accepted request or response line, in bytes.
+    max_line_bytes = 1 << 26
+    # Number of most recent request latencies kept for the percentiles of metrics().
+    latency_samples = 10000
+
+    def __init__(self, batch_window: float = .002, max_batch_size: int = 1024, workers: int = 1,
+                 offload_min_terms: int = 100000, compile_min_points: int = 8):
+        if batch_window < 0:
+            raise ValueError("batch_window must not be negative")
+        if max_batch_size < 1 or workers < 1:
+            raise ValueError("max_batch_size and workers must be at least 1")
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.workers = workers
+        self.offload_min_terms = offload_min_terms
+        self.compile_min_points = compile_min_points
+        self.address = None
+        self._server = None
+        self._queue = None
+        self._batcher = None
+        self._executor = None
+        self._tasks = set()
+        self._connections = set()
+        self._latencies = deque(maxlen=self.latency_samples)
+        self._counters = {"requests": 0, "errors": 0, "batches": 0, "offloaded_batches": 0}
+        self._first_arrival = None
+        self._last_completion = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, int]:
+        """Starts listening, on a free port by default, and returns the (host, port) address."""
+
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.ensure_future(self._batch_loop())
+        self._server = await asyncio.start_server(self._handle_connection, host, port, limit=self.max_line_bytes)
+        self.address = self._server.sockets[0].getsockname()[:2]
+        return self.address
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._connections):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._batcher is not None:
+            self._batcher.cancel()
+            await asyncio.gather(self._batcher, *self._tasks, return_exceptions=True)
+            self._batcher = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def submit(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Queues one decoded request for the next batch and returns its response."""
+
+        arrival = time.perf_counter()
+        if self._first_arrival is None:
+            self._first_arrival = arrival
+        if request.get("op") == "metrics":
+            response = {"result": self.metrics()}
+        else:
+            future = asyncio.get_running_loop().create_future()
+            await self._queue.put((request.get("op"), request.get("args", []), future))
+            response = await future
+        if "id" in request:
+            response["id"] = request["id"]
+        self._counters["requests"] += 1
+        self._counters["errors"] += "error" in response
+        self._last_completion = time.perf_counter()
+        self._latencies.append(self._last_completion - arrival)
+        return response
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        async def respond(line: bytes) -> None:
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Requests must be JSON objects.")
+            except ValueError as error:
+                response = {"error": str(error)}
+                self._counters["requests"] += 1
+                self._counters["errors"] += 1
+            else:
+                response = await self.submit(request)
+            try:
+                data = json.dumps(response, default=_encode, allow_nan=False)
+            except ValueError:
+                # JSON has no infinities or nan, which float results overflow into.
+                response = {key: value for key, value in response.items() if key == "id"}
+                response["error"] = "Result is not finite"
+                self._counters["errors"] += 1
+                data = json.dumps(response)
+            writer.write(data.encode() + b"\n")
+            await writer.drain()
+
+        pending = set()
+        self._connections.add(writer)
+        try:
+            async for line in reader:
+                if line.strip():
+                    task = asyncio.ensure_future(respond(line))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+            await asyncio.gather(*pending, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _batch_loop(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            self._drain(batch)
+            if len(batch) < self.max_batch_size:
+                await asyncio.sleep(self.batch_window)
+                self._drain(batch)
+            self._counters["batches"] += 1
+            requests = [(operation, args) for operation, args, _ in batch]
+            futures = [future for _, _, future in batch]
+            if self.workers > 1 and self._batch_terms(requests) >= self.offload_min_terms:
+                self._counters["offloaded_batches"] += 1
+                task = asyncio.ensure_future(self._offload(requests, futures))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            else:
+                try:
+                    responses = self.process_batch(requests, self.compile_min_points)
+                except Exception as error:
+                    responses = [{"error": "Batch failed: {}".format(error)}] * len(requests)
+                self._resolve(futures, responses)
+
+    def _drain(self, batch: List[tuple]) -> None:
+        while len(batch) < self.max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    @staticmethod
+    def _batch_terms(requests: List[Tuple[str, list]]) -> int:
+        terms = 0
+        for _, args in requests:
+            for arg in args if isinstance(args, list) else ():
+                if isinstance(arg, list):
+                    terms += len(arg)
+                elif isinstance(arg, str):
+                    # Roughly one term per sign, which is all the offloading decision needs.
+                    terms += arg.count("+") + arg.count("-") + 1
+        return terms
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    async def _offload(self, requests: List[Tuple[str, list]], futures: List[asyncio.Future]) -> None:
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        chunks = Polynomial._split(requests, self.workers)
+        results = await asyncio.gather(*[loop.run_in_executor(executor, PolynomialServer.process_batch, chunk,
+                                                              self.compile_min_points) for chunk in chunks],
+                                       return_exceptions=True)
+        responses = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                result = [{"error": "Worker failed: {}".format(result)}] * len(chunk)
+            responses.extend(result)
+        self._resolve(futures, responses)
+
+    @staticmethod
+    def _resolve(futures: List[asyncio.Future], responses: List[Dict[str, Any]]) -> None:
+        for future, response in zip(futures, responses):
+            if not future.done():
+                future.set_result(dict(response))
+
+    @staticmethod
+    def _to_poly(arg: Union[str, list], polys: Dict[Any, Polynomial]) -> Polynomial:
+        """Parses an operand, reusing the polynomial already parsed from an identical operand in the batch."""
+
+        # repr keeps 1 and 1.0 apart, which format differently.
+        key = arg if isinstance(arg, str) else ("terms", repr(arg))
+        if key not in polys:
+            if isinstance(arg, str):
+                polys[key] = Polynomial.parse(arg)
+            elif isinstance(arg, list) and all(isinstance(term, list) and len(term) == 2 for term in arg):
+                polys[key] = Polynomial([tuple(term) for term in arg]) if arg else Polynomial([])
+            else:
+                raise ValueError("Polynomials must be strings or lists of [coefficient, power] pairs.")
+        return polys[key]
+
+    @staticmethod
+    def _format(poly: Polynomial, like: Union[str, list]) -> Union[str, list]:
+        return str(poly) if isinstance(like, str) else [list(term) for term in poly.get_poly()]
+
+    @classmethod
+    def process_batch(cls, requests: List[Tuple[str, list]], compile_min_points: int = 8) -> List[Dict[str, Any]]:
+        """
+        Computes a batch of (operation, args) requests, returning one {"result": ...} or {"error": ...} response
+        per request.
+
+        >>> PolynomialServer.process_batch([("derive", ["X^3"]), ("evaluate", ["X^3", 2]), ("pow", [])])
+        [{'result': '3X^2'}, {'result': 8}, {'error': "Unknown operation 'pow'"}]
+        """
+
+        polys = {}
+        responses = [None] * len(requests)
+        # Evaluation points per distinct polynomial, with the indices of the requests asking for them.
+        evaluations = {}
+        for index, (operation, args) in enumerate(requests):
+            try:
+                if operation not in cls.operations:
+                    raise ValueError("Unknown operation {!r}".format(operation))
+                if not isinstance(args, list) or not args:
+                    raise ValueError("args must be a non-empty list")
+                poly = cls._to_poly(args[0], polys)
+                if operation in {"mul", "add"}:
+                    if len(args) != 2:
+                        raise ValueError("{} takes two polynomials".format(operation))
+                    other = cls._to_poly(args[1], polys)
+                    result = cls._format(poly * other if operation == "mul" else poly + other, args[0])
+                elif operation == "derive":
+                    result = cls._format(Polynomial.get_derivative(poly), args[0])
+                elif operation == "integrate":
+                    constant = args[1] if len(args) > 1 else 0
+                    if type(constant) not in {int, float}:
+                        raise ValueError("The integration constant must be a number.")
+                    result = cls._format(Polynomial.get_integral(poly, constant), args[0])
+                else:
+                    if len(args) != 2 or type(args[1]) not in {int, float}:
+                        raise ValueError("evaluate takes a polynomial and a number")
+                    evaluations.setdefault(id(poly), (poly, []))[1].append((index, args[1]))
+                    continue
+                responses[index] = {"result": result}
+            except (ValueError, TypeError, ArithmeticError) as error:
+                responses[index] = {"error": str(error)}
+        for poly, points in evaluations.values():
+            evaluate = poly.compile() if len(points) >= compile_min_points else poly.evaluate
+            for index, x in points:
+                try:
+                    responses[index] = {"result": evaluate(x)}
+                except (ValueError, TypeError, ArithmeticError) as error:
+                    responses[index] = {"error": str(error)}
+        return responses
+
+    def metrics(self) -> Dict[str, Union[int, float]]:
+        """
+        Returns the request, error, batch and offloaded batch counts, the mean batch size, the throughput in
+        requests per second from the first request to the latest response, and the median and 99th percentile
+        latencies in seconds over the most recent latency_samples requests.
+        """
+
+        latencies = sorted(self._latencies)
+
+        def percentile(fraction: float) -> float:
+            return latencies[max(math.ceil(fraction * len(latencies)) - 1, 0)] if latencies else 0.0
+
+        counters = self._counters
+        elapsed = self._last_completion - self._first_arrival if self._last_completion is not None else 0.0
+        return dict(counters, **{
+            "mean_batch_size": (counters["requests"] / counters["batches"]) if counters["batches"] else 0.0,
+            "throughput": counters["requests"] / elapsed if elapsed > 0 else 0.0,
+            "p50_latency": percentile(.5),
+            "p99_latency": percentile(.99),
+        })
+
+
+class PolynomialClient:
+    """
+    Client for a PolynomialServer. Requests are pipelined over one connection, so concurrent calls to request
+    share it and can be batched together by the server.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._host = host
+        self._port = port
+        self._reader = None
+        self._writer = None
+        self._receiver = None
+        self._pending = {}
+        self._ids = itertools.count()
+
+    async def connect(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(self._host, self._port,
+                                                                   limit=PolynomialServer.max_line_bytes)
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._receiver.cancel()
+            await asyncio.gather(self._receiver, return_exceptions=True)
+            self._writer = None
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _receive(self) -> None:
+        try:
+            async for line in self._reader:
+                response = json.loads(line)
+                future = self._pending.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Connection to the server was closed."))
+            self._pending.clear()
+
+    async def request(self, operation: str, *args: Any) -> Any:
+        """Sends one request and returns its result, raising ValueError with the server's message on errors."""
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._writer.write(json.dumps({"id": request_id, "op": operation, "args": list(args)},
+                                      default=_encode).encode() + b"\n")
+        await self._writer.drain()
+        response = await future
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response["result"]
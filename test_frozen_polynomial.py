@@ -0,0 +1,71 @@
+import unittest
+import pickle
+from frozen_polynomial import FrozenPolynomial, OperationCache
+from polynomial import Polynomial
+
+
+class TestFrozenPolynomial(unittest.TestCase):
+
+    def setUp(self):
+        FrozenPolynomial.clear_cache()
+        FrozenPolynomial.set_cache_size(1024)
+        self.poly_1 = FrozenPolynomial([(3, 4), (-2, 1), (5, 0)])
+        self.poly_2 = FrozenPolynomial([(1, 2), (4, -1)])
+
+    def test_interning(self):
+        self.assertIs(FrozenPolynomial([(5, 0), (-2, 1), (3, 4)]), self.poly_1)
+        self.assertIs(FrozenPolynomial.from_sorted_terms(list(self.poly_1.get_poly())), self.poly_1)
+        self.assertIsNot(FrozenPolynomial([(5.0, 0)]), FrozenPolynomial([(5, 0)]))
+        self.assertIs(pickle.loads(pickle.dumps(self.poly_1)), self.poly_1)
+
+    def test_hash_and_equality(self):
+        self.assertEqual(hash(self.poly_1), hash(FrozenPolynomial([(3, 4), (-2, 1), (5, 0)])))
+        self.assertEqual(self.poly_1, Polynomial([(3, 4), (-2, 1), (5, 0)]))
+        self.assertEqual(Polynomial([(3, 4), (-2, 1), (5, 0)]), self.poly_1)
+        self.assertNotEqual(self.poly_1, self.poly_2)
+        self.assertEqual(len({self.poly_1, self.poly_2, FrozenPolynomial([(1, 2), (4, -1)])}), 2)
+
+    def test_immutable(self):
+        for method, args in (("add", (self.poly_2,)), ("subtract", (self.poly_2,)), ("mul", (self.poly_2,)),
+                             ("constant_mul", (2,)), ("derive", ()), ("integrate", (1,)),
+                             ("set_poly", ([(1, 1)],)), ("set_term", (1, 2)), ("add_term", (1, 2))):
+            self.assertRaises(TypeError, getattr(self.poly_1, method), *args)
+        self.assertRaises(AttributeError, setattr, self.poly_1, "extra", 1)
+
+    def test_operations_match_polynomial(self):
+        poly_1 = Polynomial(list(self.poly_1.get_poly()))
+        poly_2 = Polynomial(list(self.poly_2.get_poly()))
+        self.assertEqual((self.poly_1 + self.poly_2).get_poly(), tuple((poly_1 + poly_2).get_poly()))
+        self.assertEqual((self.poly_1 - self.poly_2).get_poly(), tuple((poly_1 - poly_2).get_poly()))
+        self.assertEqual((self.poly_1 * self.poly_2).get_poly(), tuple((poly_1 * poly_2).get_poly()))
+        self.assertIsInstance(self.poly_1 * self.poly_2, FrozenPolynomial)
+        self.assertEqual(FrozenPolynomial.get_derivative(self.poly_1), Polynomial.get_derivative(poly_1))
+        self.assertEqual(FrozenPolynomial.get_integral(self.poly_1, 2), Polynomial.get_integral(poly_1, 2))
+        self.assertEqual(str(self.poly_1), str(poly_1))
+
+    def test_cache_statistics(self):
+        product = self.poly_1 * self.poly_2
+        self.assertIs(self.poly_1 * self.poly_2, product)
+        FrozenPolynomial.get_derivative(self.poly_1)
+        FrozenPolynomial.get_derivative(self.poly_1)
+        FrozenPolynomial.get_integral(self.poly_1, 1)
+        self.assertEqual(FrozenPolynomial.cache_info(), {"hits": 2, "misses": 3, "size": 3, "maxsize": 1024})
+        self.poly_1 + Polynomial([1])
+        self.assertEqual(FrozenPolynomial.cache_info()["size"], 3)
+
+    def test_cache_eviction(self):
+        cache = OperationCache(maxsize=2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("b", lambda: 2)
+        cache.get_or_compute("a", lambda: 1)
+        cache.get_or_compute("c", lambda: 3)
+        self.assertEqual(cache.get_or_compute("b", lambda: 4), 4)
+        self.assertEqual(cache.info(), {"hits": 1, "misses": 4, "size": 2, "maxsize": 2})
+        FrozenPolynomial.set_cache_size(0)
+        self.poly_1 * self.poly_2
+        self.assertEqual(FrozenPolynomial.cache_info()["size"], 0)
+        self.assertRaises(ValueError, cache.resize, -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from polynomial import CompactPolynomial, Polynomial
+from frozen_polynomial import FrozenPolynomial
+from instrumentation import Instrumentation
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def test_counts_and_terms(self):
+        poly_1 = Polynomial([1, 2, 3])
+        poly_2 = Polynomial([(4, 5)])
+        with Instrumentation() as instrumentation:
+            poly_1 + poly_2
+            poly_1.mul(poly_2)
+            poly_1.derive()
+            poly_1.integrate(1)
+            str(poly_1)
+            CompactPolynomial([1, 2])
+        stats = instrumentation.stats()
+        self.assertEqual((stats["__add__"]["calls"], stats["__add__"]["terms"]), (1, 4))
+        self.assertEqual((stats["mul"]["calls"], stats["mul"]["terms"]), (1, 4))
+        self.assertEqual([stats[name]["calls"] for name in ("derive", "integrate", "__str__", "__init__")],
+                         [1, 1, 1, 1])
+        self.assertEqual(stats["__init__"]["terms"], 2)
+        self.assertGreater(stats["__add__"]["seconds"], 0)
+        instrumentation.reset()
+        self.assertEqual(instrumentation.stats()["__add__"]["calls"], 0)
+
+    def test_disable_restores_methods(self):
+        methods = dict(Polynomial.__dict__)
+        instrumentation = Instrumentation()
+        instrumentation.enable()
+        self.assertTrue(instrumentation.enabled)
+        self.assertIsNot(Polynomial.__dict__["__add__"], methods["__add__"])
+        self.assertRaises(RuntimeError, Instrumentation().enable)
+        instrumentation.disable()
+        self.assertFalse(instrumentation.enabled)
+        self.assertEqual(dict(Polynomial.__dict__), methods)
+        frozen_mul = FrozenPolynomial.__dict__["__mul__"]
+        with Instrumentation(FrozenPolynomial):
+            self.assertIn("__str__", FrozenPolynomial.__dict__)
+        self.assertNotIn("__str__", FrozenPolynomial.__dict__)
+        self.assertIs(FrozenPolynomial.__dict__["__mul__"], frozen_mul)
+
+    def test_sampling(self):
+        poly = Polynomial([1, 2])
+        with Instrumentation(sample_every=10) as instrumentation:
+            for _ in range(95):
+                poly + poly
+        stats = instrumentation.stats()["__add__"]
+        self.assertEqual((stats["calls"], stats["sampled"], stats["terms"]), (95, 9, 36))
+        self.assertRaises(ValueError, Instrumentation, sample_every=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
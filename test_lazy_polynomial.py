@@ -0,0 +1,58 @@
+import unittest
+import random
+from polynomial import Polynomial
+from lazy_polynomial import LazyPolynomial
+from instrumentation import Instrumentation
+
+
+class TestLazyPolynomial(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(18)
+        self.polys = [Polynomial.create_random_polynomial() for _ in range(6)]
+
+    def test_matches_eager(self):
+        p1, p2, p3, p4, p5, p6 = self.polys
+        eager = Polynomial.get_derivative(Polynomial.get_derivative(p1 * p2 * p3 + p3 - p4) * p5 - p6)
+        lazy = ((LazyPolynomial(p1) * p2 * p3 + p3 - p4).get_derivative() * p5 - p6).get_derivative()
+        self.assertEqual(lazy.get_poly(), eager.get_poly())
+        self.assertEqual(str(lazy), str(eager))
+        self.assertEqual(lazy.force().get_poly(), eager.get_poly())
+        self.assertEqual((1 - LazyPolynomial(p1) + 2.5).get_poly(), (Polynomial([3.5]) - p1).get_poly())
+        self.assertEqual((LazyPolynomial(p1) - p1).get_poly(), [(0, 0)])
+        self.assertRaises(TypeError, LazyPolynomial(p1).__add__, "X")
+
+    def test_evaluate_without_expanding(self):
+        p1, p2, p3, p4, p5, p6 = self.polys
+        eager = Polynomial.get_derivative(Polynomial.get_derivative(p1 * p2) * p3 - p4)
+        lazy = ((LazyPolynomial(p1) * p2).get_derivative() * p3 - p4).get_derivative()
+        with Instrumentation() as instrumentation:
+            values = lazy.evaluate([-1, 2, 3])
+        self.assertEqual(instrumentation.stats()["__mul__"]["calls"], 0)
+        self.assertEqual(values, eager.evaluate([-1, 2, 3]))
+        self.assertEqual(lazy(2), eager(2))
+
+    def test_common_subexpressions(self):
+        p1, p2, p3 = self.polys[:3]
+        product = LazyPolynomial(p1) * p2
+        expression = product + product * p3 + LazyPolynomial(p1) * p2 - 2 * product
+        with Instrumentation() as instrumentation:
+            result = expression.get_poly()
+        self.assertEqual(instrumentation.stats()["__mul__"]["calls"], 2)
+        self.assertEqual(result, (p1 * p2 * p3).get_poly())
+
+    def test_fused_sum(self):
+        lazy = LazyPolynomial(self.polys[0])
+        for poly in self.polys[1:]:
+            lazy = lazy + poly
+        with Instrumentation() as instrumentation:
+            result = lazy.get_derivative().get_poly()
+        self.assertEqual(instrumentation.stats()["__add__"]["calls"], 0)
+        eager = self.polys[0]
+        for poly in self.polys[1:]:
+            eager = eager + poly
+        self.assertEqual(result, Polynomial.get_derivative(eager).get_poly())
+
+
+if __name__ == "__main__":
+    unittest.main()
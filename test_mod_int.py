@@ -0,0 +1,38 @@
+import unittest
+from fractions import Fraction
+from mod_int import ModInt
+
+
+class TestModInt(unittest.TestCase):
+
+    def test_arithmetic(self):
+        a = ModInt(10, 13)
+        b = ModInt(-4, 13)
+        self.assertEqual((a + b, a - b, a * b, a / b), (ModInt(6, 13), ModInt(1, 13), ModInt(12, 13), ModInt(4, 13)))
+        self.assertEqual((3 - a, 2 / a, a ** 12), (ModInt(6, 13), ModInt(8, 13), ModInt(1, 13)))
+        self.assertEqual(a + Fraction(1, 2), ModInt(4, 13))
+        self.assertRaises(ZeroDivisionError, a.__truediv__, 13)
+        self.assertRaises(ValueError, a.__add__, ModInt(1, 7))
+
+    def test_comparisons(self):
+        a = ModInt(12, 5)
+        self.assertTrue(a == 2 and a == 2.0 and a != 7 and a != -3 and a != 3 and a != ModInt(2, 7))
+        self.assertEqual(len({a, 2, 2.0}), 1)
+        self.assertEqual(len({a, 7}), 2)
+        self.assertFalse(ModInt(5, 5))
+        self.assertFalse(a < 0)
+        self.assertEqual((int(a), str(a), repr(a)), (2, "2", "ModInt(2, 5)"))
+
+    def test_crt(self):
+        primes = ModInt.primes_for_bound(10 ** 40)
+        for value in (0, 1, -1, 10 ** 40, -(10 ** 40) + 7):
+            self.assertEqual(ModInt.crt([value % p for p in primes], primes), value)
+
+    def test_is_prime(self):
+        primes = [n for n in range(2, 2000) if all(n % d for d in range(2, int(n ** .5) + 1))]
+        self.assertEqual([n for n in range(2000) if ModInt._is_prime(n)], primes)
+        self.assertFalse(ModInt._is_prime(3215031751))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import random
+from multi_polynomial import MultiPolynomial
+from polynomial import Polynomial
+
+
+class TestMultiPolynomial(unittest.TestCase):
+
+    def setUp(self):
+        self.poly_1 = MultiPolynomial([(3, (2, 1, 3)), (-7, (1, 1, 0)), (1, (0, 0, 3)), (5, (0, 0, 0))])
+        self.poly_2 = MultiPolynomial([(2, (1, 0, 0)), (7, (1, 1, 0)), (-1, (0, 2, 1))])
+
+    def test_init(self):
+        self.assertEqual(self.poly_1.get_poly(), [(5, (0, 0, 0)), (-7, (1, 1, 0)), (1, (0, 0, 3)), (3, (2, 1, 3))])
+        self.assertEqual(len(MultiPolynomial([(1, (1, 0, 0)), (-1, (1, 0, 0))])), 0)
+        self.assertRaises(ValueError, MultiPolynomial, [(1, (1, 2))])
+        self.assertRaises(ValueError, MultiPolynomial, [(1, (-1, 0, 0))])
+        self.assertRaises(ValueError, MultiPolynomial, [("1", (1, 0, 0))])
+        self.assertRaises(ValueError, MultiPolynomial, [(1, (1 << 15, 0, 0))])
+
+    def test_add_subtract(self):
+        self.assertEqual(str(self.poly_1 + self.poly_2), "3X^2YZ^3 - Y^2Z + Z^3 + 2X + 5")
+        self.assertEqual(str(self.poly_1 - self.poly_2), "3X^2YZ^3 + Y^2Z + Z^3 - 14XY - 2X + 5")
+        self.assertEqual(len(self.poly_1 - self.poly_1), 0)
+
+    def test_multiply(self):
+        random.seed(42)
+        point = (1.5, -2, .5)
+        for _ in range(5):
+            poly_1 = MultiPolynomial([(random.randint(-5, 5), tuple(random.randint(0, 4) for _ in range(3)))
+                                      for _ in range(20)])
+            poly_2 = MultiPolynomial([(random.randint(-5, 5), tuple(random.randint(0, 4) for _ in range(3)))
+                                      for _ in range(20)])
+            self.assertAlmostEqual((poly_1 * poly_2)(*point), poly_1(*point) * poly_2(*point))
+
+    def test_multiply_overflow(self):
+        poly = MultiPolynomial([(1, (200,))], ("X",), exponent_bits=9)
+        self.assertRaises(OverflowError, poly.__mul__, poly)
+
+    def test_partial_derivative(self):
+        self.assertEqual(str(self.poly_1.get_partial_derivative("X")), "6XYZ^3 - 7Y")
+        self.poly_1.derive("Y")
+        self.assertEqual(str(self.poly_1), "3X^2Z^3 - 7X")
+
+    def test_evaluate(self):
+        self.assertEqual(self.poly_1.evaluate({"X": 1, "Y": 2, "Z": 3}), 3 * 2 * 27 - 14 + 27 + 5)
+        self.assertEqual(self.poly_1(1, 2, 3), 3 * 2 * 27 - 14 + 27 + 5)
+
+    def test_univariate_matches_polynomial(self):
+        poly_1 = Polynomial([4, 2, 0, 5])
+        poly_2 = Polynomial([(1, 4), (-3, 1)])
+        multi_1 = MultiPolynomial.from_polynomial(poly_1)
+        multi_2 = MultiPolynomial.from_polynomial(poly_2)
+        self.assertEqual((multi_1 * multi_2).to_polynomial().get_poly(), (poly_1 * poly_2).get_poly())
+        self.assertEqual((multi_1 + multi_2).to_polynomial().get_poly(), (poly_1 + poly_2).get_poly())
+        self.assertRaises(ValueError, self.poly_1.to_polynomial)
+
+
+if __name__ == "__main__":
+    unittest.main()
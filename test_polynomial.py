@@ -1,6 +1,14 @@
+import copy
+import io
+import math
 import unittest
+from unittest import mock
 import random
-from polynomial import Polynomial
+from fractions import Fraction
+import mod_int
+import pickle
+import polynomial
+from polynomial import CompactPolynomial, Polynomial, np
 
 
 test_polynomial_1 = Polynomial([(6.3, -13.2), (3, -11), (8, 6), (4, 9), (-4, 8), (9, 9), (2, 6), (2, 5.6), (10, 1), (-7, 0)])
@@ -104,12 +112,275 @@ class TestPolynomial(unittest.TestCase):
         poly_target_str = "-15X^-11 - 15X^-7 - 21X^6 - 18X^4 + 9X^-4 + 35X^3 + 30X^-3 + 30X + 35X^-1"
         self.assertEqual(str(mul), poly_target_str)
 
+    def test_from_sorted_terms(self):
+        poly = Polynomial.from_sorted_terms(self.poly_1.get_poly())
+        self.assertEqual(poly.get_poly(), self.poly_1.get_poly())
+        self.assertEqual(Polynomial.from_sorted_terms([]).get_poly(), [(0, 0)])
+        self.assertEqual(type(CompactPolynomial.from_sorted_terms([(1, 2)])), CompactPolynomial)
+
+    def test_operations_with_zero_polynomial(self):
+        zero = Polynomial([])
+        self.assertEqual((zero + self.poly_1).get_poly(), self.poly_1.get_poly())
+        self.assertEqual((self.poly_1 - zero).get_poly(), self.poly_1.get_poly())
+        self.assertEqual((zero - zero).get_poly(), [(0, 0)])
+        self.assertEqual((self.poly_1 - self.poly_1).get_poly(), [(0, 0)])
+        self.assertEqual((zero * self.poly_2).get_poly(), [(0, 0)])
+        self.assertEqual(Polynomial.get_derivative(zero).get_poly(), [(0, 0)])
+        self.assertEqual(Polynomial.get_integral(zero, 0).get_poly(), [(0, 0)])
+        self.assertEqual(Polynomial.get_integral(Polynomial([(3, 2)]), 0).get_poly(), [(1.0, 3)])
+
+    def test_cancelling_terms_are_dropped(self):
+        product = Polynomial([(1, 1), (1, 0)]) * Polynomial([(1, 1), (-1, 0)])
+        self.assertEqual(product.get_poly(), [(-1, 0), (1, 2)])
+        self.assertEqual(str(product), "X^2 - 1")
+        self.assertEqual(len(product), 2)
+        self.assertEqual(product, Polynomial([(1, 2), (-1, 0)]))
+        self.assertEqual(Polynomial([(1, 1), (-1, 1), (2, 0)]).get_poly(), [(2, 0)])
+        self.assertEqual(Polynomial([(1, 1), (-1, 1)]).get_poly(), [(0, 0)])
+
+    def test_dense_multiplication_matches_sparse(self):
+        random.seed(1234)
+        int_terms_1 = [(random.randint(-50, 50) or 1, i) for i in range(-5, 150)]
+        int_terms_2 = [(random.randint(-50, 50) or 1, i) for i in range(90)]
+        float_terms_1 = [(random.randint(-50, 50) + .5, i) for i in range(120)]
+        float_terms_2 = [(random.randint(-50, 50) + .25, i) for i in range(3, 200)]
+        for terms_1, terms_2 in ((int_terms_1, int_terms_2), (float_terms_1, float_terms_2)):
+            poly_1 = Polynomial(terms_1)
+            poly_2 = Polynomial(terms_2)
+            self.assertTrue(Polynomial._use_dense_multiplication(poly_1.get_poly(), poly_2.get_poly()))
+            sparse = Polynomial._sparse_multiplication(poly_1.get_poly(), poly_2.get_poly())
+            self.assertEqual((poly_1 * poly_2).get_poly(), [term for term in sparse if term[0] != 0])
+
+    def test_dense_multiplication_threshold(self):
+        poly = Polynomial([1, 2, 3, 4])
+        self.assertFalse(Polynomial._use_dense_multiplication(poly.get_poly(), poly.get_poly()))
+        default_threshold = Polynomial.dense_multiplication_threshold
+        Polynomial.dense_multiplication_threshold = 2
+        try:
+            self.assertTrue(Polynomial._use_dense_multiplication(poly.get_poly(), poly.get_poly()))
+            self.assertEqual(str(poly * poly), "16X^6 + 24X^5 + 25X^4 + 20X^3 + 10X^2 + 4X + 1")
+        finally:
+            Polynomial.dense_multiplication_threshold = default_threshold
+
+    def test_dense_multiplication_falls_back_to_sparse(self):
+        fractional = [(1, i + .5) for i in range(100)]
+        negative_sparse = [(1, i * 10) for i in range(-50, 50)]
+        dense = [(1, i) for i in range(100)]
+        self.assertFalse(Polynomial._use_dense_multiplication(fractional, dense))
+        self.assertFalse(Polynomial._use_dense_multiplication(negative_sparse, dense))
+
+    def test_divmod(self):
+        dividend = Polynomial([(3, 5), (-2, 3), (1, 1), (7, 0)])
+        divisor = Polynomial([(2, 2), (1, 0)])
+        quotient, remainder = divmod(dividend, divisor)
+        self.assertEqual(quotient.get_poly(), [(-1.75, 1), (1.5, 3)])
+        self.assertEqual(remainder.get_poly(), [(2.75, 1), (7, 0)][::-1])
+        self.assertEqual((dividend // divisor).get_poly(), quotient.get_poly())
+        self.assertEqual((dividend % divisor).get_poly(), remainder.get_poly())
+        self.assertEqual((Polynomial([-1, 0, 1]) // Polynomial([1, 1])).get_poly(), [(-1, 0), (1, 1)])
+        small, rest = divmod(divisor, dividend)
+        self.assertEqual(small.get_poly(), [(0, 0)])
+        self.assertEqual(rest.get_poly(), divisor.get_poly())
+
+    def test_divmod_invalid(self):
+        self.assertRaises(ZeroDivisionError, divmod, self.poly_2, Polynomial([]))
+        self.assertRaises(ValueError, divmod, self.poly_1, Polynomial([1, 1]))
+        self.assertRaises(ValueError, divmod, Polynomial([1, 1]), Polynomial([(1, -1)]))
+
+    def test_newton_division_exact(self):
+        random.seed(77)
+        dividend = Polynomial([(Fraction(random.randint(-9, 9), random.randint(1, 9)), i) for i in range(300)])
+        divisor = Polynomial([(Fraction(random.randint(-9, 9), random.randint(1, 9)) or 1, i) for i in range(100)])
+        dividend_vector, divisor_vector = dividend._division_vectors(divisor)
+        self.assertEqual(Polynomial._newton_division(dividend_vector, divisor_vector),
+                         Polynomial._long_division(dividend_vector, divisor_vector))
+        quotient, remainder = divmod(dividend, divisor)
+        self.assertEqual((quotient * divisor + remainder).get_poly(), dividend.get_poly())
+        self.assertLess(remainder.get_degree(), divisor.get_degree())
+
+    def test_gcd(self):
+        common = Polynomial([3, -1, 2])
+        poly_1 = common * Polynomial([1, 4, 0, 1])
+        poly_2 = common * Polynomial([-5, 1])
+        self.assertEqual(Polynomial.gcd(poly_1, poly_2).get_poly(), common.get_poly())
+        self.assertEqual(Polynomial.gcd(Polynomial([1, 1]), Polynomial([1, 2])).get_poly(), [(1, 0)])
+        self.assertEqual(Polynomial.gcd(Polynomial([]), poly_2).get_poly(), poly_2.get_poly())
+        float_gcd = Polynomial.gcd(Polynomial([-1.5, 0, 1.5]), Polynomial([.5, 1, .5]))
+        self.assertEqual(len(float_gcd), 2)
+        self.assertAlmostEqual(float_gcd[0][0], 1)
+        self.assertAlmostEqual(float_gcd[1][0], 1)
+
+    def test_parallel_multiplication(self):
+        random.seed(10)
+        sparse_1 = Polynomial([(random.randint(-9, 9) or 1, i / 2) for i in range(60)])
+        sparse_2 = Polynomial([(random.randint(-9, 9) or 1, i / 3) for i in range(-20, 50)])
+        dense_1 = Polynomial([random.randint(-9, 9) or 1 for _ in range(300)])
+        dense_2 = Polynomial([random.randint(-9, 9) or 1 for _ in range(200)])
+        targets = [(sparse_1 * sparse_2).get_poly(), (dense_1 * dense_2).get_poly()]
+        for use_processes in (False, True):
+            Polynomial.configure_parallelism(workers=3, min_work=100, use_processes=use_processes)
+            try:
+                self.assertEqual((sparse_1 * sparse_2).get_poly(), targets[0])
+                self.assertEqual((dense_1 * dense_2).get_poly(), targets[1])
+            finally:
+                Polynomial.configure_parallelism()
+        self.assertRaises(ValueError, Polynomial.configure_parallelism, 0)
+
+    def test_parallel_map(self):
+        random.seed(11)
+        polys = [Polynomial.create_random_polynomial() for _ in range(25)]
+        Polynomial.configure_parallelism(workers=2, min_work=10, use_processes=True)
+        try:
+            derivatives = Polynomial.parallel_map(Polynomial.get_derivative, polys)
+            integrals = Polynomial.parallel_map(Polynomial.get_integral, polys, 3)
+            values = Polynomial.parallel_map(Polynomial.evaluate, polys, 1.5)
+        finally:
+            Polynomial.configure_parallelism()
+        self.assertEqual([poly.get_poly() for poly in derivatives],
+                         [Polynomial.get_derivative(poly).get_poly() for poly in polys])
+        self.assertEqual([poly.get_poly() for poly in integrals],
+                         [Polynomial.get_integral(poly, 3).get_poly() for poly in polys])
+        self.assertEqual(values, [poly(1.5) for poly in polys])
+
     def test_constant_multiplication(self):
         poly = Polynomial([(3, 0), (4, -1), (-2, 9), (6, -8)])
         result_target = "-4X^9 + 12X^-8 + 8X^-1 + 6"
         poly.constant_mul(2)
         self.assertEqual(str(poly), result_target)
 
+    def test_evaluate_scalar(self):
+        poly = Polynomial([(3, 4), (-2, 1), (5, 0)])
+        self.assertEqual(poly.evaluate(2), 49)
+        self.assertEqual(poly(2), 49)
+        self.assertEqual(Polynomial([(2, -2), (1, 1)])(2), 2.5)
+        self.assertAlmostEqual(self.poly_1(1.5), sum(i * 1.5 ** j for i, j in self.poly_1))
+
+    def test_evaluate_list(self):
+        poly = Polynomial([1, 0, 0, 1])
+        self.assertEqual(poly.evaluate([0, 1, 2]), [1, 2, 9])
+        points = [.5, 1.5, 2.5]
+        for value, x in zip(self.poly_2.evaluate(points), points):
+            self.assertAlmostEqual(value, sum(i * x ** j for i, j in self.poly_2))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_evaluate_numpy_array(self):
+        points = np.linspace(.5, 2, 50)
+        for poly in (self.poly_1, Polynomial([1, 2, 3])):
+            result = poly.evaluate(points)
+            self.assertIsInstance(result, np.ndarray)
+            for value, x in zip(result, points):
+                self.assertAlmostEqual(value, sum(i * x ** j for i, j in poly))
+
+    def test_evaluate_fractional_powers_below_zero(self):
+        poly = Polynomial([(1, .5), (2, 1)])
+        self.assertTrue(math.isnan(poly(-1)))
+        self.assertTrue(math.isnan(poly.evaluate([-1, 4])[0]))
+        self.assertEqual(poly.evaluate([-1, 4])[1], 10)
+        self.assertTrue(math.isnan(poly.compile()(-1.)))
+        self.assertTrue(all(math.isnan(value) for value in poly.compile(with_derivative=True)(-1)))
+        self.assertEqual(Polynomial([(1, 2.), (1, 1)])(-2), 2)
+        self.assertAlmostEqual(poly(-1 + 0j), 1j - 2)
+        if np is not None:
+            with np.errstate(invalid="ignore"):
+                self.assertTrue(np.isnan(poly.evaluate(np.array([-1.]))[0]))
+
+    def test_compact_polynomial_view(self):
+        terms = [(6.3, -13.2), (3, -11), (8, 6), (4, 9), (2, 5.6), (10, 1), (-7.5, 0)]
+        compact = CompactPolynomial(terms)
+        poly = Polynomial(terms)
+        self.assertEqual(compact.get_poly(), poly.get_poly())
+        self.assertEqual(list(compact), poly.get_poly())
+        self.assertEqual(compact[1], poly[1])
+        self.assertEqual(compact[-2:], poly[-2:])
+        self.assertEqual(len(compact), len(poly))
+        self.assertEqual(str(compact), str(poly))
+        self.assertEqual(compact, poly)
+
+    def test_compact_polynomial_operations(self):
+        compact = CompactPolynomial([(1, 2), (4, 8)])
+        other = CompactPolynomial([(3, 2), (3, -7)])
+        self.assertEqual((compact + other).get_poly(), [(3, -7), (4, 2), (4, 8)])
+        self.assertEqual((compact * other).get_poly(), [(3, -5), (12, 1), (3, 4), (12, 10)])
+        compact.derive()
+        self.assertEqual(compact.get_poly(), [(2, 1), (32, 7)])
+        self.assertEqual(compact._powers.typecode, "q")
+        self.assertRaises(AttributeError, setattr, compact, "extra", 1)
+
+    def test_evaluate_many(self):
+        random.seed(99)
+        poly = Polynomial([(random.randint(-9, 9) or 1, i) for i in range(80)])
+        points = random.sample(range(-500, 500), 70)
+        direct = [poly(x) for x in points]
+        self.assertEqual(poly.evaluate_many(points), direct)
+        self.assertEqual(poly.evaluate_many(points, use_tree=True), direct)
+        self.assertRaises(ValueError, self.poly_1.evaluate_many, [1, 2], True)
+        for value, x in zip(self.poly_1.evaluate_many([.5, 2.]), [.5, 2.]):
+            self.assertAlmostEqual(value, self.poly_1(x))
+
+    def test_evaluate_many_default_dispatch(self):
+        random.seed(98)
+        poly = Polynomial([(random.randint(1, 9), i) for i in range(80)])
+        points = random.sample(range(1000), 70)
+        with mock.patch.object(Polynomial, "_remainder_tree", wraps=Polynomial._remainder_tree) as tree:
+            poly.evaluate_many(points)
+            poly.to_domain(float).evaluate_many([float(x) for x in points])
+            self.assertEqual(tree.call_count, 0)
+            modular = poly.to_domain(10007)
+            values = modular.evaluate_many([mod_int.ModInt(x, 10007) for x in points])
+            self.assertEqual(tree.call_count, 1)
+        self.assertEqual(values, [modular(mod_int.ModInt(x, 10007)) for x in points])
+
+    def test_interpolate(self):
+        random.seed(100)
+        poly = Polynomial([(random.randint(-9, 9) or 1, i) for i in range(70)])
+        xs = random.sample(range(-300, 300), 70)
+        ys = poly.evaluate_many(xs)
+        self.assertEqual(Polynomial.interpolate(xs, ys).get_poly(), poly.get_poly())
+        self.assertEqual(Polynomial.interpolate(xs, ys, use_tree=True).get_poly(), poly.get_poly())
+        fractional = Polynomial.interpolate([0, 2], [0, 1])
+        self.assertEqual(fractional.get_poly(), [(Fraction(1, 2), 1)])
+        floats = Polynomial.interpolate([.5, 1.5, 2.5], [1., 2., 5.])
+        for x, y in zip([.5, 1.5, 2.5], [1., 2., 5.]):
+            self.assertAlmostEqual(floats(x), y)
+        self.assertRaises(ValueError, Polynomial.interpolate, [1, 1], [2, 3])
+        self.assertRaises(ValueError, Polynomial.interpolate, [1, 2], [2])
+
+    def assertRootsAlmostEqual(self, roots, target):
+        self.assertEqual(len(roots), len(target))
+        remaining = list(target)
+        for root in roots:
+            closest = min(remaining, key=lambda z: abs(z - root))
+            self.assertAlmostEqual(root, closest, places=6)
+            remaining.remove(closest)
+
+    def test_roots(self):
+        poly = Polynomial([(1, 2), (-2, 1), (5, 0)])
+        for root in (-3, -1, .5, 2, 4):
+            poly = poly * Polynomial([(1, 1), (-root, 0)])
+        target = [-3, -1, .5, 2, 4, 1 + 2j, 1 - 2j]
+        self.assertRootsAlmostEqual(poly.roots(), target)
+        with mock.patch.object(polynomial, "np", None):
+            self.assertRootsAlmostEqual(poly.roots(), target)
+
+    def test_roots_with_negative_and_zero_powers(self):
+        self.assertRootsAlmostEqual(Polynomial([(1, 1), (-4, -1)]).roots(), [-2, 2])
+        self.assertRootsAlmostEqual(Polynomial([(1, 4), (-1, 2)]).roots(), [-1, 0, 0, 1])
+        self.assertEqual(Polynomial([(3, 0)]).roots(), [])
+        self.assertRaises(ValueError, Polynomial([]).roots)
+        self.assertRaises(ValueError, self.poly_1.roots)
+
+    def test_roots_many(self):
+        random.seed(8)
+        polys = [Polynomial([random.randint(-9, 9) or 1 for _ in range(6)]) for _ in range(20)]
+        polys.append(Polynomial([(1, 2), (-1, 3)]))
+        batch = Polynomial.roots_many(polys)
+        for roots, poly in zip(batch, polys):
+            self.assertRootsAlmostEqual(roots, poly.roots())
+            for root in roots:
+                self.assertAlmostEqual(abs(poly(root)), 0, places=5)
+        with mock.patch.object(polynomial, "np", None):
+            self.assertRootsAlmostEqual(Polynomial.roots_many(polys)[0], batch[0])
+
     def test_get_degree(self):
         self.assertEqual(self.poly_1.get_degree(), -13.2)
 
@@ -143,10 +414,247 @@ class TestPolynomial(unittest.TestCase):
         index = Polynomial.next_highest_index_bin_search([(1, -3), (-2, 1), (4, 2), (-6, 5)], 0)
         self.assertEqual(index, 1)
 
+    def test_next_highest_index_bin_search_edges(self):
+        self.assertEqual(Polynomial.next_highest_index_bin_search([(2, 1)], 0), 0)
+        self.assertEqual(Polynomial.next_highest_index_bin_search([(2, -3)], 0), 1)
+        self.assertEqual(Polynomial.next_highest_index_bin_search([], 0), 0)
+        self.assertEqual(Polynomial.get_integral(Polynomial([(2, 1)]), 3).get_poly(), [(3, 0), (1.0, 2)])
+
     def test_polynomial_string_representation(self):
         poly = Polynomial([(1, -3), (-2, 1), (4, 2), (-6, 5), (3, 0), (-1, 1)])
         self.assertEqual(str(poly), "-6X^5 + X^-3 + 4X^2 - 3X + 3")
 
+    def test_polynomial_string_edge_terms(self):
+        self.assertEqual(str(Polynomial([(5, 0)])), "5")
+        self.assertEqual(str(Polynomial([(-2, 1), (1, 0)])), "-2X + 1")
+        self.assertEqual(str(Polynomial([(-1, 1), (3, 2)])), "3X^2 - X")
+        self.assertEqual(str(Polynomial([(-1, 1)])), "-X")
+
+    def test_polynomial_string_cache_and_streaming(self):
+        poly = Polynomial([(2, 3), (5, -2), (.5, 1), (7, 0)])
+        self.assertIs(str(poly), str(poly))
+        self.assertEqual("".join(poly.iter_str()), str(poly))
+        poly.derive()
+        self.assertEqual(str(poly), "-10X^-3 + 6X^2 + 0.5")
+        output = io.StringIO()
+        big = CompactPolynomial([(i % 7 - 3, i) for i in range(1000)])
+        big.write_to(output, terms_per_write=64)
+        self.assertEqual(output.getvalue(), str(Polynomial(big.get_poly())))
+
+    def test_parse_round_trip(self):
+        random.seed(13)
+        for _ in range(200):
+            poly = Polynomial.create_random_polynomial()
+            self.assertEqual(str(Polynomial.parse(str(poly))), str(poly))
+        poly = Polynomial([(Fraction(1, 3), 0), (-2.5, 1), (1, -3), (4, 5.6)])
+        self.assertEqual(str(Polynomial.parse(str(poly))), str(poly))
+        self.assertEqual(Polynomial.parse("-X^28/5 + 2X^-1").get_poly(), [(2, -1), (-1, 5.6)])
+        exact = Polynomial([(Fraction(1, 101), 1), (Fraction(-7, 1000), 0)])
+        self.assertEqual(str(exact), "1/101X - 7/1000")
+        self.assertEqual(Polynomial.parse(str(exact)), exact)
+
+    def test_parse_unordered_and_invalid(self):
+        self.assertEqual(Polynomial.parse("3X + 2X^2 + 1 - 3X").get_poly(), [(1, 0), (2, 2)])
+        self.assertEqual(Polynomial.parse("0").get_poly(), [(0, 0)])
+        self.assertIsInstance(CompactPolynomial.parse("X"), CompactPolynomial)
+        for text in ["", "2X 3", "X^", "2Y", "3X + "]:
+            self.assertRaises(ValueError, Polynomial.parse, text)
+
+    def test_create_large_random_polynomial(self):
+        dense = Polynomial.create_large_random_polynomial(5000, seed=16)
+        self.assertEqual([j for _, j in dense.get_poly()], list(range(5000)))
+        sparse = Polynomial.create_large_random_polynomial(5000, density=.001, float_coefficients=True, seed=16)
+        powers = [j for _, j in sparse.get_poly()]
+        self.assertEqual(len(set(powers)), 5000)
+        self.assertEqual(powers, sorted(powers))
+        self.assertTrue(all(type(i) is float and i != 0 for i, _ in sparse.get_poly()))
+        self.assertEqual(sparse.get_poly(), Polynomial(sparse.get_poly()).get_poly())
+        self.assertEqual(dense.get_poly(), Polynomial.create_large_random_polynomial(5000, seed=16).get_poly())
+        self.assertRaises(ValueError, Polynomial.create_large_random_polynomial, 10, 0)
+
+    def test_sum(self):
+        random.seed(19)
+        polys = [Polynomial.create_random_polynomial() for _ in range(30)] + [Polynomial([(2, -1.5), (0, 0)])]
+        target = polys[0]
+        for poly in polys[1:]:
+            target = target + poly
+        self.assertEqual(Polynomial.sum(polys).get_poly(), target.get_poly())
+        self.assertEqual(Polynomial.sum_stream(iter(polys)).get_poly(), target.get_poly())
+        self.assertEqual(Polynomial.sum([]).get_poly(), [(0, 0)])
+        self.assertEqual(Polynomial.sum_stream([]).get_poly(), [(0, 0)])
+        poly = Polynomial([1, 2, 3])
+        negative = Polynomial([-1, -2, -3])
+        self.assertEqual(Polynomial.sum([poly, negative, CompactPolynomial([0, 1])]).get_poly(), [(1, 1)])
+        self.assertEqual(Polynomial.sum_stream([poly, negative]).get_poly(), [(0, 0)])
+        self.assertIsInstance(CompactPolynomial.sum([poly]), CompactPolynomial)
+        self.assertRaises(TypeError, Polynomial.sum, [poly, [1, 2]])
+        self.assertRaises(TypeError, Polynomial.sum_stream, [poly, [1, 2]])
+
+    @staticmethod
+    def horner_compose(poly, other):
+        vector = Polynomial._to_dense_vector(poly.get_poly(), 0)
+        result = Polynomial([vector[-1]])
+        for coeff in reversed(vector[:-1]):
+            result = result * other + Polynomial([coeff])
+        return result
+
+    def test_power(self):
+        random.seed(20)
+        for exponent in range(6):
+            poly = Polynomial.create_random_polynomial()
+            target = Polynomial([1])
+            for _ in range(exponent):
+                target = target * poly
+            self.assertEqual((poly ** exponent).get_poly(), target.get_poly())
+        self.assertEqual((Polynomial([(2, .5)]) ** 4).get_poly(), [(16, 2)])
+        self.assertEqual((Polynomial([(2, -1), (1, 1)]) ** 2).get_poly(), [(4, -2), (4, 0), (1, 2)])
+        self.assertRaises(ValueError, Polynomial([1, 1]).__pow__, -1)
+
+    def test_compose(self):
+        random.seed(20)
+        for _ in range(20):
+            poly = Polynomial.create_random_polynomial()
+            other = Polynomial.create_random_polynomial()
+            self.assertEqual(poly.compose(other).get_poly(), self.horner_compose(poly, other).get_poly())
+        self.assertEqual(Polynomial([5]).compose(Polynomial([1, 1])).get_poly(), [(5, 0)])
+        self.assertEqual(Polynomial([1, 1]).compose(Polynomial([(0, 0)])).get_poly(), [(1, 0)])
+        self.assertRaises(ValueError, Polynomial([(1, -1)]).compose, Polynomial([1, 1]))
+
+    def test_shift(self):
+        random.seed(20)
+        for _ in range(20):
+            poly = Polynomial.create_random_polynomial()
+            shift = random.randint(-5, 5)
+            self.assertEqual(poly.shift(shift).get_poly(),
+                             self.horner_compose(poly, Polynomial([shift, 1])).get_poly())
+            shift = Fraction(random.randint(-5, 5), random.randint(1, 5))
+            self.assertEqual(poly.shift(shift).get_poly(),
+                             self.horner_compose(poly.to_domain(Fraction), Polynomial([shift, 1])).get_poly())
+            floats = poly.to_domain(float)
+            for (i, j), (m, n) in zip(floats.shift(1.5).get_poly(),
+                                      self.horner_compose(floats, Polynomial([1.5, 1])).get_poly()):
+                self.assertAlmostEqual(i / m, 1)
+                self.assertEqual(j, n)
+        modular = Polynomial([1, 2, 3]).to_domain(7)
+        self.assertEqual(modular.shift(2).get_poly(), [(3, 0), (3, 2)])
+
+    def test_coefficient_domains(self):
+        poly = Polynomial([(.5, 3), (2, 1), (-3, 0)])
+        exact = poly.to_domain(Fraction)
+        self.assertEqual(Polynomial.get_derivative(Polynomial.get_integral(exact, 0)), exact)
+        self.assertEqual(Polynomial([(4.0, 2)]).to_domain(int).get_poly(), [(4, 2)])
+        self.assertRaises(ValueError, poly.to_domain, int)
+        self.assertRaises(ValueError, poly.to_domain, 9)
+        modular = poly.to_domain(101)
+        self.assertEqual(str(modular), "51X^3 + 2X + 98")
+        self.assertEqual((modular * modular).get_poly(), (exact * exact).to_domain(101).get_poly())
+        self.assertEqual(modular.to_domain(int).get_poly(), [(98, 0), (2, 1), (51, 3)])
+
+    def test_modular_dense_multiplication_and_reconstruction(self):
+        random.seed(15)
+        poly_1 = Polynomial([random.randint(-10 ** 12, 10 ** 12) for _ in range(300)])
+        poly_2 = Polynomial([random.randint(-10 ** 12, 10 ** 12) for _ in range(200)])
+        product = poly_1 * poly_2
+        primes = mod_int.ModInt.primes_for_bound(300 * 10 ** 24)
+        residues = [poly_1.to_domain(p) * poly_2.to_domain(p) for p in primes]
+        self.assertEqual(residues[0].get_poly(), product.to_domain(primes[0]).get_poly())
+        self.assertEqual(Polynomial.from_residues(residues).get_poly(), product.get_poly())
+        self.assertRaises(ValueError, Polynomial.from_residues, [product])
+
+    def test_modular_gcd_and_division(self):
+        poly_1 = Polynomial([-1, 0, 1]).to_domain(7)
+        poly_2 = Polynomial([1, 2, 1]).to_domain(7)
+        self.assertEqual(Polynomial.gcd(poly_1, poly_2).get_poly(), [(1, 0), (1, 1)])
+        quotient, remainder = divmod(poly_1 * poly_2 + poly_1, poly_2)
+        self.assertEqual((quotient * poly_2 + remainder).get_poly(), (poly_1 * poly_2 + poly_1).get_poly())
+
+    def test_binary_round_trip(self):
+        random.seed(14)
+        for _ in range(20):
+            poly = Polynomial.create_random_polynomial()
+            loaded = CompactPolynomial.from_bytes(b"padding!" + poly.to_bytes(), 8)
+            self.assertEqual(loaded.get_poly(), poly.get_poly())
+            self.assertEqual(loaded.to_bytes(), poly.to_bytes())
+        self.assertRaises(ValueError, CompactPolynomial.from_bytes, bytes(16))
+
+    def test_parse_many(self):
+        lines = io.StringIO("2X + 1\n\n-X^-2 + 1/2X\n")
+        self.assertEqual([poly.get_poly() for poly in Polynomial.parse_many(lines)],
+                         [[(1, 0), (2, 1)], [(-1, -2), (0.5, 1)]])
+
+    def test_compile(self):
+        random.seed(21)
+        polys = [test_polynomial_1, test_polynomial_2, Polynomial([0]), Polynomial([(3, 300), (-2, 7), (1, -3)]),
+                 Polynomial([random.randint(-9, 9) for _ in range(50)]), Polynomial([(Fraction(1, 3), 2), (1, 0)])]
+        for poly in polys:
+            derivative = Polynomial.get_derivative(poly)
+            for x in (1.01, .5, 2.):
+                value, slope = poly.compile(with_derivative=True)(x)
+                for result, target in ((poly.compile()(x), poly.evaluate(x)), (value, poly.evaluate(x)),
+                                       (slope, derivative.evaluate(x))):
+                    self.assertAlmostEqual(result, target, delta=1e-9 * abs(target))
+        dense = polys[4]
+        self.assertEqual(dense.compile(with_derivative=True)(Fraction(3, 2)),
+                         (dense.evaluate(Fraction(3, 2)), Polynomial.get_derivative(dense).evaluate(Fraction(3, 2))))
+        self.assertEqual(Polynomial([(3, 300), (-2, 7)]).compile()(3), 3 ** 301 - 2 * 3 ** 7)
+        self.assertEqual(Polynomial([1, 2, 3]).to_domain(7).compile()(5), 2)
+
+    def test_compile_cache(self):
+        poly = Polynomial([1, 2, 3])
+        self.assertIs(poly.compile(), poly.compile())
+        poly.derive()
+        self.assertEqual(poly.compile()(2), 14)
+        copy = pickle.loads(pickle.dumps(poly))
+        self.assertEqual(copy.compile()(2), 14)
+
+    def test_term_updates(self):
+        random.seed(23)
+        poly = Polynomial([(3, -2), (1, 0), (4, 7)])
+        expected = {-2: 3, 0: 1, 7: 4}
+        for step in range(2000):
+            power, coeff = random.randint(-20, 20), random.choice([0, random.randint(-3, 3), random.random()])
+            if step % 2:
+                poly.set_term(power, coeff)
+                expected[power] = coeff
+            else:
+                poly.add_term(power, coeff)
+                expected[power] = expected.get(power, 0) + coeff
+            expected = {j: i for j, i in expected.items() if i != 0}
+            self.assertEqual(poly.coeff(power), expected.get(power, 0))
+            if step % 100 == 0:
+                terms = sorted(((i, j) for j, i in expected.items()), key=lambda term: term[1])
+                self.assertEqual(poly.get_poly(), terms or [(0, 0)])
+                self.assertEqual(str(poly), str(Polynomial.from_sorted_terms(poly.get_poly())))
+                self.assertEqual(poly.get_degree(), Polynomial.from_sorted_terms(poly.get_poly()).get_degree())
+
+    def test_copies_do_not_share_term_updates(self):
+        poly = Polynomial([1, 2])
+        poly.set_term(3, 4)
+        for copy_function in (copy.copy, copy.deepcopy, lambda p: pickle.loads(pickle.dumps(p))):
+            duplicate = copy_function(poly)
+            duplicate.set_term(7, 1)
+            self.assertEqual((poly.coeff(7), str(poly)), (0, "4X^3 + 2X + 1"))
+            self.assertEqual((duplicate.coeff(7), str(duplicate)), (1, "X^7 + 4X^3 + 2X + 1"))
+            poly.add_term(0, 1)
+            self.assertEqual(duplicate.coeff(0), 1)
+            poly.add_term(0, -1)
+
+    def test_term_updates_invalidate_caches(self):
+        poly = Polynomial([1, 2])
+        self.assertEqual((str(poly), poly.get_degree(), poly.compile()(2)), ("2X + 1", 1, 5))
+        poly.set_term(-3, 8)
+        self.assertEqual((str(poly), poly.get_degree(), poly.compile()(2)), ("8X^-3 + 2X + 1", -3, 6))
+        poly.set_term(-3, 0)
+        poly.add_term(1, -2)
+        self.assertEqual((poly.get_poly(), poly.get_degree()), ([(1, 0)], 0))
+        poly.set_term(0, 0)
+        self.assertEqual(poly.get_poly(), [(0, 0)])
+        self.assertEqual(Polynomial([(1, 2)]).coeff(2), 1)
+        self.assertRaises(TypeError, poly.set_term, "2", 1)
+        compact = CompactPolynomial([1, 2])
+        compact.add_term(3, 5)
+        self.assertEqual((compact.get_poly(), len(compact)), ([(1, 0), (2, 1), (5, 3)], 3))
+
 
 if __name__ == "__main__":
     unittest.main()
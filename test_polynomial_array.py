@@ -0,0 +1,84 @@
+import unittest
+import random
+from polynomial import Polynomial, np
+
+if np is not None:
+    from polynomial_array import PolynomialArray
+
+
+def random_polynomials(count, seed):
+    random.seed(seed)
+    return [Polynomial.create_random_polynomial() for _ in range(count)]
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestPolynomialArray(unittest.TestCase):
+
+    def setUp(self):
+        self.polys_1 = random_polynomials(30, 11) + [Polynomial([(3, -2), (1.5, .5)])]
+        self.polys_2 = random_polynomials(30, 12) + [Polynomial([(2, 1)])]
+        self.batch_1 = PolynomialArray.from_polynomials(self.polys_1)
+        self.batch_2 = PolynomialArray.from_polynomials(self.polys_2)
+
+    def assertPolynomialsEqual(self, result, target):
+        self.assertEqual(len(result), len(target))
+        for poly_1, poly_2 in zip(result, target):
+            self.assertEqual(poly_1.get_poly(), poly_2.get_poly())
+
+    def test_round_trip(self):
+        self.assertPolynomialsEqual(self.batch_1.to_polynomials(), self.polys_1)
+        self.assertEqual(len(self.batch_1), 31)
+        self.assertEqual(self.batch_1[30].get_poly(), self.polys_1[30].get_poly())
+        self.assertEqual(self.batch_1[-1].get_poly(), self.polys_1[-1].get_poly())
+        self.assertEqual(self.batch_1[-31].get_poly(), self.polys_1[0].get_poly())
+
+    def test_add_subtract(self):
+        self.assertPolynomialsEqual((self.batch_1 + self.batch_2).to_polynomials(),
+                                    [i + j for i, j in zip(self.polys_1, self.polys_2)])
+        self.assertPolynomialsEqual((self.batch_1 - self.batch_2).to_polynomials(),
+                                    [i - j for i, j in zip(self.polys_1, self.polys_2)])
+
+    def test_multiply(self):
+        self.assertPolynomialsEqual((self.batch_1 * self.batch_2).to_polynomials(),
+                                    [i * j for i, j in zip(self.polys_1, self.polys_2)])
+
+    def test_multiply_many_powers(self):
+        random.seed(13)
+        integer_polys = [Polynomial([(random.randint(-9, 9) or 1, j) for j in random.sample(range(-50, 700), 300)])
+                         for _ in range(3)]
+        float_polys = [Polynomial([(random.randint(-9, 9) or 1, j / 7) for j in random.sample(range(2000), 300)])
+                       for _ in range(3)]
+        for polys in (integer_polys, float_polys):
+            batch = PolynomialArray.from_polynomials(polys)
+            product = batch * batch[::-1]
+            for result, target in zip(product.to_polynomials(), [i * j for i, j in zip(polys, polys[::-1])]):
+                self.assertEqual(len(result.get_poly()), len(target.get_poly()))
+                for (i_1, j_1), (i_2, j_2) in zip(result.get_poly(), target.get_poly()):
+                    self.assertAlmostEqual(i_1, i_2)
+                    self.assertAlmostEqual(j_1, j_2)
+
+    def test_derive_integrate(self):
+        self.batch_1.derive()
+        self.assertPolynomialsEqual(self.batch_1.to_polynomials(),
+                                    [Polynomial.get_derivative(poly) for poly in self.polys_1])
+        self.batch_2.integrate(2)
+        self.assertPolynomialsEqual(self.batch_2.to_polynomials(),
+                                    [Polynomial.get_integral(poly, 2) for poly in self.polys_2])
+        self.assertRaises(ValueError, PolynomialArray([[1]], [-1]).integrate, 0)
+
+    def test_evaluate(self):
+        points = [.5, 1.25, 2]
+        values = self.batch_1.evaluate(points)
+        self.assertEqual(values.shape, (31, 3))
+        for row, poly in zip(values, self.polys_1):
+            for value, target in zip(row, poly.evaluate(points)):
+                self.assertAlmostEqual(value, target)
+        self.assertEqual(self.batch_1(1.5).shape, (31,))
+
+    def test_mismatched_lengths(self):
+        self.assertRaises(ValueError, self.batch_1.__add__, self.batch_2[:3])
+        self.assertRaises(ValueError, PolynomialArray, [[1, 2]], [0, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
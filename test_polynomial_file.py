@@ -0,0 +1,43 @@
+import os
+import random
+import tempfile
+import unittest
+from polynomial import CompactPolynomial, Polynomial
+from polynomial_file import PolynomialFile
+
+
+class TestPolynomialFile(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(14)
+        self.polys = [Polynomial.create_random_polynomial() for _ in range(50)]
+        self.polys += [Polynomial([(0, 0)]), Polynomial([(2, -3), (1.5, .5)])]
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "polys.bin")
+
+    def test_round_trip(self):
+        self.assertEqual(PolynomialFile.write(self.path, iter(self.polys)), len(self.polys))
+        with PolynomialFile(self.path) as polys:
+            self.assertEqual(len(polys), len(self.polys))
+            for poly, target in zip(polys, self.polys):
+                self.assertIsInstance(poly, CompactPolynomial)
+                self.assertEqual(poly.get_poly(), target.get_poly())
+                self.assertEqual(str(poly), str(target))
+            self.assertEqual([poly.get_poly() for poly in polys[-2:]], [[(0, 0)], [(2, -3), (1.5, .5)]])
+
+    def test_polynomials_outlive_file(self):
+        PolynomialFile.write(self.path, self.polys)
+        polys = PolynomialFile(self.path)
+        poly = polys[3]
+        polys.close()
+        self.assertEqual((poly * poly).get_poly(), (self.polys[3] * self.polys[3]).get_poly())
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a polynomial file at all, just some bytes")
+        self.assertRaises(ValueError, PolynomialFile, self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import asyncio
+import json
+import unittest
+
+from polynomial import Polynomial
+from polynomial_server import PolynomialClient, PolynomialServer
+
+
+class TestPolynomialServer(unittest.IsolatedAsyncioTestCase):
+
+    async def test_operations_in_both_formats(self):
+        poly = Polynomial([(2, 3), (5, -2), (1, 1)])
+        terms = [list(term) for term in poly.get_poly()]
+        async with PolynomialServer() as server, PolynomialClient(*server.address) as client:
+            self.assertEqual(await client.request("mul", str(poly), "X + 1"), str(poly * Polynomial([1, 1])))
+            self.assertEqual(await client.request("add", terms, terms), [[10, -2], [2, 1], [4, 3]])
+            self.assertEqual(await client.request("derive", str(poly)), str(Polynomial.get_derivative(poly)))
+            self.assertEqual(await client.request("integrate", terms, 3),
+                             [list(term) for term in Polynomial.get_integral(poly, 3).get_poly()])
+            self.assertEqual(await client.request("evaluate", str(poly), 2), poly.evaluate(2))
+
+    async def test_errors(self):
+        async with PolynomialServer() as server, PolynomialClient(*server.address) as client:
+            with self.assertRaisesRegex(ValueError, "Unknown operation"):
+                await client.request("pow", "X", 2)
+            with self.assertRaisesRegex(ValueError, "Cannot parse"):
+                await client.request("derive", "2X +* 1")
+            with self.assertRaises(ValueError):
+                await client.request("evaluate", "X", "one")
+            self.assertEqual(await client.request("derive", "X^2"), "2X")
+            reader, writer = await asyncio.open_connection(*server.address)
+            writer.write(b"not json\n")
+            self.assertIn("error", json.loads(await reader.readline()))
+            writer.close()
+            self.assertEqual(server.metrics()["errors"], 4)
+
+    async def test_non_finite_results(self):
+        async with PolynomialServer() as server, PolynomialClient(*server.address) as client:
+            with self.assertRaisesRegex(ValueError, "not finite"):
+                await client.request("mul", [[1e308, 1]], [[1e308, 1]])
+            with self.assertRaisesRegex(ValueError, "not finite"):
+                await client.request("evaluate", [[1e308, 1]], 10)
+            self.assertEqual(await client.request("evaluate", "X^2", 3), 9)
+            self.assertEqual(server.metrics()["errors"], 2)
+
+    async def test_concurrent_requests_are_batched(self):
+        poly = Polynomial.create_large_random_polynomial(50, seed=22)
+        points = [i / 100 for i in range(200)]
+        async with PolynomialServer(batch_window=.01) as server, PolynomialClient(*server.address) as client:
+            values = await asyncio.gather(*[client.request("evaluate", str(poly), x) for x in points])
+            metrics = await client.request("metrics")
+        for value, x in zip(values, points):
+            self.assertAlmostEqual(value, Polynomial.parse(str(poly)).evaluate(x))
+        self.assertEqual(metrics["requests"], 200)
+        self.assertLess(metrics["batches"], 20)
+        self.assertGreater(metrics["throughput"], 0)
+        self.assertGreaterEqual(metrics["p99_latency"], metrics["p50_latency"])
+
+    async def test_heavy_batches_are_offloaded(self):
+        polys = [Polynomial.create_large_random_polynomial(100, seed=seed) for seed in range(8)]
+        async with PolynomialServer(workers=2, offload_min_terms=100) as server, \
+                PolynomialClient(*server.address) as client:
+            products = await asyncio.gather(*[client.request("mul", str(poly), str(poly)) for poly in polys])
+            self.assertEqual(products, [str(poly * poly) for poly in polys])
+            self.assertGreaterEqual(server.metrics()["offloaded_batches"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()